@@ -27,7 +27,7 @@ from pyreason.scripts.query.query import Query
 import pyreason.scripts.numba_wrapper.numba_types.fact_node_type as fact_node
 import pyreason.scripts.numba_wrapper.numba_types.fact_edge_type as fact_edge
 import pyreason.scripts.numba_wrapper.numba_types.interval_type as interval
-from pyreason.scripts.interpretation.interpretation_parallel import Interpretation
+from pyreason.scripts.interpretation.interpretation import Interpretation
 from pyreason.scripts.utils.reorder_clauses import reorder_clauses
 if importlib.util.find_spec("torch") is not None:
     from pyreason.scripts.learning.classification.classifier import LogicIntegratedClassifier
@@ -57,6 +57,11 @@ class _Settings:
         self.__static_graph_facts = None
         self.__store_interpretation_changes = None
         self.__parallel_computing = None
+        self.__semi_naive = None
+        self.__grounding_cache_size = None
+        self.__grounding_partitions = None
+        self.__deterministic_parallel = None
+        self.__parallel_apply = None
         self.__update_mode = None
         self.__allow_ground_rules = None
         self.__fp_version = None
@@ -78,6 +83,11 @@ class _Settings:
         self.__static_graph_facts = True
         self.__store_interpretation_changes = True
         self.__parallel_computing = False
+        self.__semi_naive = False
+        self.__grounding_cache_size = 0
+        self.__grounding_partitions = 1
+        self.__deterministic_parallel = False
+        self.__parallel_apply = False
         self.__update_mode = 'intersection'
         self.__allow_ground_rules = False
         self.__fp_version = False
@@ -208,6 +218,54 @@ class _Settings:
         """
         return self.__parallel_computing
 
+    @property
+    def semi_naive(self) -> bool:
+        """Returns whether to use semi-naive evaluation. After the first fixed point operation of a timestep, only rules
+        whose body predicates changed in the previous operation are grounded again. Default is False
+
+        :return: bool
+        """
+        return self.__semi_naive
+
+    @property
+    def grounding_cache_size(self) -> int:
+        """Returns the maximum number of rule groundings kept in the grounding cache. The groundings of a rule are reused
+        while none of its body predicates and the graph have changed. 0 disables the cache. Default is 0
+
+        :return: int
+        """
+        return self.__grounding_cache_size
+
+    @property
+    def grounding_partitions(self) -> int:
+        """Returns the number of partitions the grounding of a rule is split into. Each partition grounds the rule for a part
+        of the candidates of its head variable, and partitions are grounded in parallel when parallel_computing is on.
+        1 does not split rules. Default is 1
+
+        :return: int
+        """
+        return self.__grounding_partitions
+
+    @property
+    def deterministic_parallel(self) -> bool:
+        """Returns whether parallel reasoning is deterministic. Rules that can add nodes or edges to the graph while they
+        are grounded are then grounded on their own and in order, so that traces do not depend on the number of threads.
+        Default is False
+
+        :return: bool
+        """
+        return self.__deterministic_parallel
+
+    @property
+    def parallel_apply(self) -> bool:
+        """Returns whether the rules due at a fixed point operation are applied in parallel. Rules are grouped by the
+        component they update and groups are applied in parallel when parallel_computing is on. The rule trace keeps
+        the order of the rules. Not used when atom_trace is on. Default is False
+
+        :return: bool
+        """
+        return self.__parallel_apply
+
     @property
     def update_mode(self) -> str:
         """Returns the way interpretations are going to be updated. This could be "intersection" or "override"
@@ -418,6 +476,82 @@ class _Settings:
         else:
             self.__parallel_computing = value
 
+    @semi_naive.setter
+    def semi_naive(self, value: bool) -> None:
+        """Whether to use semi-naive evaluation. After the first fixed point operation of a timestep, only rules
+        whose body predicates changed in the previous operation are grounded again. Default is False
+
+        :param value: Whether to skip grounding rules whose body predicates have not changed
+        :raises TypeError: If not bool raise error
+        """
+        if not isinstance(value, bool):
+            raise TypeError('value has to be a bool')
+        else:
+            self.__semi_naive = value
+
+    @grounding_cache_size.setter
+    def grounding_cache_size(self, value: int) -> None:
+        """The maximum number of rule groundings kept in the grounding cache. The groundings of a rule are reused
+        while none of its body predicates and the graph have changed. The least recently used rules are evicted first.
+        0 disables the cache. Default is 0
+
+        :param value: Maximum number of cached groundings
+        :raises TypeError: If not int raise error
+        :raises ValueError: If negative raise error
+        """
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError('value has to be an int')
+        elif value < 0:
+            raise ValueError('value has to be non-negative')
+        else:
+            self.__grounding_cache_size = value
+
+    @grounding_partitions.setter
+    def grounding_partitions(self, value: int) -> None:
+        """The number of partitions the grounding of a rule is split into. Each partition grounds the rule for a part
+        of the candidates of its head variable, and partitions are grounded in parallel when parallel_computing is on.
+        Only rules with default thresholds and without annotation functions are split, and not when atom_trace or
+        allow_ground_rules is on. 1 does not split rules. Default is 1
+
+        :param value: Number of partitions per rule
+        :raises TypeError: If not int raise error
+        :raises ValueError: If not positive raise error
+        """
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise TypeError('value has to be an int')
+        elif value < 1:
+            raise ValueError('value has to be positive')
+        else:
+            self.__grounding_partitions = value
+
+    @deterministic_parallel.setter
+    def deterministic_parallel(self, value: bool) -> None:
+        """Whether parallel reasoning is deterministic. Rules that can add nodes or edges to the graph while they
+        are grounded are then grounded on their own and in order, so that traces do not depend on the number of threads.
+        Default is False
+
+        :param value: Whether to make parallel reasoning deterministic
+        :raises TypeError: If not bool raise error
+        """
+        if not isinstance(value, bool):
+            raise TypeError('value has to be a bool')
+        else:
+            self.__deterministic_parallel = value
+
+    @parallel_apply.setter
+    def parallel_apply(self, value: bool) -> None:
+        """Whether the rules due at a fixed point operation are applied in parallel. Rules are grouped by the
+        component they update and groups are applied in parallel when parallel_computing is on. The rule trace keeps
+        the order of the rules. Not used when atom_trace is on. Default is False
+
+        :param value: Whether to apply rules in parallel
+        :raises TypeError: If not bool raise error
+        """
+        if not isinstance(value, bool):
+            raise TypeError('value has to be a bool')
+        else:
+            self.__parallel_apply = value
+
     @update_mode.setter
     def update_mode(self, value: str) -> None:
         """The way interpretations are going to be updated. This could be "intersection" or "override". Default is
@@ -1551,14 +1685,14 @@ def _reason(timesteps, convergence_threshold, convergence_bound_threshold, queri
             __rules.append(r)
 
     # Setup logical program
-    __program = Program(__graph, all_node_facts, all_edge_facts, __rules, __ipl, annotation_functions, head_functions, settings.reverse_digraph, settings.atom_trace, settings.save_graph_attributes_to_trace, settings.persistent, settings.inconsistency_check, settings.store_interpretation_changes, settings.parallel_computing, settings.update_mode, settings.allow_ground_rules, settings.fp_version)
+    __program = Program(__graph, all_node_facts, all_edge_facts, __rules, __ipl, annotation_functions, head_functions, settings.reverse_digraph, settings.atom_trace, settings.save_graph_attributes_to_trace, settings.persistent, settings.inconsistency_check, settings.store_interpretation_changes, settings.parallel_computing, settings.update_mode, settings.allow_ground_rules, settings.fp_version, settings.semi_naive, settings.grounding_cache_size, settings.grounding_partitions, settings.deterministic_parallel, settings.parallel_apply)
     __program.specific_node_labels = __specific_node_labels
     __program.specific_edge_labels = __specific_edge_labels
 
-    # Convert closed_world predicates to numba-compatible list of label types
-    closed_world_preds_numba = numba.typed.List.empty_list(label.label_type)
+    # Convert closed_world predicates to a numba-compatible set of label types
+    closed_world_preds_numba = numba.typed.Dict.empty(key_type=label.label_type, value_type=numba.types.boolean)
     for pred_name in __closed_world_predicates:
-        closed_world_preds_numba.append(label.Label(pred_name))
+        closed_world_preds_numba[label.Label(pred_name)] = True
     __program.closed_world_predicates = closed_world_preds_numba
 
     # Run Program and get final interpretation
@@ -30,8 +30,13 @@ class World:
 
     def update(self, label, interval):
         current_bnd = self._world[label]
-        new_bnd = current_bnd.intersection(interval)
-        self._world[label] = new_bnd
+        lower = max(current_bnd.lower, interval.lower)
+        upper = min(current_bnd.upper, interval.upper)
+        if lower > upper:
+            lower = 0.0
+            upper = 1.0
+        current_bnd.set_lower_upper(lower, upper)
+        current_bnd.set_static(False)
 
     def get_bound(self, label):
         result = None
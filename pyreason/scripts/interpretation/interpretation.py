@@ -1,3 +1,4 @@
+import types
 from typing import Union, Tuple
 
 import pyreason.scripts.numba_wrapper.numba_types.world_type as world
@@ -6,6 +7,7 @@ import pyreason.scripts.numba_wrapper.numba_types.interval_type as interval
 from pyreason.scripts.interpretation.interpretation_dict import InterpretationDict
 
 import numba
+import numpy as np
 from numba import objmode, prange
 
 
@@ -17,6 +19,9 @@ edge_type = numba.types.UniTuple(numba.types.string, 2)
 list_of_nodes = numba.types.ListType(node_type)
 list_of_edges = numba.types.ListType(edge_type)
 
+# Type for storing rule indices
+list_of_ints = numba.types.ListType(numba.types.int64)
+
 # Type for storing clause data
 clause_data = numba.types.Tuple((numba.types.string, label.label_type, numba.types.ListType(numba.types.string)))
 
@@ -24,8 +29,9 @@ clause_data = numba.types.Tuple((numba.types.string, label.label_type, numba.typ
 refine_data = numba.types.Tuple((numba.types.string, numba.types.string, numba.types.int8))
 
 # Type for facts to be applied
-facts_to_be_applied_node_type = numba.types.Tuple((numba.types.uint16, node_type, label.label_type, interval.interval_type, numba.types.boolean, numba.types.boolean))
-facts_to_be_applied_edge_type = numba.types.Tuple((numba.types.uint16, edge_type, label.label_type, interval.interval_type, numba.types.boolean, numba.types.boolean))
+# start time, component, label, bound, static, graph attribute, end time
+facts_to_be_applied_node_type = numba.types.Tuple((numba.types.uint16, node_type, label.label_type, interval.interval_type, numba.types.boolean, numba.types.boolean, numba.types.uint16))
+facts_to_be_applied_edge_type = numba.types.Tuple((numba.types.uint16, edge_type, label.label_type, interval.interval_type, numba.types.boolean, numba.types.boolean, numba.types.uint16))
 
 # Type for returning list of applicable rules for a certain rule
 # node/edge, annotations, qualified nodes, qualified edges, edges to be added
@@ -50,13 +56,22 @@ rules_to_be_applied_edge_type = numba.types.Tuple((numba.types.uint16, edge_type
 rules_to_be_applied_trace_type = numba.types.Tuple((numba.types.ListType(numba.types.ListType(node_type)), numba.types.ListType(numba.types.ListType(edge_type)), numba.types.string))
 edges_to_be_added_type = numba.types.Tuple((numba.types.ListType(node_type), numba.types.ListType(node_type), label.label_type))
 
+# Types for the entries of the rule trace
+rule_trace_node_type = numba.types.Tuple((numba.types.uint16, numba.types.uint16, node_type, label.label_type, interval.interval_type, numba.types.boolean, numba.types.string, numba.types.string, numba.types.string))
+rule_trace_edge_type = numba.types.Tuple((numba.types.uint16, numba.types.uint16, edge_type, label.label_type, interval.interval_type, numba.types.boolean, numba.types.string, numba.types.string, numba.types.string))
+
+# Type for ground atoms that have to be reset in non-persistent mode
+node_atom_type = numba.types.Tuple((node_type, label.label_type))
+edge_atom_type = numba.types.Tuple((edge_type, label.label_type))
+
 
 class Interpretation:
 	specific_node_labels = numba.typed.Dict.empty(key_type=label.label_type, value_type=numba.types.ListType(node_type))
 	specific_edge_labels = numba.typed.Dict.empty(key_type=label.label_type, value_type=numba.types.ListType(edge_type))
-	closed_world_predicates = numba.typed.List.empty_list(label.label_type)
+	# Closed world predicates are kept as a set, they are looked up for every component of every clause
+	closed_world_predicates = numba.typed.Dict.empty(key_type=label.label_type, value_type=numba.types.boolean)
 
-	def __init__(self, graph, ipl, annotation_functions, head_functions, reverse_graph, atom_trace, save_graph_attributes_to_rule_trace, persistent, inconsistency_check, store_interpretation_changes, update_mode, allow_ground_rules):
+	def __init__(self, graph, ipl, annotation_functions, head_functions, reverse_graph, atom_trace, save_graph_attributes_to_rule_trace, persistent, inconsistency_check, store_interpretation_changes, update_mode, allow_ground_rules, semi_naive=False, grounding_cache_size=0, grounding_partitions=1, deterministic_parallel=False, parallel_apply=False, parallel_computing=False):
 		self.graph = graph
 		self.ipl = ipl
 		self.annotation_functions = annotation_functions
@@ -69,6 +84,13 @@ class Interpretation:
 		self.store_interpretation_changes = store_interpretation_changes
 		self.update_mode = update_mode
 		self.allow_ground_rules = allow_ground_rules
+		self.semi_naive = semi_naive
+		self.grounding_cache_size = grounding_cache_size
+		self.grounding_partitions = grounding_partitions
+		self.deterministic_parallel = deterministic_parallel
+		self.parallel_apply = parallel_apply
+		# Only the flavour of the reason kernel that is used gets compiled
+		self.reason = _get_reason_kernel(parallel_computing)
 
 		# Counter for number of ground atoms for each timestep, start with zero for the zeroth timestep
 		self.num_ga = numba.typed.List.empty_list(numba.types.int64)
@@ -93,8 +115,8 @@ class Interpretation:
 		# Keep track of all the rules that have affected each node/edge at each timestep/fp operation, and all ground atoms that have affected the rules as well. Keep track of previous bounds and name of the rule/fact here
 		self.rule_trace_node_atoms = numba.typed.List.empty_list(numba.types.Tuple((numba.types.ListType(numba.types.ListType(node_type)), numba.types.ListType(numba.types.ListType(edge_type)), interval.interval_type, numba.types.string)))
 		self.rule_trace_edge_atoms = numba.typed.List.empty_list(numba.types.Tuple((numba.types.ListType(numba.types.ListType(node_type)), numba.types.ListType(numba.types.ListType(edge_type)), interval.interval_type, numba.types.string)))
-		self.rule_trace_node = numba.typed.List.empty_list(numba.types.Tuple((numba.types.uint16, numba.types.uint16, node_type, label.label_type, interval.interval_type, numba.types.boolean, numba.types.string, numba.types.string, numba.types.string)))
-		self.rule_trace_edge = numba.typed.List.empty_list(numba.types.Tuple((numba.types.uint16, numba.types.uint16, edge_type, label.label_type, interval.interval_type, numba.types.boolean, numba.types.string, numba.types.string, numba.types.string)))
+		self.rule_trace_node = numba.typed.List.empty_list(rule_trace_node_type)
+		self.rule_trace_edge = numba.typed.List.empty_list(rule_trace_edge_type)
 
 		# Nodes and edges of the graph
 		self.nodes = numba.typed.List.empty_list(node_type)
@@ -106,14 +128,32 @@ class Interpretation:
 		self.interpretations_edge, self.predicate_map_edge = self._init_interpretations_edge(self.edges, self.specific_edge_labels, self.num_ga)
 
 		# Setup graph neighbors and reverse neighbors
-		self.neighbors = numba.typed.Dict.empty(key_type=node_type, value_type=numba.types.ListType(node_type))
-		for n in self.graph.nodes():
-			l = numba.typed.List.empty_list(node_type)
-			[l.append(neigh) for neigh in self.graph.neighbors(n)]
-			self.neighbors[n] = l
-
+		indptr, indices = self._init_csr_adjacency(self.graph)
+		self.neighbors = self._init_neighbors(self.nodes, indptr, indices)
 		self.reverse_neighbors = self._init_reverse_neighbors(self.neighbors)
 
+	@staticmethod
+	def _init_csr_adjacency(graph):
+		# Intern nodes to integer ids (their position in graph.nodes()) and store the adjacency in CSR form
+		# Passing integer arrays to numba is much cheaper than appending node names to typed lists one by one
+		node_ids = {n: i for i, n in enumerate(graph.nodes())}
+		degrees = np.fromiter((len(graph.adj[n]) for n in graph.nodes()), dtype=np.int64, count=len(node_ids))
+		indptr = np.zeros(len(node_ids) + 1, dtype=np.int64)
+		np.cumsum(degrees, out=indptr[1:])
+		indices = np.fromiter((node_ids[neigh] for n in graph.nodes() for neigh in graph.adj[n]), dtype=np.int32, count=indptr[-1])
+		return indptr, indices
+
+	@staticmethod
+	@numba.njit(cache=True)
+	def _init_neighbors(nodes, indptr, indices):
+		neighbors = numba.typed.Dict.empty(key_type=node_type, value_type=list_of_nodes)
+		for i in range(len(nodes)):
+			neighbor_nodes = numba.typed.List.empty_list(node_type)
+			for j in range(indptr[i], indptr[i+1]):
+				neighbor_nodes.append(nodes[indices[j]])
+			neighbors[nodes[i]] = neighbor_nodes
+		return neighbors
+
 	@staticmethod
 	@numba.njit(cache=True)
 	def _init_reverse_neighbors(neighbors):
@@ -191,23 +231,28 @@ class Interpretation:
 	@staticmethod
 	@numba.njit(cache=True)
 	def _init_facts(facts_node, facts_edge, facts_to_be_applied_node, facts_to_be_applied_edge, facts_to_be_applied_node_trace, facts_to_be_applied_edge_trace, atom_trace):
+		# Facts are stored once with the interval of timesteps at which they hold
 		max_time = 0
 		for fact in facts_node:
-			for t in range(fact.get_time_lower(), fact.get_time_upper() + 1):
-				max_time = max(max_time, t)
-				name = fact.get_name()
-				graph_attribute = True if name=='graph-attribute-fact' else False
-				facts_to_be_applied_node.append((numba.types.uint16(t), fact.get_component(), fact.get_label(), fact.get_bound(), fact.static, graph_attribute))
-				if atom_trace:
-					facts_to_be_applied_node_trace.append(fact.get_name())
+			t_lower, t_upper = fact.get_time_lower(), fact.get_time_upper()
+			if t_upper < t_lower:
+				continue
+			max_time = max(max_time, t_upper)
+			name = fact.get_name()
+			graph_attribute = True if name=='graph-attribute-fact' else False
+			facts_to_be_applied_node.append((numba.types.uint16(t_lower), fact.get_component(), fact.get_label(), fact.get_bound(), fact.static, graph_attribute, numba.types.uint16(t_upper)))
+			if atom_trace:
+				facts_to_be_applied_node_trace.append(fact.get_name())
 		for fact in facts_edge:
-			for t in range(fact.get_time_lower(), fact.get_time_upper() + 1):
-				max_time = max(max_time, t)
-				name = fact.get_name()
-				graph_attribute = True if name=='graph-attribute-fact' else False
-				facts_to_be_applied_edge.append((numba.types.uint16(t), fact.get_component(), fact.get_label(), fact.get_bound(), fact.static, graph_attribute))
-				if atom_trace:
-					facts_to_be_applied_edge_trace.append(fact.get_name())
+			t_lower, t_upper = fact.get_time_lower(), fact.get_time_upper()
+			if t_upper < t_lower:
+				continue
+			max_time = max(max_time, t_upper)
+			name = fact.get_name()
+			graph_attribute = True if name=='graph-attribute-fact' else False
+			facts_to_be_applied_edge.append((numba.types.uint16(t_lower), fact.get_component(), fact.get_label(), fact.get_bound(), fact.static, graph_attribute, numba.types.uint16(t_upper)))
+			if atom_trace:
+				facts_to_be_applied_edge_trace.append(fact.get_name())
 		return max_time
 
 	def _start_fp(self, rules, max_facts_time, verbose, again, restart):
@@ -216,7 +261,7 @@ class Interpretation:
 			if restart:
 				self.time = 0
 				self.prev_reasoning_data[0] = 0
-		fp_cnt, t = self.reason(self.interpretations_node, self.interpretations_edge, self.predicate_map_node, self.predicate_map_edge, self.tmax, self.prev_reasoning_data, rules, self.nodes, self.edges, self.neighbors, self.reverse_neighbors, self.rules_to_be_applied_node, self.rules_to_be_applied_edge, self.edges_to_be_added_node_rule, self.edges_to_be_added_edge_rule, self.rules_to_be_applied_node_trace, self.rules_to_be_applied_edge_trace, self.facts_to_be_applied_node, self.facts_to_be_applied_edge, self.facts_to_be_applied_node_trace, self.facts_to_be_applied_edge_trace, self.ipl, self.rule_trace_node, self.rule_trace_edge, self.rule_trace_node_atoms, self.rule_trace_edge_atoms, self.reverse_graph, self.atom_trace, self.save_graph_attributes_to_rule_trace, self.persistent, self.inconsistency_check, self.store_interpretation_changes, self.update_mode, self.allow_ground_rules, max_facts_time, self.annotation_functions, self.head_functions, self._convergence_mode, self._convergence_delta, self.num_ga, verbose, again, self.closed_world_predicates)
+		fp_cnt, t = self.reason(self.interpretations_node, self.interpretations_edge, self.predicate_map_node, self.predicate_map_edge, self.tmax, self.prev_reasoning_data, rules, self.nodes, self.edges, self.neighbors, self.reverse_neighbors, self.rules_to_be_applied_node, self.rules_to_be_applied_edge, self.edges_to_be_added_node_rule, self.edges_to_be_added_edge_rule, self.rules_to_be_applied_node_trace, self.rules_to_be_applied_edge_trace, self.facts_to_be_applied_node, self.facts_to_be_applied_edge, self.facts_to_be_applied_node_trace, self.facts_to_be_applied_edge_trace, self.ipl, self.rule_trace_node, self.rule_trace_edge, self.rule_trace_node_atoms, self.rule_trace_edge_atoms, self.reverse_graph, self.atom_trace, self.save_graph_attributes_to_rule_trace, self.persistent, self.inconsistency_check, self.store_interpretation_changes, self.update_mode, self.allow_ground_rules, max_facts_time, self.annotation_functions, self.head_functions, self._convergence_mode, self._convergence_delta, self.num_ga, verbose, again, self.closed_world_predicates, self.semi_naive, self.grounding_cache_size, self.grounding_partitions, self.deterministic_parallel, self.parallel_apply)
 		self.time = t - 1
 		# If we need to reason again, store the next timestep to start from
 		self.prev_reasoning_data[0] = t
@@ -225,18 +270,67 @@ class Interpretation:
 			print('Fixed Point iterations:', fp_cnt)
 
 	@staticmethod
-	@numba.njit(cache=True, parallel=False)
-	def reason(interpretations_node, interpretations_edge, predicate_map_node, predicate_map_edge, tmax, prev_reasoning_data, rules, nodes, edges, neighbors, reverse_neighbors, rules_to_be_applied_node, rules_to_be_applied_edge, edges_to_be_added_node_rule, edges_to_be_added_edge_rule, rules_to_be_applied_node_trace, rules_to_be_applied_edge_trace, facts_to_be_applied_node, facts_to_be_applied_edge, facts_to_be_applied_node_trace, facts_to_be_applied_edge_trace, ipl, rule_trace_node, rule_trace_edge, rule_trace_node_atoms, rule_trace_edge_atoms, reverse_graph, atom_trace, save_graph_attributes_to_rule_trace, persistent, inconsistency_check, store_interpretation_changes, update_mode, allow_ground_rules, max_facts_time, annotation_functions, head_functions, convergence_mode, convergence_delta, num_ga, verbose, again, closed_world_predicates):
+	def reason(interpretations_node, interpretations_edge, predicate_map_node, predicate_map_edge, tmax, prev_reasoning_data, rules, nodes, edges, neighbors, reverse_neighbors, rules_to_be_applied_node, rules_to_be_applied_edge, edges_to_be_added_node_rule, edges_to_be_added_edge_rule, rules_to_be_applied_node_trace, rules_to_be_applied_edge_trace, facts_to_be_applied_node, facts_to_be_applied_edge, facts_to_be_applied_node_trace, facts_to_be_applied_edge_trace, ipl, rule_trace_node, rule_trace_edge, rule_trace_node_atoms, rule_trace_edge_atoms, reverse_graph, atom_trace, save_graph_attributes_to_rule_trace, persistent, inconsistency_check, store_interpretation_changes, update_mode, allow_ground_rules, max_facts_time, annotation_functions, head_functions, convergence_mode, convergence_delta, num_ga, verbose, again, closed_world_predicates, semi_naive=False, grounding_cache_size=0, grounding_partitions=1, deterministic_parallel=False, parallel_apply=False):
 		t = prev_reasoning_data[0]
 		fp_cnt = prev_reasoning_data[1]
 		max_rules_time = 0
 		timestep_loop = True
-		facts_to_be_applied_node_new = numba.typed.List.empty_list(facts_to_be_applied_node_type)
-		facts_to_be_applied_edge_new = numba.typed.List.empty_list(facts_to_be_applied_edge_type)
-		facts_to_be_applied_node_trace_new = numba.typed.List.empty_list(numba.types.string)
-		facts_to_be_applied_edge_trace_new = numba.typed.List.empty_list(numba.types.string)
-		rules_to_remove_idx = set()
-		rules_to_remove_idx.add(-1)
+		# Index facts by the timestep at which they become due, so that each timestep only goes through its own facts
+		# Facts stay active until the end of their interval. Static facts stay active after they have been applied
+		t_start = t
+		fact_schedule_node = _build_fact_schedule(facts_to_be_applied_node, t_start)
+		fact_schedule_edge = _build_fact_schedule(facts_to_be_applied_edge, t_start)
+		active_facts_node = numba.typed.List.empty_list(numba.types.int64)
+		active_facts_edge = numba.typed.List.empty_list(numba.types.int64)
+		# Index the rules to be applied by the timestep at which they are due. Applied rules are removed from the lists in batches
+		rule_queue_node = _build_rule_queue(rules_to_be_applied_node, t_start)
+		rule_queue_edge = _build_rule_queue(rules_to_be_applied_edge, t_start)
+		applied_rules_node = 0
+		applied_rules_edge = 0
+		# Labels updated since the last grounding (semi-naive mode and grounding cache). Rules whose body does not contain any of them are not grounded again
+		changed_labels_node = numba.typed.Dict.empty(key_type=label.label_type, value_type=numba.types.boolean)
+		changed_labels_edge = numba.typed.Dict.empty(key_type=label.label_type, value_type=numba.types.boolean)
+		# Index rules by their body predicates and stratify them, so that only the rules affected by a change are scheduled
+		rules_by_label_node = numba.typed.Dict.empty(key_type=label.label_type, value_type=list_of_ints)
+		rules_by_label_edge = numba.typed.Dict.empty(key_type=label.label_type, value_type=list_of_ints)
+		always_scheduled = numba.typed.List.empty_list(numba.types.int64)
+		strata = numba.typed.List.empty_list(numba.types.int64)
+		if semi_naive:
+			rules_by_label_node, rules_by_label_edge, always_scheduled = _build_rule_dependency_index(rules)
+			strata = _stratify_rules(rules, rules_by_label_node, rules_by_label_edge, always_scheduled, ipl)
+		# Grounding cache: the applicable rules of each rule are kept with a signature of the versions of its body predicates and the graph size
+		# They are reused as long as the signature does not change. The least recently used groundings are evicted past grounding_cache_size
+		track_changes = semi_naive or grounding_cache_size > 0
+		label_versions_node = numba.typed.Dict.empty(key_type=label.label_type, value_type=numba.types.int64)
+		label_versions_edge = numba.typed.Dict.empty(key_type=label.label_type, value_type=numba.types.int64)
+		cached_signatures = numba.typed.List.empty_list(numba.types.int64)
+		cached_last_used = numba.typed.List.empty_list(numba.types.int64)
+		cached_node_rules = numba.typed.List.empty_list(numba.types.ListType(node_applicable_rule_type))
+		cached_edge_rules = numba.typed.List.empty_list(numba.types.ListType(edge_applicable_rule_type))
+		cache_clock = 0
+		if grounding_cache_size > 0:
+			for _ in range(len(rules)):
+				cached_signatures.append(-1)
+				cached_last_used.append(0)
+				cached_node_rules.append(numba.typed.List.empty_list(node_applicable_rule_type))
+				cached_edge_rules.append(numba.typed.List.empty_list(edge_applicable_rule_type))
+		# The grounding of a rule is only split when the traces and ground atoms do not depend on the groundings of the whole rule
+		max_partitions = grounding_partitions if not atom_trace and not allow_ground_rules else 1
+		# Due rules are applied in parallel by component when their traces do not need the ground atoms that fired them
+		apply_in_parallel = parallel_apply and not atom_trace
+		# Rules that can add nodes or edges to the graph while they are grounded
+		adds_to_graph = numba.typed.List.empty_list(numba.types.boolean)
+		for rule in rules:
+			adds_to_graph.append(deterministic_parallel and _may_add_to_graph(rule))
+		# Order in which the clauses of each rule are grounded. Rules are planned again when the predicate cardinalities drift
+		clause_orders = numba.typed.List.empty_list(list_of_ints)
+		planned_cardinalities_node = numba.typed.Dict.empty(key_type=label.label_type, value_type=numba.types.int64)
+		planned_cardinalities_edge = numba.typed.Dict.empty(key_type=label.label_type, value_type=numba.types.int64)
+		planned_num_nodes, planned_num_edges = -1, -1
+		# Atoms modified since the last reset (non-persistent mode). All atoms are checked on the first reset, after that only these are reset
+		dirty_atoms_node = numba.typed.Dict.empty(key_type=node_atom_type, value_type=numba.types.boolean)
+		dirty_atoms_edge = numba.typed.Dict.empty(key_type=edge_atom_type, value_type=numba.types.boolean)
+		reset_all_atoms = True
 		while timestep_loop:
 			if t==tmax:
 				timestep_loop = False
@@ -245,19 +339,37 @@ class Interpretation:
 					print('Timestep:', t, flush=True)
 			# Reset Interpretation at beginning of timestep if non-persistent
 			if t>0 and not persistent:
-				# Reset nodes (only if not static)
-				for n in nodes:
-					w = interpretations_node[n].world
-					for l in w:
-						if not w[l].is_static():
-							w[l].reset()
-
-				# Reset edges (only if not static)
-				for e in edges:
-					w = interpretations_edge[e].world
-					for l in w:
-						if not w[l].is_static():
-							w[l].reset()
+				if reset_all_atoms:
+					# Reset nodes (only if not static)
+					for n in nodes:
+						w = interpretations_node[n].world
+						for l in w:
+							if not w[l].is_static():
+								w[l].reset()
+								if w[l].prev_lower != 0 or w[l].prev_upper != 1:
+									dirty_atoms_node[(n, l)] = True
+									if track_changes:
+										changed_labels_node[l] = True
+
+					# Reset edges (only if not static)
+					for e in edges:
+						w = interpretations_edge[e].world
+						for l in w:
+							if not w[l].is_static():
+								w[l].reset()
+								if w[l].prev_lower != 0 or w[l].prev_upper != 1:
+									dirty_atoms_edge[(e, l)] = True
+									if track_changes:
+										changed_labels_edge[l] = True
+					reset_all_atoms = False
+				else:
+					if track_changes:
+						for _, l in dirty_atoms_node:
+							changed_labels_node[l] = True
+						for _, l in dirty_atoms_edge:
+							changed_labels_edge[l] = True
+					_reset_dirty_atoms(interpretations_node, dirty_atoms_node)
+					_reset_dirty_atoms(interpretations_edge, dirty_atoms_edge)
 
 			# Convergence parameters
 			changes_cnt = 0
@@ -266,156 +378,149 @@ class Interpretation:
 
 			# Start by applying facts
 			# Nodes
-			facts_to_be_applied_node_new.clear()
-			facts_to_be_applied_node_trace_new.clear()
-			nodes_set = set(nodes)
-			for i in range(len(facts_to_be_applied_node)):
-				if facts_to_be_applied_node[i][0] == t:
-					comp, l, bnd, static, graph_attribute = facts_to_be_applied_node[i][1], facts_to_be_applied_node[i][2], facts_to_be_applied_node[i][3], facts_to_be_applied_node[i][4], facts_to_be_applied_node[i][5]
-					# If the component is not in the graph, add it
-					if comp not in nodes_set:
-						_add_node(comp, neighbors, reverse_neighbors, nodes, interpretations_node)
-						nodes_set.add(comp)
-
-					# Check if bnd is static. Then no need to update, just add to rule trace, check if graph attribute and add ipl complement to rule trace as well
-					if l in interpretations_node[comp].world and interpretations_node[comp].world[l].is_static():
-						# Check if we should even store any of the changes to the rule trace etc.
-						# Inverse of this is: if not save_graph_attributes_to_rule_trace and graph_attribute
-						if (save_graph_attributes_to_rule_trace or not graph_attribute) and store_interpretation_changes:
-							meta_name = facts_to_be_applied_node_trace[i] if atom_trace else ''
-							rule_trace_node.append((numba.types.uint16(t), numba.types.uint16(fp_cnt), comp, l, bnd, True, 'Fact', meta_name, ''))
-							if atom_trace:
-								_update_rule_trace(rule_trace_node_atoms, numba.typed.List.empty_list(numba.typed.List.empty_list(node_type)), numba.typed.List.empty_list(numba.typed.List.empty_list(edge_type)), bnd, facts_to_be_applied_node_trace[i])
-							for p1, p2 in ipl:
-								if p1==l:
-									rule_trace_node.append((numba.types.uint16(t), numba.types.uint16(fp_cnt), comp, p2, interpretations_node[comp].world[p2], True, 'IPL', f'IPL: {l.get_value()}', ''))
-									if atom_trace:
-										_update_rule_trace(rule_trace_node_atoms, numba.typed.List.empty_list(numba.typed.List.empty_list(node_type)), numba.typed.List.empty_list(numba.typed.List.empty_list(edge_type)), interpretations_node[comp].world[p2], facts_to_be_applied_node_trace[i])
-								elif p2==l:
-									rule_trace_node.append((numba.types.uint16(t), numba.types.uint16(fp_cnt), comp, p1, interpretations_node[comp].world[p1], True, 'IPL', f'IPL: {l.get_value()}', ''))
-									if atom_trace:
-										_update_rule_trace(rule_trace_node_atoms, numba.typed.List.empty_list(numba.typed.List.empty_list(node_type)), numba.typed.List.empty_list(numba.typed.List.empty_list(edge_type)), interpretations_node[comp].world[p1], facts_to_be_applied_node_trace[i])
+			due_facts_node = _get_due_facts(fact_schedule_node, active_facts_node, t)
+			active_facts_node.clear()
+			for i in due_facts_node:
+				comp, l, bnd, static, graph_attribute = facts_to_be_applied_node[i][1], facts_to_be_applied_node[i][2], facts_to_be_applied_node[i][3], facts_to_be_applied_node[i][4], facts_to_be_applied_node[i][5]
+				if not persistent:
+					_mark_atom_dirty(dirty_atoms_node, comp, l, ipl)
+				# If the component is not in the graph, add it
+				if comp not in interpretations_node:
+					_add_node(comp, neighbors, reverse_neighbors, nodes, interpretations_node)
+
+				# Check if bnd is static. Then no need to update, just add to rule trace, check if graph attribute and add ipl complement to rule trace as well
+				if l in interpretations_node[comp].world and interpretations_node[comp].world[l].is_static():
+					# Check if we should even store any of the changes to the rule trace etc.
+					# Inverse of this is: if not save_graph_attributes_to_rule_trace and graph_attribute
+					if (save_graph_attributes_to_rule_trace or not graph_attribute) and store_interpretation_changes:
+						meta_name = facts_to_be_applied_node_trace[i] if atom_trace else ''
+						rule_trace_node.append((numba.types.uint16(t), numba.types.uint16(fp_cnt), comp, l, bnd, True, 'Fact', meta_name, ''))
+						if atom_trace:
+							_update_rule_trace(rule_trace_node_atoms, numba.typed.List.empty_list(numba.typed.List.empty_list(node_type)), numba.typed.List.empty_list(numba.typed.List.empty_list(edge_type)), bnd, facts_to_be_applied_node_trace[i])
+						for p1, p2 in ipl:
+							if p1==l:
+								rule_trace_node.append((numba.types.uint16(t), numba.types.uint16(fp_cnt), comp, p2, interpretations_node[comp].world[p2], True, 'IPL', f'IPL: {l.get_value()}', ''))
+								if atom_trace:
+									_update_rule_trace(rule_trace_node_atoms, numba.typed.List.empty_list(numba.typed.List.empty_list(node_type)), numba.typed.List.empty_list(numba.typed.List.empty_list(edge_type)), interpretations_node[comp].world[p2], facts_to_be_applied_node_trace[i])
+							elif p2==l:
+								rule_trace_node.append((numba.types.uint16(t), numba.types.uint16(fp_cnt), comp, p1, interpretations_node[comp].world[p1], True, 'IPL', f'IPL: {l.get_value()}', ''))
+								if atom_trace:
+									_update_rule_trace(rule_trace_node_atoms, numba.typed.List.empty_list(numba.typed.List.empty_list(node_type)), numba.typed.List.empty_list(numba.typed.List.empty_list(edge_type)), interpretations_node[comp].world[p1], facts_to_be_applied_node_trace[i])
 
+				else:
+					# Check for inconsistencies (multiple facts)
+					if check_consistent_node(interpretations_node, comp, (l, bnd)):
+						mode = 'graph-attribute-fact' if graph_attribute else 'fact'
+						override = True if update_mode == 'override' else False
+						u, changes = _update_node(interpretations_node, predicate_map_node, comp, (l, bnd), ipl, rule_trace_node, fp_cnt, t, static, convergence_mode, atom_trace, save_graph_attributes_to_rule_trace, rules_to_be_applied_node_trace, i, facts_to_be_applied_node_trace, rule_trace_node_atoms, store_interpretation_changes, num_ga, mode=mode, override=override)
+
+						update = u or update
+						if u and track_changes:
+							_mark_label_changed(changed_labels_node, l, ipl)
+						# Update convergence params
+						if convergence_mode=='delta_bound':
+							bound_delta = max(bound_delta, changes)
+						else:
+							changes_cnt += changes
+					# Resolve inconsistency if necessary otherwise override bounds
 					else:
-						# Check for inconsistencies (multiple facts)
-						if check_consistent_node(interpretations_node, comp, (l, bnd)):
-							mode = 'graph-attribute-fact' if graph_attribute else 'fact'
-							override = True if update_mode == 'override' else False
-							u, changes = _update_node(interpretations_node, predicate_map_node, comp, (l, bnd), ipl, rule_trace_node, fp_cnt, t, static, convergence_mode, atom_trace, save_graph_attributes_to_rule_trace, rules_to_be_applied_node_trace, i, facts_to_be_applied_node_trace, rule_trace_node_atoms, store_interpretation_changes, num_ga, mode=mode, override=override)
+						mode = 'graph-attribute-fact' if graph_attribute else 'fact'
+						if inconsistency_check:
+							resolve_inconsistency_node(interpretations_node, comp, (l, bnd), ipl, t, fp_cnt, i, atom_trace, rule_trace_node, rule_trace_node_atoms, rules_to_be_applied_node_trace, facts_to_be_applied_node_trace, store_interpretation_changes, mode=mode)
+							if track_changes:
+								_mark_label_changed(changed_labels_node, l, ipl)
+						else:
+							u, changes = _update_node(interpretations_node, predicate_map_node, comp, (l, bnd), ipl, rule_trace_node, fp_cnt, t, static, convergence_mode, atom_trace, save_graph_attributes_to_rule_trace, rules_to_be_applied_node_trace, i, facts_to_be_applied_node_trace, rule_trace_node_atoms, store_interpretation_changes, num_ga, mode=mode, override=True)
 
 							update = u or update
+							if u and track_changes:
+								_mark_label_changed(changed_labels_node, l, ipl)
 							# Update convergence params
 							if convergence_mode=='delta_bound':
 								bound_delta = max(bound_delta, changes)
 							else:
 								changes_cnt += changes
-						# Resolve inconsistency if necessary otherwise override bounds
-						else:
-							mode = 'graph-attribute-fact' if graph_attribute else 'fact'
-							if inconsistency_check:
-								resolve_inconsistency_node(interpretations_node, comp, (l, bnd), ipl, t, fp_cnt, i, atom_trace, rule_trace_node, rule_trace_node_atoms, rules_to_be_applied_node_trace, facts_to_be_applied_node_trace, store_interpretation_changes, mode=mode)
-							else:
-								u, changes = _update_node(interpretations_node, predicate_map_node, comp, (l, bnd), ipl, rule_trace_node, fp_cnt, t, static, convergence_mode, atom_trace, save_graph_attributes_to_rule_trace, rules_to_be_applied_node_trace, i, facts_to_be_applied_node_trace, rule_trace_node_atoms, store_interpretation_changes, num_ga, mode=mode, override=True)
 
-								update = u or update
-								# Update convergence params
-								if convergence_mode=='delta_bound':
-									bound_delta = max(bound_delta, changes)
-								else:
-									changes_cnt += changes
+				# Keep the fact if its interval has not ended. Static facts are applied again at every following timestep
+				if static or facts_to_be_applied_node[i][6] > t:
+					active_facts_node.append(i)
 
-					if static:
-						facts_to_be_applied_node_new.append((numba.types.uint16(facts_to_be_applied_node[i][0]+1), comp, l, bnd, static, graph_attribute))
+			# Edges
+			due_facts_edge = _get_due_facts(fact_schedule_edge, active_facts_edge, t)
+			active_facts_edge.clear()
+			for i in due_facts_edge:
+				comp, l, bnd, static, graph_attribute = facts_to_be_applied_edge[i][1], facts_to_be_applied_edge[i][2], facts_to_be_applied_edge[i][3], facts_to_be_applied_edge[i][4], facts_to_be_applied_edge[i][5]
+				if not persistent:
+					_mark_atom_dirty(dirty_atoms_edge, comp, l, ipl)
+				# If the component is not in the graph, add it
+				if comp not in interpretations_edge:
+					_add_edge(comp[0], comp[1], neighbors, reverse_neighbors, nodes, edges, label.Label(''), interpretations_node, interpretations_edge, predicate_map_edge, num_ga, t)
+
+				# Check if bnd is static. Then no need to update, just add to rule trace, check if graph attribute, and add ipl complement to rule trace as well
+				if l in interpretations_edge[comp].world and interpretations_edge[comp].world[l].is_static():
+					# Inverse of this is: if not save_graph_attributes_to_rule_trace and graph_attribute
+					if (save_graph_attributes_to_rule_trace or not graph_attribute) and store_interpretation_changes:
+						meta_name = facts_to_be_applied_edge_trace[i] if atom_trace else ''
+						rule_trace_edge.append((numba.types.uint16(t), numba.types.uint16(fp_cnt), comp, l, interpretations_edge[comp].world[l], True, 'Fact', meta_name, ''))
 						if atom_trace:
-							facts_to_be_applied_node_trace_new.append(facts_to_be_applied_node_trace[i])
-
-				# If time doesn't match, fact to be applied later
+							_update_rule_trace(rule_trace_edge_atoms, numba.typed.List.empty_list(numba.typed.List.empty_list(node_type)), numba.typed.List.empty_list(numba.typed.List.empty_list(edge_type)), bnd, facts_to_be_applied_edge_trace[i])
+						for p1, p2 in ipl:
+							if p1==l:
+								rule_trace_edge.append((numba.types.uint16(t), numba.types.uint16(fp_cnt), comp, p2, interpretations_edge[comp].world[p2], True, 'IPL', f'IPL: {l.get_value()}', ''))
+								if atom_trace:
+									_update_rule_trace(rule_trace_edge_atoms, numba.typed.List.empty_list(numba.typed.List.empty_list(node_type)), numba.typed.List.empty_list(numba.typed.List.empty_list(edge_type)), interpretations_edge[comp].world[p2], facts_to_be_applied_edge_trace[i])
+							elif p2==l:
+								rule_trace_edge.append((numba.types.uint16(t), numba.types.uint16(fp_cnt), comp, p1, interpretations_edge[comp].world[p1], True, 'IPL', f'IPL: {l.get_value()}', ''))
+								if atom_trace:
+									_update_rule_trace(rule_trace_edge_atoms, numba.typed.List.empty_list(numba.typed.List.empty_list(node_type)), numba.typed.List.empty_list(numba.typed.List.empty_list(edge_type)), interpretations_edge[comp].world[p1], facts_to_be_applied_edge_trace[i])
 				else:
-					facts_to_be_applied_node_new.append(facts_to_be_applied_node[i])
-					if atom_trace:
-						facts_to_be_applied_node_trace_new.append(facts_to_be_applied_node_trace[i])
-
-			# Update list of facts with ones that have not been applied yet (delete applied facts)
-			facts_to_be_applied_node[:] = facts_to_be_applied_node_new.copy()
-			if atom_trace:
-				facts_to_be_applied_node_trace[:] = facts_to_be_applied_node_trace_new.copy()
-			facts_to_be_applied_node_new.clear()
-			facts_to_be_applied_node_trace_new.clear()
-
-			# Edges
-			facts_to_be_applied_edge_new.clear()
-			facts_to_be_applied_edge_trace_new.clear()
-			edges_set = set(edges)
-			for i in range(len(facts_to_be_applied_edge)):
-				if facts_to_be_applied_edge[i][0]==t:
-					comp, l, bnd, static, graph_attribute = facts_to_be_applied_edge[i][1], facts_to_be_applied_edge[i][2], facts_to_be_applied_edge[i][3], facts_to_be_applied_edge[i][4], facts_to_be_applied_edge[i][5]
-					# If the component is not in the graph, add it
-					if comp not in edges_set:
-						_add_edge(comp[0], comp[1], neighbors, reverse_neighbors, nodes, edges, label.Label(''), interpretations_node, interpretations_edge, predicate_map_edge, num_ga, t)
-						edges_set.add(comp)
-
-					# Check if bnd is static. Then no need to update, just add to rule trace, check if graph attribute, and add ipl complement to rule trace as well
-					if l in interpretations_edge[comp].world and interpretations_edge[comp].world[l].is_static():
-						# Inverse of this is: if not save_graph_attributes_to_rule_trace and graph_attribute
-						if (save_graph_attributes_to_rule_trace or not graph_attribute) and store_interpretation_changes:
-							meta_name = facts_to_be_applied_edge_trace[i] if atom_trace else ''
-							rule_trace_edge.append((numba.types.uint16(t), numba.types.uint16(fp_cnt), comp, l, interpretations_edge[comp].world[l], True, 'Fact', meta_name, ''))
-							if atom_trace:
-								_update_rule_trace(rule_trace_edge_atoms, numba.typed.List.empty_list(numba.typed.List.empty_list(node_type)), numba.typed.List.empty_list(numba.typed.List.empty_list(edge_type)), bnd, facts_to_be_applied_edge_trace[i])
-							for p1, p2 in ipl:
-								if p1==l:
-									rule_trace_edge.append((numba.types.uint16(t), numba.types.uint16(fp_cnt), comp, p2, interpretations_edge[comp].world[p2], True, 'IPL', f'IPL: {l.get_value()}', ''))
-									if atom_trace:
-										_update_rule_trace(rule_trace_edge_atoms, numba.typed.List.empty_list(numba.typed.List.empty_list(node_type)), numba.typed.List.empty_list(numba.typed.List.empty_list(edge_type)), interpretations_edge[comp].world[p2], facts_to_be_applied_edge_trace[i])
-								elif p2==l:
-									rule_trace_edge.append((numba.types.uint16(t), numba.types.uint16(fp_cnt), comp, p1, interpretations_edge[comp].world[p1], True, 'IPL', f'IPL: {l.get_value()}', ''))
-									if atom_trace:
-										_update_rule_trace(rule_trace_edge_atoms, numba.typed.List.empty_list(numba.typed.List.empty_list(node_type)), numba.typed.List.empty_list(numba.typed.List.empty_list(edge_type)), interpretations_edge[comp].world[p1], facts_to_be_applied_edge_trace[i])
+					# Check for inconsistencies
+					if check_consistent_edge(interpretations_edge, comp, (l, bnd)):
+						mode = 'graph-attribute-fact' if graph_attribute else 'fact'
+						override = True if update_mode == 'override' else False
+						u, changes = _update_edge(interpretations_edge, predicate_map_edge, comp, (l, bnd), ipl, rule_trace_edge, fp_cnt, t, static, convergence_mode, atom_trace, save_graph_attributes_to_rule_trace, rules_to_be_applied_edge_trace, i, facts_to_be_applied_edge_trace, rule_trace_edge_atoms, store_interpretation_changes, num_ga, mode=mode, override=override)
+
+						update = u or update
+						if u and track_changes:
+							_mark_label_changed(changed_labels_edge, l, ipl)
+						# Update convergence params
+						if convergence_mode=='delta_bound':
+							bound_delta = max(bound_delta, changes)
+						else:
+							changes_cnt += changes
+					# Resolve inconsistency
 					else:
-						# Check for inconsistencies
-						if check_consistent_edge(interpretations_edge, comp, (l, bnd)):
-							mode = 'graph-attribute-fact' if graph_attribute else 'fact'
-							override = True if update_mode == 'override' else False
-							u, changes = _update_edge(interpretations_edge, predicate_map_edge, comp, (l, bnd), ipl, rule_trace_edge, fp_cnt, t, static, convergence_mode, atom_trace, save_graph_attributes_to_rule_trace, rules_to_be_applied_edge_trace, i, facts_to_be_applied_edge_trace, rule_trace_edge_atoms, store_interpretation_changes, num_ga, mode=mode, override=override)
+						mode = 'graph-attribute-fact' if graph_attribute else 'fact'
+						if inconsistency_check:
+							resolve_inconsistency_edge(interpretations_edge, comp, (l, bnd), ipl, t, fp_cnt, i, atom_trace, rule_trace_edge, rule_trace_edge_atoms, rules_to_be_applied_edge_trace, facts_to_be_applied_edge_trace, store_interpretation_changes, mode=mode)
+							if track_changes:
+								_mark_label_changed(changed_labels_edge, l, ipl)
+						else:
+							u, changes = _update_edge(interpretations_edge, predicate_map_edge, comp, (l, bnd), ipl, rule_trace_edge, fp_cnt, t, static, convergence_mode, atom_trace, save_graph_attributes_to_rule_trace, rules_to_be_applied_edge_trace, i, facts_to_be_applied_edge_trace, rule_trace_edge_atoms, store_interpretation_changes, num_ga, mode=mode, override=True)
 
 							update = u or update
+							if u and track_changes:
+								_mark_label_changed(changed_labels_edge, l, ipl)
 							# Update convergence params
 							if convergence_mode=='delta_bound':
 								bound_delta = max(bound_delta, changes)
 							else:
 								changes_cnt += changes
-						# Resolve inconsistency
-						else:
-							mode = 'graph-attribute-fact' if graph_attribute else 'fact'
-							if inconsistency_check:
-								resolve_inconsistency_edge(interpretations_edge, comp, (l, bnd), ipl, t, fp_cnt, i, atom_trace, rule_trace_edge, rule_trace_edge_atoms, rules_to_be_applied_edge_trace, facts_to_be_applied_edge_trace, store_interpretation_changes, mode=mode)
-							else:
-								u, changes = _update_edge(interpretations_edge, predicate_map_edge, comp, (l, bnd), ipl, rule_trace_edge, fp_cnt, t, static, convergence_mode, atom_trace, save_graph_attributes_to_rule_trace, rules_to_be_applied_edge_trace, i, facts_to_be_applied_edge_trace, rule_trace_edge_atoms, store_interpretation_changes, num_ga, mode=mode, override=True)
 
-								update = u or update
-								# Update convergence params
-								if convergence_mode=='delta_bound':
-									bound_delta = max(bound_delta, changes)
-								else:
-									changes_cnt += changes
+				# Keep the fact if its interval has not ended. Static facts are applied again at every following timestep
+				if static or facts_to_be_applied_edge[i][6] > t:
+					active_facts_edge.append(i)
 
-					if static:
-						facts_to_be_applied_edge_new.append((numba.types.uint16(facts_to_be_applied_edge[i][0]+1), comp, l, bnd, static, graph_attribute))
-						if atom_trace:
-							facts_to_be_applied_edge_trace_new.append(facts_to_be_applied_edge_trace[i])
+			# Plan the clause order of the rules with the cardinalities after the facts have been applied
+			if planned_num_nodes == -1 or _cardinality_drifted(planned_num_nodes, len(nodes)) or _cardinality_drifted(planned_num_edges, len(edges)) or _cardinalities_drifted(planned_cardinalities_node, predicate_map_node) or _cardinalities_drifted(planned_cardinalities_edge, predicate_map_edge):
+				clause_orders = _plan_clause_orders(rules, predicate_map_node, predicate_map_edge, len(nodes), len(edges))
+				planned_cardinalities_node = _get_cardinalities(predicate_map_node)
+				planned_cardinalities_edge = _get_cardinalities(predicate_map_edge)
+				planned_num_nodes, planned_num_edges = len(nodes), len(edges)
 
-				# Time doesn't match, fact to be applied later
-				else:
-					facts_to_be_applied_edge_new.append(facts_to_be_applied_edge[i])
-					if atom_trace:
-						facts_to_be_applied_edge_trace_new.append(facts_to_be_applied_edge_trace[i])
-
-			# Update list of facts with ones that have not been applied yet (delete applied facts)
-			facts_to_be_applied_edge[:] = facts_to_be_applied_edge_new.copy()
-			if atom_trace:
-				facts_to_be_applied_edge_trace[:] = facts_to_be_applied_edge_trace_new.copy()
-			facts_to_be_applied_edge_new.clear()
-			facts_to_be_applied_edge_trace_new.clear()
+			# All rules are grounded on the first fixed point operation of every timestep
+			first_grounding = True
+			prev_graph_size = len(nodes) + len(edges)
 
 			in_loop = True
 			while in_loop:
@@ -424,16 +529,49 @@ class Interpretation:
 
 				# Apply the rules that need to be applied at this timestep
 				# Nodes
-				rules_to_remove_idx.clear()
-				for idx, i in enumerate(rules_to_be_applied_node):
-					if i[0] == t:
-						comp, l, bnd, set_static = i[1], i[2], i[3], i[4]
+				due_rules_node = _pop_due_rules(rule_queue_node, t)
+				applied_rules_node += len(due_rules_node)
+				if apply_in_parallel and len(due_rules_node) > 1 and _can_apply_in_parallel(interpretations_node, rules_to_be_applied_node, due_rules_node, ipl):
+					# The rules of different nodes are applied in parallel. The results and the trace of each rule are kept at its position and merged in the order of the rules
+					groups = _group_by_component(rules_to_be_applied_node, due_rules_node, numba.typed.Dict.empty(key_type=node_type, value_type=numba.types.int64))
+					rule_trace_threadsafe = numba.typed.List([numba.typed.List.empty_list(rule_trace_node_type) for _ in range(len(due_rules_node))])
+					updated_threadsafe = numba.typed.List.empty_list(numba.types.boolean)
+					changed_threadsafe = numba.typed.List.empty_list(numba.types.boolean)
+					changes_threadsafe = numba.typed.List.empty_list(numba.types.float64)
+					for _ in range(len(due_rules_node)):
+						updated_threadsafe.append(False)
+						changed_threadsafe.append(False)
+						changes_threadsafe.append(0.0)
+					for i in prange(len(groups)):
+						_apply_rules_node_group(interpretations_node, predicate_map_node, rules_to_be_applied_node, due_rules_node, groups[i], ipl, rule_trace_threadsafe, rule_trace_node_atoms, rules_to_be_applied_node_trace, facts_to_be_applied_node_trace, fp_cnt, t, convergence_mode, save_graph_attributes_to_rule_trace, inconsistency_check, store_interpretation_changes, update_mode, num_ga, updated_threadsafe, changed_threadsafe, changes_threadsafe)
+
+					for pos in range(len(due_rules_node)):
+						comp, l = rules_to_be_applied_node[due_rules_node[pos]][1], rules_to_be_applied_node[due_rules_node[pos]][2]
+						if not persistent:
+							_mark_atom_dirty(dirty_atoms_node, comp, l, ipl)
+						update = updated_threadsafe[pos] or update
+						if changed_threadsafe[pos] and track_changes:
+							_mark_label_changed(changed_labels_node, l, ipl)
+						# Update convergence params
+						if convergence_mode=='delta_bound':
+							bound_delta = max(bound_delta, changes_threadsafe[pos])
+						else:
+							changes_cnt += changes_threadsafe[pos]
+						if len(rule_trace_threadsafe[pos]) > 0:
+							rule_trace_node.extend(rule_trace_threadsafe[pos])
+				else:
+					for idx in due_rules_node:
+						comp, l, bnd, set_static = rules_to_be_applied_node[idx][1], rules_to_be_applied_node[idx][2], rules_to_be_applied_node[idx][3], rules_to_be_applied_node[idx][4]
+						if not persistent:
+							_mark_atom_dirty(dirty_atoms_node, comp, l, ipl)
 						# Check for inconsistencies
 						if check_consistent_node(interpretations_node, comp, (l, bnd)):
 							override = True if update_mode == 'override' else False
 							u, changes = _update_node(interpretations_node, predicate_map_node, comp, (l, bnd), ipl, rule_trace_node, fp_cnt, t, set_static, convergence_mode, atom_trace, save_graph_attributes_to_rule_trace, rules_to_be_applied_node_trace, idx, facts_to_be_applied_node_trace, rule_trace_node_atoms, store_interpretation_changes, num_ga, mode='rule', override=override)
 
 							update = u or update
+							if u and track_changes:
+								_mark_label_changed(changed_labels_node, l, ipl)
 							# Update convergence params
 							if convergence_mode=='delta_bound':
 								bound_delta = max(bound_delta, changes)
@@ -443,33 +581,61 @@ class Interpretation:
 						else:
 							if inconsistency_check:
 								resolve_inconsistency_node(interpretations_node, comp, (l, bnd), ipl, t, fp_cnt, idx, atom_trace, rule_trace_node, rule_trace_node_atoms, rules_to_be_applied_node_trace, facts_to_be_applied_node_trace, store_interpretation_changes, mode='rule')
+								if track_changes:
+									_mark_label_changed(changed_labels_node, l, ipl)
 							else:
 								u, changes = _update_node(interpretations_node, predicate_map_node, comp, (l, bnd), ipl, rule_trace_node, fp_cnt, t, set_static, convergence_mode, atom_trace, save_graph_attributes_to_rule_trace, rules_to_be_applied_node_trace, idx, facts_to_be_applied_node_trace, rule_trace_node_atoms, store_interpretation_changes, num_ga, mode='rule', override=True)
 
 								update = u or update
+								if u and track_changes:
+									_mark_label_changed(changed_labels_node, l, ipl)
 								# Update convergence params
 								if convergence_mode=='delta_bound':
 									bound_delta = max(bound_delta, changes)
 								else:
 									changes_cnt += changes
 
-						# Delete rules that have been applied from list by adding index to list
-						rules_to_remove_idx.add(idx)
-
-				# Remove from rules to be applied and edges to be applied lists after coming out from loop
-				rules_to_be_applied_node[:] = numba.typed.List([rules_to_be_applied_node[i] for i in range(len(rules_to_be_applied_node)) if i not in rules_to_remove_idx])
-				edges_to_be_added_node_rule[:] = numba.typed.List([edges_to_be_added_node_rule[i] for i in range(len(edges_to_be_added_node_rule)) if i not in rules_to_remove_idx])
-				if atom_trace:
-					rules_to_be_applied_node_trace[:] = numba.typed.List([rules_to_be_applied_node_trace[i] for i in range(len(rules_to_be_applied_node_trace)) if i not in rules_to_remove_idx])
-
 				# Edges
-				rules_to_remove_idx.clear()
-				for idx, i in enumerate(rules_to_be_applied_edge):
-					if i[0] == t:
-						comp, l, bnd, set_static = i[1], i[2], i[3], i[4]
+				due_rules_edge = _pop_due_rules(rule_queue_edge, t)
+				applied_rules_edge += len(due_rules_edge)
+				if apply_in_parallel and len(due_rules_edge) > 1 and not _adds_edges(edges_to_be_added_edge_rule, due_rules_edge) and _can_apply_in_parallel(interpretations_edge, rules_to_be_applied_edge, due_rules_edge, ipl):
+					# The rules of different edges are applied in parallel. The results and the trace of each rule are kept at its position and merged in the order of the rules
+					groups = _group_by_component(rules_to_be_applied_edge, due_rules_edge, numba.typed.Dict.empty(key_type=edge_type, value_type=numba.types.int64))
+					rule_trace_threadsafe_edge = numba.typed.List([numba.typed.List.empty_list(rule_trace_edge_type) for _ in range(len(due_rules_edge))])
+					updated_threadsafe = numba.typed.List.empty_list(numba.types.boolean)
+					changed_threadsafe = numba.typed.List.empty_list(numba.types.boolean)
+					changes_threadsafe = numba.typed.List.empty_list(numba.types.float64)
+					for _ in range(len(due_rules_edge)):
+						updated_threadsafe.append(False)
+						changed_threadsafe.append(False)
+						changes_threadsafe.append(0.0)
+					for i in prange(len(groups)):
+						_apply_rules_edge_group(interpretations_edge, predicate_map_edge, rules_to_be_applied_edge, edges_to_be_added_edge_rule, due_rules_edge, groups[i], ipl, rule_trace_threadsafe_edge, rule_trace_edge_atoms, rules_to_be_applied_edge_trace, facts_to_be_applied_edge_trace, fp_cnt, t, convergence_mode, save_graph_attributes_to_rule_trace, inconsistency_check, store_interpretation_changes, update_mode, num_ga, updated_threadsafe, changed_threadsafe, changes_threadsafe)
+
+					for pos in range(len(due_rules_edge)):
+						comp, l = rules_to_be_applied_edge[due_rules_edge[pos]][1], rules_to_be_applied_edge[due_rules_edge[pos]][2]
+						if not persistent:
+							_mark_atom_dirty(dirty_atoms_edge, comp, l, ipl)
+						update = updated_threadsafe[pos] or update
+						if changed_threadsafe[pos] and track_changes:
+							_mark_label_changed(changed_labels_edge, l, ipl)
+						# Update convergence params
+						if convergence_mode=='delta_bound':
+							bound_delta = max(bound_delta, changes_threadsafe[pos])
+						else:
+							changes_cnt += changes_threadsafe[pos]
+						if len(rule_trace_threadsafe_edge[pos]) > 0:
+							rule_trace_edge.extend(rule_trace_threadsafe_edge[pos])
+				else:
+					for idx in due_rules_edge:
+						comp, l, bnd, set_static = rules_to_be_applied_edge[idx][1], rules_to_be_applied_edge[idx][2], rules_to_be_applied_edge[idx][3], rules_to_be_applied_edge[idx][4]
 						sources, targets, edge_l = edges_to_be_added_edge_rule[idx]
 						edges_added, changes = _add_edges(sources, targets, neighbors, reverse_neighbors, nodes, edges, edge_l, interpretations_node, interpretations_edge, predicate_map_edge, num_ga, t)
 						changes_cnt += changes
+						if not persistent:
+							_mark_atom_dirty(dirty_atoms_edge, comp, l, ipl)
+							for e in edges_added:
+								_mark_atom_dirty(dirty_atoms_edge, e, edge_l, ipl)
 
 						# Update bound for newly added edges. Use bnd to update all edges if label is specified, else use bnd to update normally
 						if edge_l.value != '':
@@ -480,6 +646,8 @@ class Interpretation:
 									override = True if update_mode == 'override' else False
 									u, changes = _update_edge(interpretations_edge, predicate_map_edge, e, (edge_l, bnd), ipl, rule_trace_edge, fp_cnt, t, set_static, convergence_mode, atom_trace, save_graph_attributes_to_rule_trace, rules_to_be_applied_edge_trace, idx, facts_to_be_applied_edge_trace, rule_trace_edge_atoms, store_interpretation_changes, num_ga, mode='rule', override=override)
 									update = u or update
+									if u and track_changes:
+										_mark_label_changed(changed_labels_edge, edge_l, ipl)
 
 									# Update convergence params
 									if convergence_mode=='delta_bound':
@@ -490,10 +658,14 @@ class Interpretation:
 								else:
 									if inconsistency_check:
 										resolve_inconsistency_edge(interpretations_edge, e, (edge_l, bnd), ipl, t, fp_cnt, idx, atom_trace, rule_trace_edge, rule_trace_edge_atoms, rules_to_be_applied_edge_trace, facts_to_be_applied_edge_trace, store_interpretation_changes, mode='rule')
+										if track_changes:
+											_mark_label_changed(changed_labels_edge, edge_l, ipl)
 									else:
 										u, changes = _update_edge(interpretations_edge, predicate_map_edge, e, (edge_l, bnd), ipl, rule_trace_edge, fp_cnt, t, set_static, convergence_mode, atom_trace, save_graph_attributes_to_rule_trace, rules_to_be_applied_edge_trace, idx, facts_to_be_applied_edge_trace, rule_trace_edge_atoms, store_interpretation_changes, num_ga, mode='rule', override=True)
 
 										update = u or update
+										if u and track_changes:
+											_mark_label_changed(changed_labels_edge, edge_l, ipl)
 
 										# Update convergence params
 										if convergence_mode=='delta_bound':
@@ -508,6 +680,8 @@ class Interpretation:
 								u, changes = _update_edge(interpretations_edge, predicate_map_edge, comp, (l, bnd), ipl, rule_trace_edge, fp_cnt, t, set_static, convergence_mode, atom_trace, save_graph_attributes_to_rule_trace, rules_to_be_applied_edge_trace, idx, facts_to_be_applied_edge_trace, rule_trace_edge_atoms, store_interpretation_changes, num_ga, mode='rule', override=override)
 
 								update = u or update
+								if u and track_changes:
+									_mark_label_changed(changed_labels_edge, l, ipl)
 								# Update convergence params
 								if convergence_mode=='delta_bound':
 									bound_delta = max(bound_delta, changes)
@@ -517,96 +691,141 @@ class Interpretation:
 							else:
 								if inconsistency_check:
 									resolve_inconsistency_edge(interpretations_edge, comp, (l, bnd), ipl, t, fp_cnt, idx, atom_trace, rule_trace_edge, rule_trace_edge_atoms, rules_to_be_applied_edge_trace, facts_to_be_applied_edge_trace, store_interpretation_changes, mode='rule')
+									if track_changes:
+										_mark_label_changed(changed_labels_edge, l, ipl)
 								else:
 									u, changes = _update_edge(interpretations_edge, predicate_map_edge, comp, (l, bnd), ipl, rule_trace_edge, fp_cnt, t, set_static, convergence_mode, atom_trace, save_graph_attributes_to_rule_trace, rules_to_be_applied_edge_trace, idx, facts_to_be_applied_edge_trace, rule_trace_edge_atoms, store_interpretation_changes, num_ga, mode='rule', override=True)
 
 									update = u or update
+									if u and track_changes:
+										_mark_label_changed(changed_labels_edge, l, ipl)
 									# Update convergence params
 									if convergence_mode=='delta_bound':
 										bound_delta = max(bound_delta, changes)
 									else:
 										changes_cnt += changes
 
-						# Delete rules that have been applied from list by adding the index to list
-						rules_to_remove_idx.add(idx)
-
-				# Remove from rules to be applied and edges to be applied lists after coming out from loop
-				rules_to_be_applied_edge[:] = numba.typed.List([rules_to_be_applied_edge[i] for i in range(len(rules_to_be_applied_edge)) if i not in rules_to_remove_idx])
-				edges_to_be_added_edge_rule[:] = numba.typed.List([edges_to_be_added_edge_rule[i] for i in range(len(edges_to_be_added_edge_rule)) if i not in rules_to_remove_idx])
-				if atom_trace:
-					rules_to_be_applied_edge_trace[:] = numba.typed.List([rules_to_be_applied_edge_trace[i] for i in range(len(rules_to_be_applied_edge_trace)) if i not in rules_to_remove_idx])
-
 				# Fixed point
 				if update:
 					# Increase fp operator count
 					fp_cnt += 1
 
+					# In semi-naive mode, after the first grounding of the timestep we only ground rules whose body predicates changed
+					# If nodes or edges were added to the graph since the last grounding, all rules are grounded again
+					graph_size = len(nodes) + len(edges)
+					ground_all_rules = not semi_naive or first_grounding or graph_size != prev_graph_size
+					first_grounding = False
+					prev_graph_size = graph_size
+					if ground_all_rules:
+						rule_schedule = numba.typed.List([i for i in range(len(rules))])
+					else:
+						rule_schedule = _schedule_rules(changed_labels_node, changed_labels_edge, rules_by_label_node, rules_by_label_edge, always_scheduled, strata)
+					if grounding_cache_size > 0:
+						_bump_label_versions(label_versions_node, changed_labels_node)
+						_bump_label_versions(label_versions_edge, changed_labels_edge)
+
+					# Each rule is grounded by one task, or by one task per partition of the candidates of its head variable (grounding_partitions > 1)
+					# Tasks are merged in the order of the rule schedule and of the partitions
+					signatures = numba.typed.List.empty_list(numba.types.int64)
+					cache_hits = numba.typed.List.empty_list(numba.types.boolean)
+					for i in range(len(rule_schedule)):
+						signature = -1
+						if grounding_cache_size > 0:
+							signature = _grounding_signature(rules[rule_schedule[i]], label_versions_node, label_versions_edge, predicate_map_node, predicate_map_edge, graph_size)
+						signatures.append(signature)
+						cache_hits.append(signature >= 0 and signature == cached_signatures[rule_schedule[i]] if grounding_cache_size > 0 else False)
+					task_rules, task_partitions = _schedule_grounding_tasks(rules, rule_schedule, clause_orders, cache_hits, predicate_map_node, predicate_map_edge, nodes, closed_world_predicates, max_partitions)
+					task_node_rules = numba.typed.List([numba.typed.List.empty_list(node_applicable_rule_type) for _ in range(len(task_rules))])
+					task_edge_rules = numba.typed.List([numba.typed.List.empty_list(edge_applicable_rule_type) for _ in range(len(task_rules))])
+					task_grounded = numba.typed.List.empty_list(numba.types.boolean)
+
 					# Lists or threadsafe operations (when parallel is on)
-					rules_to_be_applied_node_threadsafe = numba.typed.List([numba.typed.List.empty_list(rules_to_be_applied_node_type) for _ in range(len(rules))])
-					rules_to_be_applied_edge_threadsafe = numba.typed.List([numba.typed.List.empty_list(rules_to_be_applied_edge_type) for _ in range(len(rules))])
+					rules_to_be_applied_node_threadsafe = numba.typed.List([numba.typed.List.empty_list(rules_to_be_applied_node_type) for _ in range(len(task_rules))])
+					rules_to_be_applied_edge_threadsafe = numba.typed.List([numba.typed.List.empty_list(rules_to_be_applied_edge_type) for _ in range(len(task_rules))])
 					if atom_trace:
-						rules_to_be_applied_node_trace_threadsafe = numba.typed.List([numba.typed.List.empty_list(rules_to_be_applied_trace_type) for _ in range(len(rules))])
-						rules_to_be_applied_edge_trace_threadsafe = numba.typed.List([numba.typed.List.empty_list(rules_to_be_applied_trace_type) for _ in range(len(rules))])
-					edges_to_be_added_edge_rule_threadsafe = numba.typed.List([numba.typed.List.empty_list(edges_to_be_added_type) for _ in range(len(rules))])
+						rules_to_be_applied_node_trace_threadsafe = numba.typed.List([numba.typed.List.empty_list(rules_to_be_applied_trace_type) for _ in range(len(task_rules))])
+						rules_to_be_applied_edge_trace_threadsafe = numba.typed.List([numba.typed.List.empty_list(rules_to_be_applied_trace_type) for _ in range(len(task_rules))])
+					edges_to_be_added_edge_rule_threadsafe = numba.typed.List([numba.typed.List.empty_list(edges_to_be_added_type) for _ in range(len(task_rules))])
 					# Threadsafe flags for in_loop and update within prange; merge after loop
 					in_loop_threadsafe = numba.typed.List.empty_list(numba.types.boolean)
 					update_threadsafe = numba.typed.List.empty_list(numba.types.boolean)
-					for _ in range(len(rules)):
+					for _ in range(len(task_rules)):
 						in_loop_threadsafe.append(False)
 						update_threadsafe.append(True)
-
-					for i in prange(len(rules)):
-						rule = rules[i]
-
-						# Only go through if the rule can be applied within the given timesteps, or we're running until convergence
-						delta_t = rule.get_delta()
-						if t + delta_t <= tmax or tmax == -1 or again:
-							applicable_node_rules, applicable_edge_rules = _ground_rule(rule, interpretations_node, interpretations_edge, predicate_map_node, predicate_map_edge, nodes, edges, neighbors, reverse_neighbors, atom_trace, allow_ground_rules, num_ga, t, head_functions, closed_world_predicates)
-
-							# Loop through applicable rules and add them to the rules to be applied for later or next fp operation
-							for applicable_rule in applicable_node_rules:
-								n, annotations, qualified_nodes, qualified_edges, _ = applicable_rule
-								# If there is an edge to add or the predicate doesn't exist or the interpretation is not static
-								if rule.get_target() not in interpretations_node[n].world or not interpretations_node[n].world[rule.get_target()].is_static():
-									bnd = annotate(annotation_functions, rule, annotations, rule.get_weights())
-									# Bound annotations in between 0 and 1
-									bnd_l = min(max(bnd[0], 0), 1)
-									bnd_u = min(max(bnd[1], 0), 1)
-									bnd = interval.closed(bnd_l, bnd_u)
-									max_rules_time = max(max_rules_time, t + delta_t)
-									rules_to_be_applied_node_threadsafe[i].append((numba.types.uint16(t + delta_t), n, rule.get_target(), bnd, rule.is_static_rule()))
-									if atom_trace:
-										rules_to_be_applied_node_trace_threadsafe[i].append((qualified_nodes, qualified_edges, rule.get_name()))
-
-									# If delta_t is zero we apply the rules and check if more are applicable
-									if delta_t == 0:
-										in_loop_threadsafe[i] = True
-										update_threadsafe[i] = False
-
-							for applicable_rule in applicable_edge_rules:
-								e, annotations, qualified_nodes, qualified_edges, edges_to_add = applicable_rule
-								# If there is an edge to add or the predicate doesn't exist or the interpretation is not static
-								if len(edges_to_add[0]) > 0 or rule.get_target() not in interpretations_edge[e].world or not interpretations_edge[e].world[rule.get_target()].is_static():
-									bnd = annotate(annotation_functions, rule, annotations, rule.get_weights())
-									# Bound annotations in between 0 and 1
-									bnd_l = min(max(bnd[0], 0), 1)
-									bnd_u = min(max(bnd[1], 0), 1)
-									bnd = interval.closed(bnd_l, bnd_u)
-									max_rules_time = max(max_rules_time, t+delta_t)
-									# edges_to_be_added_edge_rule.append(edges_to_add)
-									edges_to_be_added_edge_rule_threadsafe[i].append(edges_to_add)
-									rules_to_be_applied_edge_threadsafe[i].append((numba.types.uint16(t+delta_t), e, rule.get_target(), bnd, rule.is_static_rule()))
-									if atom_trace:
-										# rules_to_be_applied_edge_trace.append((qualified_nodes, qualified_edges, rule.get_name()))
-										rules_to_be_applied_edge_trace_threadsafe[i].append((qualified_nodes, qualified_edges, rule.get_name()))
-
-									# If delta_t is zero we apply the rules and check if more are applicable
-									if delta_t == 0:
-										in_loop_threadsafe[i] = True
-										update_threadsafe[i] = False
+						task_grounded.append(False)
+
+					# Tasks of rules that can add nodes or edges to the graph while grounding are run on their own and in order, so that the graph
+					# the other tasks read does not depend on how tasks are scheduled over threads (deterministic_parallel)
+					segment_start = 0
+					while segment_start < len(task_rules):
+						segment_end = _get_segment_end(task_rules, rule_schedule, adds_to_graph, segment_start)
+						for i in prange(segment_start, segment_end):
+							rule = rules[rule_schedule[task_rules[i]]]
+							clause_order = clause_orders[rule_schedule[task_rules[i]]]
+
+							# Only go through if the rule can be applied within the given timesteps, or we're running until convergence
+							delta_t = rule.get_delta()
+							if t + delta_t <= tmax or tmax == -1 or again:
+								# Reuse the groundings of the rule if its body predicates and the graph have not changed since they were cached
+								if cache_hits[task_rules[i]]:
+									applicable_node_rules, applicable_edge_rules = cached_node_rules[rule_schedule[task_rules[i]]], cached_edge_rules[rule_schedule[task_rules[i]]]
+								else:
+									applicable_node_rules, applicable_edge_rules = _ground_rule(rule, interpretations_node, interpretations_edge, predicate_map_node, predicate_map_edge, nodes, edges, neighbors, reverse_neighbors, atom_trace, allow_ground_rules, num_ga, t, head_functions, closed_world_predicates, clause_order, task_partitions[i])
+									task_node_rules[i] = applicable_node_rules
+									task_edge_rules[i] = applicable_edge_rules
+									task_grounded[i] = True
+
+								# Loop through applicable rules and add them to the rules to be applied for later or next fp operation
+								for applicable_rule in applicable_node_rules:
+									n, annotations, qualified_nodes, qualified_edges, _ = applicable_rule
+									# If there is an edge to add or the predicate doesn't exist or the interpretation is not static
+									if rule.get_target() not in interpretations_node[n].world or not interpretations_node[n].world[rule.get_target()].is_static():
+										bnd = annotate(annotation_functions, rule, annotations, rule.get_weights())
+										# Bound annotations in between 0 and 1
+										bnd_l = min(max(bnd[0], 0), 1)
+										bnd_u = min(max(bnd[1], 0), 1)
+										bnd = interval.closed(bnd_l, bnd_u)
+										max_rules_time = max(max_rules_time, t + delta_t)
+										rules_to_be_applied_node_threadsafe[i].append((numba.types.uint16(t + delta_t), n, rule.get_target(), bnd, rule.is_static_rule()))
+										if atom_trace:
+											rules_to_be_applied_node_trace_threadsafe[i].append((qualified_nodes, qualified_edges, rule.get_name()))
+
+										# If delta_t is zero we apply the rules and check if more are applicable
+										if delta_t == 0:
+											in_loop_threadsafe[i] = True
+											update_threadsafe[i] = False
+
+								for applicable_rule in applicable_edge_rules:
+									e, annotations, qualified_nodes, qualified_edges, edges_to_add = applicable_rule
+									# If there is an edge to add or the predicate doesn't exist or the interpretation is not static
+									if len(edges_to_add[0]) > 0 or rule.get_target() not in interpretations_edge[e].world or not interpretations_edge[e].world[rule.get_target()].is_static():
+										bnd = annotate(annotation_functions, rule, annotations, rule.get_weights())
+										# Bound annotations in between 0 and 1
+										bnd_l = min(max(bnd[0], 0), 1)
+										bnd_u = min(max(bnd[1], 0), 1)
+										bnd = interval.closed(bnd_l, bnd_u)
+										max_rules_time = max(max_rules_time, t+delta_t)
+										# edges_to_be_added_edge_rule.append(edges_to_add)
+										edges_to_be_added_edge_rule_threadsafe[i].append(edges_to_add)
+										rules_to_be_applied_edge_threadsafe[i].append((numba.types.uint16(t+delta_t), e, rule.get_target(), bnd, rule.is_static_rule()))
+										if atom_trace:
+											# rules_to_be_applied_edge_trace.append((qualified_nodes, qualified_edges, rule.get_name()))
+											rules_to_be_applied_edge_trace_threadsafe[i].append((qualified_nodes, qualified_edges, rule.get_name()))
+
+										# If delta_t is zero we apply the rules and check if more are applicable
+										if delta_t == 0:
+											in_loop_threadsafe[i] = True
+											update_threadsafe[i] = False
+						segment_start = segment_end
+
+					if grounding_cache_size > 0:
+						_cache_groundings(cached_signatures, cached_node_rules, cached_edge_rules, rule_schedule, signatures, task_rules, task_grounded, task_node_rules, task_edge_rules)
+						cache_clock += 1
+						_evict_groundings(cached_signatures, cached_last_used, cached_node_rules, cached_edge_rules, rule_schedule, cache_clock, grounding_cache_size)
 
 					# Update lists after parallel run
-					for i in range(len(rules)):
+					prev_len_node, prev_len_edge = len(rules_to_be_applied_node), len(rules_to_be_applied_edge)
+					for i in range(len(task_rules)):
 						if len(rules_to_be_applied_node_threadsafe[i]) > 0:
 							rules_to_be_applied_node.extend(rules_to_be_applied_node_threadsafe[i])
 						if len(rules_to_be_applied_edge_threadsafe[i]) > 0:
@@ -618,16 +837,33 @@ class Interpretation:
 								rules_to_be_applied_edge_trace.extend(rules_to_be_applied_edge_trace_threadsafe[i])
 						if len(edges_to_be_added_edge_rule_threadsafe[i]) > 0:
 							edges_to_be_added_edge_rule.extend(edges_to_be_added_edge_rule_threadsafe[i])
+					_queue_rules(rule_queue_node, rules_to_be_applied_node, prev_len_node, t)
+					_queue_rules(rule_queue_edge, rules_to_be_applied_edge, prev_len_edge, t)
 
 					# Merge threadsafe flags for in_loop and update
 					in_loop = in_loop
 					update = update
-					for i in range(len(rules)):
+					for i in range(len(task_rules)):
 						if in_loop_threadsafe[i]:
 							in_loop = True
 						if not update_threadsafe[i]:
 							update = False
 
+					# Changes have been seen by all rules that depend on them
+					changed_labels_node.clear()
+					changed_labels_edge.clear()
+
+			# Once more than half of the rules in a list have been applied, remove them and index the remaining rules again
+			if applied_rules_node > len(rules_to_be_applied_node) // 2:
+				_remove_applied_rules(rules_to_be_applied_node, rules_to_be_applied_node_trace, t_start, t, atom_trace)
+				rule_queue_node = _build_rule_queue(rules_to_be_applied_node, t + 1)
+				applied_rules_node = 0
+			if applied_rules_edge > len(rules_to_be_applied_edge) // 2:
+				keep = _remove_applied_rules(rules_to_be_applied_edge, rules_to_be_applied_edge_trace, t_start, t, atom_trace)
+				_keep_items(edges_to_be_added_edge_rule, keep)
+				rule_queue_edge = _build_rule_queue(rules_to_be_applied_edge, t + 1)
+				applied_rules_edge = 0
+
 			# Check for convergence after each timestep (perfect convergence or convergence specified by user)
 			# Check number of changed interpretations or max bound change
 			# User specified convergence
@@ -660,6 +896,15 @@ class Interpretation:
 			t += 1
 			num_ga.append(num_ga[-1])
 
+		# Remove the facts that have been applied from the lists of facts to be applied
+		_remove_applied_facts(facts_to_be_applied_node, facts_to_be_applied_node_trace, t_start, t - 1, atom_trace)
+		_remove_applied_facts(facts_to_be_applied_edge, facts_to_be_applied_edge_trace, t_start, t - 1, atom_trace)
+
+		# Remove the rules that have been applied from the lists of rules to be applied
+		_remove_applied_rules(rules_to_be_applied_node, rules_to_be_applied_node_trace, t_start, t - 1, atom_trace)
+		keep = _remove_applied_rules(rules_to_be_applied_edge, rules_to_be_applied_edge_trace, t_start, t - 1, atom_trace)
+		_keep_items(edges_to_be_added_edge_rule, keep)
+
 		return fp_cnt, t
 
 	def add_edge(self, edge, l):
@@ -668,7 +913,7 @@ class Interpretation:
 
 	def add_node(self, node, labels):
 		# This function is useful for pyreason gym, called externally
-		if node not in self.nodes:
+		if node not in self.interpretations_node:
 			_add_node(node, self.neighbors, self.reverse_neighbors, self.nodes, self.interpretations_node)
 			for l in labels:
 				self.interpretations_node[node].world[label.Label(l)] = interval.closed(0, 1)
@@ -783,8 +1028,24 @@ class Interpretation:
 				return False if return_bool else (0, 0)
 
 
+
+# Serial and parallel flavours of the reason kernel, compiled on first use
+_reason_kernels = {}
+
+
+def _get_reason_kernel(parallel):
+	if parallel not in _reason_kernels:
+		# Numba names cache files after the qualified name of the function, the parallel flavour gets a name of its own
+		# so that the two flavours are not loaded from each other's cache
+		py_func = Interpretation.reason
+		if parallel:
+			py_func = types.FunctionType(py_func.__code__, py_func.__globals__, py_func.__name__, py_func.__defaults__, py_func.__closure__)
+			py_func.__qualname__ = 'Interpretation.reason_parallel'
+		_reason_kernels[parallel] = numba.njit(cache=True, parallel=parallel)(py_func)
+	return _reason_kernels[parallel]
+
 @numba.njit(cache=True)
-def _ground_rule(rule, interpretations_node, interpretations_edge, predicate_map_node, predicate_map_edge, nodes, edges, neighbors, reverse_neighbors, atom_trace, allow_ground_rules, num_ga, t, head_functions, closed_world_predicates):
+def _ground_rule(rule, interpretations_node, interpretations_edge, predicate_map_node, predicate_map_edge, nodes, edges, neighbors, reverse_neighbors, atom_trace, allow_ground_rules, num_ga, t, head_functions, closed_world_predicates, clause_order, head_partition=None):
 	# Extract rule params
 	rule_type = rule.get_type()
 	head_variables = rule.get_head_variables()
@@ -817,11 +1078,15 @@ def _ground_rule(rule, interpretations_node, interpretations_edge, predicate_map
 	dependency_graph_neighbors = numba.typed.Dict.empty(key_type=node_type, value_type=list_of_nodes)
 	dependency_graph_reverse_neighbors = numba.typed.Dict.empty(key_type=node_type, value_type=list_of_nodes)
 
-	nodes_set = set(nodes)
-	edges_set = set(edges)
+	# When the grounding of the rule is split into tasks, the head variable starts out with a partition of its candidates
+	if head_partition is not None and len(head_partition) > 0:
+		groundings[head_var_1] = head_partition
 
+	# The interpretations are keyed by the nodes and edges of the graph, and are used to check membership
+	# Clauses are grounded in the planned order. Thresholds, traces and annotations keep the order of the rule
 	satisfaction = True
-	for i, clause in enumerate(clauses):
+	for i in clause_order:
+		clause = clauses[i]
 		# Unpack clause variables
 		clause_type = clause[0]
 		clause_label = clause[1]
@@ -835,7 +1100,7 @@ def _ground_rule(rule, interpretations_node, interpretations_edge, predicate_map
 
 			# Get subset of nodes that can be used to ground the variable
 			# If we allow ground atoms, we can use the nodes directly
-			if allow_ground_rules and clause_var_1 in nodes_set:
+			if allow_ground_rules and clause_var_1 in interpretations_node:
 				grounding = numba.typed.List([clause_var_1])
 			else:
 				grounding = get_rule_node_clause_grounding(clause_var_1, groundings, predicate_map_node, clause_label, nodes)
@@ -862,14 +1127,14 @@ def _ground_rule(rule, interpretations_node, interpretations_edge, predicate_map
 
 			# Get subset of edges that can be used to ground the variables
 			# If we allow ground atoms, we can use the nodes directly
-			if allow_ground_rules and (clause_var_1, clause_var_2) in edges_set:
+			if allow_ground_rules and (clause_var_1, clause_var_2) in interpretations_edge:
 				grounding = numba.typed.List([(clause_var_1, clause_var_2)])
 			else:
 				# Pre-populate groundings for any variable that matches an existing node (partial grounding)
 				if allow_ground_rules:
-					if clause_var_1 in nodes_set and clause_var_1 not in groundings:
+					if clause_var_1 in interpretations_node and clause_var_1 not in groundings:
 						groundings[clause_var_1] = numba.typed.List([clause_var_1])
-					if clause_var_2 in nodes_set and clause_var_2 not in groundings:
+					if clause_var_2 in interpretations_node and clause_var_2 not in groundings:
 						groundings[clause_var_2] = numba.typed.List([clause_var_2])
 				grounding = get_rule_edge_clause_grounding(clause_var_1, clause_var_2, groundings, groundings_edges, neighbors, reverse_neighbors, predicate_map_edge, clause_label, edges)
 
@@ -925,6 +1190,12 @@ def _ground_rule(rule, interpretations_node, interpretations_edge, predicate_map
 	# Then continue to setup any edges to be added and annotations
 	# Fill out the rules to be applied lists
 	if satisfaction:
+		# Refinement only checks the clauses pairwise. When the edge clauses form a cycle between the variables, a grounding can
+		# satisfy each clause without a grounding of the whole body. Each head grounding is then checked with a generic join
+		# Clauses with custom thresholds count groundings instead of joining them, so these rules are left as they are
+		join_body = _is_cyclic_body(groundings_edges) and _has_default_thresholds(thresholds)
+		join_clauses, join_edges, join_forward, join_reverse, join_nodes = _build_join_index(groundings, groundings_edges, join_body)
+
 		# Create temp grounding containers to verify if the head groundings are valid (only for edge rules)
 		# Setup edges to be added and fill rules to be applied
 		# Setup traces and inputs for annotation function
@@ -940,7 +1211,7 @@ def _ground_rule(rule, interpretations_node, interpretations_edge, predicate_map
 				groundings[head_var_1] = head_var_groundings
 
 			# If there is no grounding for head_var_1, we treat it as a ground atom and add it to the graph
-			head_var_1_in_nodes = head_var_1 in nodes
+			head_var_1_in_nodes = head_var_1 in interpretations_node
 			add_head_var_node_to_graph = False
 			if allow_ground_rules and head_var_1_in_nodes:
 				groundings[head_var_1] = numba.typed.List([head_var_1])
@@ -949,16 +1220,38 @@ def _ground_rule(rule, interpretations_node, interpretations_edge, predicate_map
 					add_head_var_node_to_graph = True
 				groundings[head_var_1] = numba.typed.List([head_var_1])
 
-			for head_grounding in groundings[head_var_1]:
+			# Check for satisfaction one more time in case the refining process has changed the groundings
+			# The groundings are the same for every head grounding, so this is done once for all of them
+			head_groundings = groundings[head_var_1]
+			if len(head_groundings) > 0:
+				satisfaction = check_all_clause_satisfaction(interpretations_node, interpretations_edge, clauses, thresholds, groundings, groundings_edges, closed_world_predicates)
+				if not satisfaction:
+					head_groundings = numba.typed.List.empty_list(node_type)
+
+			# Index the edge groundings of the clauses with the head variable by the head node, to collect the trace and annotations of each head grounding
+			head_clause_partitions = numba.typed.List.empty_list(numba.types.DictType(node_type, list_of_edges))
+			for clause in clauses:
+				clause_variables = clause[2]
+				if clause[0] == 'edge' and (atom_trace or ann_fn != '') and len(head_groundings) > 0:
+					if clause_variables[0] == head_var_1:
+						head_clause_partitions.append(_partition_edge_groundings(groundings_edges[(clause_variables[0], clause_variables[1])], 0))
+						continue
+					elif clause_variables[1] == head_var_1:
+						head_clause_partitions.append(_partition_edge_groundings(groundings_edges[(clause_variables[0], clause_variables[1])], 1))
+						continue
+				head_clause_partitions.append(numba.typed.Dict.empty(key_type=node_type, value_type=list_of_edges))
+
+			for head_grounding in head_groundings:
 				qualified_nodes = numba.typed.List.empty_list(numba.typed.List.empty_list(node_type))
 				qualified_edges = numba.typed.List.empty_list(numba.typed.List.empty_list(edge_type))
 				annotations = numba.typed.List.empty_list(numba.typed.List.empty_list(interval.interval_type))
 				edges_to_be_added = (numba.typed.List.empty_list(node_type), numba.typed.List.empty_list(node_type), rule_edges[-1])
 
-				# Check for satisfaction one more time in case the refining process has changed the groundings
-				satisfaction = check_all_clause_satisfaction(interpretations_node, interpretations_edge, clauses, thresholds, groundings, groundings_edges, closed_world_predicates)
-				if not satisfaction:
-					continue
+				if join_body:
+					assignment = numba.typed.Dict.empty(key_type=numba.types.string, value_type=node_type)
+					assignment[head_var_1] = head_grounding
+					if not _has_join_witness(assignment, join_clauses, join_edges, join_forward, join_reverse, join_nodes):
+						continue
 
 				for i, clause in enumerate(clauses):
 					clause_type = clause[0]
@@ -992,25 +1285,17 @@ def _ground_rule(rule, interpretations_node, interpretations_edge, predicate_map
 						if atom_trace:
 							# Cases: Both equal, one equal, none equal
 							qualified_nodes.append(numba.typed.List.empty_list(node_type))
-							if clause_var_1 == head_var_1:
-								es = numba.typed.List([e for e in groundings_edges[(clause_var_1, clause_var_2)] if e[0] == head_grounding])
-								qualified_edges.append(es)
-							elif clause_var_2 == head_var_1:
-								es = numba.typed.List([e for e in groundings_edges[(clause_var_1, clause_var_2)] if e[1] == head_grounding])
+							if clause_var_1 == head_var_1 or clause_var_2 == head_var_1:
+								es = numba.typed.List(_get_partition(head_clause_partitions[i], head_grounding))
 								qualified_edges.append(es)
 							else:
 								qualified_edges.append(numba.typed.List(groundings_edges[(clause_var_1, clause_var_2)]))
 						# 2.
 						if ann_fn != '':
 							a = numba.typed.List.empty_list(interval.interval_type)
-							if clause_var_1 == head_var_1:
-								for e in groundings_edges[(clause_var_1, clause_var_2)]:
-									if e[0] == head_grounding:
-										a.append(interpretations_edge[e].world[clause_label])
-							elif clause_var_2 == head_var_1:
-								for e in groundings_edges[(clause_var_1, clause_var_2)]:
-									if e[1] == head_grounding:
-										a.append(interpretations_edge[e].world[clause_label])
+							if clause_var_1 == head_var_1 or clause_var_2 == head_var_1:
+								for e in _get_partition(head_clause_partitions[i], head_grounding):
+									a.append(interpretations_edge[e].world[clause_label])
 							else:
 								for qe in groundings_edges[(clause_var_1, clause_var_2)]:
 									a.append(interpretations_edge[qe].world[clause_label])
@@ -1038,8 +1323,8 @@ def _ground_rule(rule, interpretations_node, interpretations_edge, predicate_map
 				groundings[head_var_2] = head_var_groundings[1]
 
 			# If there is no grounding for head_var_1 or head_var_2, we treat it as a ground atom and add it to the graph
-			head_var_1_in_nodes = head_var_1 in nodes
-			head_var_2_in_nodes = head_var_2 in nodes
+			head_var_1_in_nodes = head_var_1 in interpretations_node
+			head_var_2_in_nodes = head_var_2 in interpretations_node
 			add_head_var_1_node_to_graph = False
 			add_head_var_2_node_to_graph = False
 			add_head_edge_to_graph = False
@@ -1069,15 +1354,34 @@ def _ground_rule(rule, interpretations_node, interpretations_edge, predicate_map
 
 			# Prepare the edges that we will loop over.
 			# For infer edges we loop over each combination pair
-			# Else we loop over the valid edges in the graph
-			valid_edge_groundings = numba.typed.List.empty_list(edge_type)
-			for g1 in head_var_1_groundings:
-				for g2 in head_var_2_groundings:
-					if infer_edges:
+			# Else we loop over the valid edges in the graph, found from the neighbors of the head groundings
+			if infer_edges:
+				valid_edge_groundings = numba.typed.List.empty_list(edge_type)
+				for g1 in head_var_1_groundings:
+					for g2 in head_var_2_groundings:
 						valid_edge_groundings.append((g1, g2))
-					else:
-						if (g1, g2) in edges_set:
-							valid_edge_groundings.append((g1, g2))
+			else:
+				valid_edge_groundings = _get_head_edge_groundings(head_var_1_groundings, head_var_2_groundings, neighbors, reverse_neighbors, interpretations_edge)
+
+			# Containers to keep track of groundings to make sure that the edge pair is valid
+			# We do this because we cannot know beforehand the edge matches from source groundings to target groundings
+			# They are allocated once. For each head grounding only the variables and edges that refinement can reach from the
+			# head variables are reset, the rest stays the same for every head grounding
+			temp_groundings = groundings.copy()
+			temp_groundings_edges = groundings_edges.copy()
+			scope_variables, scope_edges = _get_refinement_scope(head_variables, groundings_edges, dependency_graph_neighbors, dependency_graph_reverse_neighbors)
+
+			# Partition the edge groundings of the clauses with a head variable by the node in the head variable's position
+			# so that the edges of each head grounding are looked up instead of filtered from the whole list
+			head_clause_edges = numba.typed.List.empty_list(edge_type)
+			head_clause_partitions = numba.typed.List.empty_list(numba.types.DictType(node_type, list_of_edges))
+			for c1, c2 in groundings_edges:
+				if c1 == head_var_1 or c1 == head_var_2:
+					head_clause_edges.append((c1, c2))
+					head_clause_partitions.append(_partition_edge_groundings(groundings_edges[(c1, c2)], 0))
+				elif c2 == head_var_1 or c2 == head_var_2:
+					head_clause_edges.append((c1, c2))
+					head_clause_partitions.append(_partition_edge_groundings(groundings_edges[(c1, c2)], 1))
 
 			# Loop through the head variable groundings
 			for valid_e in valid_edge_groundings:
@@ -1087,28 +1391,26 @@ def _ground_rule(rule, interpretations_node, interpretations_edge, predicate_map
 				annotations = numba.typed.List.empty_list(numba.typed.List.empty_list(interval.interval_type))
 				edges_to_be_added = (numba.typed.List.empty_list(node_type), numba.typed.List.empty_list(node_type), rule_edges[-1])
 
-				# Containers to keep track of groundings to make sure that the edge pair is valid
-				# We do this because we cannot know beforehand the edge matches from source groundings to target groundings
-				temp_groundings = groundings.copy()
-				temp_groundings_edges = groundings_edges.copy()
+				# Reset the temp groundings that the previous head grounding refined
+				for v in scope_variables:
+					temp_groundings[v] = groundings[v]
+				for clause_edge in scope_edges:
+					temp_groundings_edges[clause_edge] = groundings_edges[clause_edge]
 
 				# Refine the temp groundings for the specific edge head grounding
 				# We update the edge collection as well depending on if there's a match between the clause variables and head variables
 				temp_groundings[head_var_1] = numba.typed.List([head_var_1_grounding])
 				temp_groundings[head_var_2] = numba.typed.List([head_var_2_grounding])
-				for c1, c2 in temp_groundings_edges.keys():
+				for k in range(len(head_clause_edges)):
+					c1, c2 = head_clause_edges[k]
 					if c1 == head_var_1 and c2 == head_var_2:
-						temp_groundings_edges[(c1, c2)] = numba.typed.List([e for e in temp_groundings_edges[(c1, c2)] if e == (head_var_1_grounding, head_var_2_grounding)])
+						temp_groundings_edges[(c1, c2)] = numba.typed.List([e for e in _get_partition(head_clause_partitions[k], head_var_1_grounding) if e[1] == head_var_2_grounding])
 					elif c1 == head_var_2 and c2 == head_var_1:
-						temp_groundings_edges[(c1, c2)] = numba.typed.List([e for e in temp_groundings_edges[(c1, c2)] if e == (head_var_2_grounding, head_var_1_grounding)])
-					elif c1 == head_var_1:
-						temp_groundings_edges[(c1, c2)] = numba.typed.List([e for e in temp_groundings_edges[(c1, c2)] if e[0] == head_var_1_grounding])
-					elif c2 == head_var_1:
-						temp_groundings_edges[(c1, c2)] = numba.typed.List([e for e in temp_groundings_edges[(c1, c2)] if e[1] == head_var_1_grounding])
-					elif c1 == head_var_2:
-						temp_groundings_edges[(c1, c2)] = numba.typed.List([e for e in temp_groundings_edges[(c1, c2)] if e[0] == head_var_2_grounding])
-					elif c2 == head_var_2:
-						temp_groundings_edges[(c1, c2)] = numba.typed.List([e for e in temp_groundings_edges[(c1, c2)] if e[1] == head_var_2_grounding])
+						temp_groundings_edges[(c1, c2)] = numba.typed.List([e for e in _get_partition(head_clause_partitions[k], head_var_2_grounding) if e[1] == head_var_1_grounding])
+					elif c1 == head_var_1 or c2 == head_var_1:
+						temp_groundings_edges[(c1, c2)] = _get_partition(head_clause_partitions[k], head_var_1_grounding)
+					else:
+						temp_groundings_edges[(c1, c2)] = _get_partition(head_clause_partitions[k], head_var_2_grounding)
 
 				refine_groundings(head_variables, temp_groundings, temp_groundings_edges, dependency_graph_neighbors, dependency_graph_reverse_neighbors)
 
@@ -1118,6 +1420,12 @@ def _ground_rule(rule, interpretations_node, interpretations_edge, predicate_map
 
 				if not satisfaction:
 					continue
+				if join_body:
+					assignment = numba.typed.Dict.empty(key_type=numba.types.string, value_type=node_type)
+					assignment[head_var_1] = head_var_1_grounding
+					assignment[head_var_2] = head_var_2_grounding
+					if not _has_join_witness(assignment, join_clauses, join_edges, join_forward, join_reverse, join_nodes):
+						continue
 
 				if infer_edges:
 					# Prevent self loops while inferring edges if the clause variables are not the same
@@ -1245,20 +1553,23 @@ def check_all_clause_satisfaction(interpretations_node, interpretations_edge, cl
 		clause_variables = clause[2]
 		clause_bnd = clause[3]
 
+		# The qualified groundings are not needed here, so each clause stops scanning once its threshold is decided
 		if clause_type == 'node':
 			clause_var_1 = clause_variables[0]
-			qualified_groundings = get_qualified_node_groundings(interpretations_node, groundings[clause_var_1], clause_label, clause_bnd, closed_world_predicates)
-			satisfaction = check_node_grounding_threshold_satisfaction(interpretations_node, groundings[clause_var_1], qualified_groundings, clause_label, thresholds[i], closed_world_predicates) and satisfaction
+			satisfaction = check_node_clause_satisfaction(interpretations_node, groundings[clause_var_1], clause_label, clause_bnd, thresholds[i], closed_world_predicates)
 		elif clause_type == 'edge':
 			clause_var_1, clause_var_2 = clause_variables[0], clause_variables[1]
-			qualified_groundings = get_qualified_edge_groundings(interpretations_edge, groundings_edges[(clause_var_1, clause_var_2)], clause_label, clause_bnd, closed_world_predicates)
-			satisfaction = check_edge_grounding_threshold_satisfaction(interpretations_edge, groundings_edges[(clause_var_1, clause_var_2)], qualified_groundings, clause_label, thresholds[i], closed_world_predicates) and satisfaction
+			satisfaction = check_edge_clause_satisfaction(interpretations_edge, groundings_edges[(clause_var_1, clause_var_2)], clause_label, clause_bnd, thresholds[i], closed_world_predicates)
+
+		if not satisfaction:
+			break
 	return satisfaction
 
 
 @numba.njit(cache=True)
 def refine_groundings(clause_variables, groundings, groundings_edges, dependency_graph_neighbors, dependency_graph_reverse_neighbors):
 	# Loop through the dependency graph and refine the groundings that have connections
+	# Each refinement is a semi-join of the edge groundings with a hash set of the refined variable's groundings
 	all_variables_refined = numba.typed.List(clause_variables)
 	variables_just_refined = numba.typed.List(clause_variables)
 	new_variables_refined = numba.typed.List.empty_list(numba.types.string)
@@ -1268,7 +1579,7 @@ def refine_groundings(clause_variables, groundings, groundings_edges, dependency
 			if refined_variable in dependency_graph_neighbors:
 				for neighbor in dependency_graph_neighbors[refined_variable]:
 					old_edge_groundings = groundings_edges[(refined_variable, neighbor)]
-					new_node_groundings = groundings[refined_variable]
+					new_node_groundings = set(groundings[refined_variable])
 
 					# Delete old groundings for the variable being refined
 					del groundings[neighbor]
@@ -1290,7 +1601,7 @@ def refine_groundings(clause_variables, groundings, groundings_edges, dependency
 			if refined_variable in dependency_graph_reverse_neighbors:
 				for reverse_neighbor in dependency_graph_reverse_neighbors[refined_variable]:
 					old_edge_groundings = groundings_edges[(reverse_neighbor, refined_variable)]
-					new_node_groundings = groundings[refined_variable]
+					new_node_groundings = set(groundings[refined_variable])
 
 					# Delete old groundings for the variable being refined
 					del groundings[reverse_neighbor]
@@ -1314,6 +1625,274 @@ def refine_groundings(clause_variables, groundings, groundings_edges, dependency
 		new_variables_refined.clear()
 
 
+@numba.njit(cache=True)
+def _get_head_edge_groundings(head_var_1_groundings, head_var_2_groundings, neighbors, reverse_neighbors, interpretations_edge):
+	# The edges of the graph between a grounding of the first and a grounding of the second head variable
+	# Walks the neighbors of the smaller side instead of checking every pair. The edges are in the same order as the pairs
+	# (first head variable, then second head variable), including repeated groundings
+	valid_edge_groundings = numba.typed.List.empty_list(edge_type)
+	if len(head_var_1_groundings) == 0 or len(head_var_2_groundings) == 0:
+		return valid_edge_groundings
+
+	# Positions of each grounding of the second head variable
+	positions_2 = numba.typed.Dict.empty(key_type=node_type, value_type=list_of_ints)
+	for j in range(len(head_var_2_groundings)):
+		g2 = head_var_2_groundings[j]
+		if g2 not in positions_2:
+			positions_2[g2] = numba.typed.List.empty_list(numba.types.int64)
+		positions_2[g2].append(j)
+
+	if len(head_var_1_groundings) <= len(head_var_2_groundings):
+		for g1 in head_var_1_groundings:
+			if g1 not in neighbors:
+				continue
+			matches = numba.typed.List.empty_list(numba.types.int64)
+			for g2 in neighbors[g1]:
+				if g2 in positions_2 and (g1, g2) in interpretations_edge:
+					matches.extend(positions_2[g2])
+			matches.sort()
+			for j in matches:
+				valid_edge_groundings.append((g1, head_var_2_groundings[j]))
+	else:
+		# Collect the positions of the targets of each source while going through the second head variable in order
+		head_var_1_set = set(head_var_1_groundings)
+		matches_1 = numba.typed.Dict.empty(key_type=node_type, value_type=list_of_ints)
+		for j in range(len(head_var_2_groundings)):
+			g2 = head_var_2_groundings[j]
+			if g2 not in reverse_neighbors:
+				continue
+			for g1 in reverse_neighbors[g2]:
+				if g1 in head_var_1_set and (g1, g2) in interpretations_edge:
+					if g1 not in matches_1:
+						matches_1[g1] = numba.typed.List.empty_list(numba.types.int64)
+					matches_1[g1].append(j)
+		for g1 in head_var_1_groundings:
+			if g1 in matches_1:
+				for j in matches_1[g1]:
+					valid_edge_groundings.append((g1, head_var_2_groundings[j]))
+	return valid_edge_groundings
+
+
+@numba.njit(cache=True)
+def _get_refinement_scope(head_variables, groundings_edges, dependency_graph_neighbors, dependency_graph_reverse_neighbors):
+	# The variables and edge clauses that refining from the head variables can change. These are the ones connected to the head variables
+	scope_variables = numba.typed.List(head_variables)
+	i = 0
+	while i < len(scope_variables):
+		v = scope_variables[i]
+		if v in dependency_graph_neighbors:
+			for neighbor in dependency_graph_neighbors[v]:
+				if neighbor not in scope_variables:
+					scope_variables.append(neighbor)
+		if v in dependency_graph_reverse_neighbors:
+			for reverse_neighbor in dependency_graph_reverse_neighbors[v]:
+				if reverse_neighbor not in scope_variables:
+					scope_variables.append(reverse_neighbor)
+		i += 1
+
+	scope_edges = numba.typed.List.empty_list(edge_type)
+	for c1, c2 in groundings_edges:
+		if c1 in scope_variables:
+			scope_edges.append((c1, c2))
+	return scope_variables, scope_edges
+
+
+@numba.njit(cache=True)
+def _partition_edge_groundings(edge_groundings, position):
+	# Group the edges by their source (position 0) or target (position 1), keeping the order of the edges
+	partition = numba.typed.Dict.empty(key_type=node_type, value_type=list_of_edges)
+	for e in edge_groundings:
+		n = e[position]
+		if n not in partition:
+			partition[n] = numba.typed.List.empty_list(edge_type)
+		partition[n].append(e)
+	return partition
+
+
+@numba.njit(cache=True)
+def _get_partition(partition, n):
+	if n in partition:
+		return partition[n]
+	return numba.typed.List.empty_list(edge_type)
+
+
+@numba.njit(cache=True)
+def _is_cyclic_body(groundings_edges):
+	# The edge clauses connect the variables of the body. The body is cyclic if these connections (taken undirected) contain a cycle
+	# Two clauses between the same variables or a clause from a variable to itself also form a cycle
+	roots = numba.typed.Dict.empty(key_type=numba.types.string, value_type=numba.types.string)
+	for v1, v2 in groundings_edges:
+		r1 = _find_root(roots, v1)
+		r2 = _find_root(roots, v2)
+		if r1 == r2:
+			return True
+		roots[r1] = r2
+	return False
+
+
+@numba.njit(cache=True)
+def _find_root(roots, v):
+	while v in roots:
+		v = roots[v]
+	return v
+
+
+@numba.njit(cache=True)
+def _build_join_index(groundings, groundings_edges, join_body):
+	# Hash index of the edge groundings of each edge clause, by source and by target, used by the generic join
+	join_clauses = numba.typed.List.empty_list(edge_type)
+	join_edges = numba.typed.List.empty_list(numba.types.DictType(edge_type, numba.types.boolean))
+	join_forward = numba.typed.List.empty_list(numba.types.DictType(node_type, list_of_nodes))
+	join_reverse = numba.typed.List.empty_list(numba.types.DictType(node_type, list_of_nodes))
+	join_nodes = numba.typed.Dict.empty(key_type=numba.types.string, value_type=numba.types.DictType(node_type, numba.types.boolean))
+	if not join_body:
+		return join_clauses, join_edges, join_forward, join_reverse, join_nodes
+
+	for clause_vars in groundings_edges:
+		edge_set = numba.typed.Dict.empty(key_type=edge_type, value_type=numba.types.boolean)
+		forward = numba.typed.Dict.empty(key_type=node_type, value_type=list_of_nodes)
+		reverse = numba.typed.Dict.empty(key_type=node_type, value_type=list_of_nodes)
+		for e in groundings_edges[clause_vars]:
+			if e in edge_set:
+				continue
+			edge_set[e] = True
+			if e[0] not in forward:
+				forward[e[0]] = numba.typed.List.empty_list(node_type)
+			forward[e[0]].append(e[1])
+			if e[1] not in reverse:
+				reverse[e[1]] = numba.typed.List.empty_list(node_type)
+			reverse[e[1]].append(e[0])
+		join_clauses.append(clause_vars)
+		join_edges.append(edge_set)
+		join_forward.append(forward)
+		join_reverse.append(reverse)
+
+		for v in clause_vars:
+			if v not in join_nodes:
+				node_set = numba.typed.Dict.empty(key_type=node_type, value_type=numba.types.boolean)
+				for n in groundings[v]:
+					node_set[n] = True
+				join_nodes[v] = node_set
+	return join_clauses, join_edges, join_forward, join_reverse, join_nodes
+
+
+@numba.njit(cache=True)
+def _join_variable_order(assignment, join_clauses):
+	# Variables are joined in breadth first order from the assigned (head) variables, so that each variable is
+	# constrained by the clauses to the variables before it. A disconnected part of the body starts with any of its variables
+	order = numba.typed.List.empty_list(numba.types.string)
+	seen = numba.typed.Dict.empty(key_type=numba.types.string, value_type=numba.types.boolean)
+	for v in assignment:
+		seen[v] = True
+	while True:
+		progress = False
+		unseen = ''
+		for v1, v2 in join_clauses:
+			if v1 in seen and v2 not in seen:
+				seen[v2] = True
+				order.append(v2)
+				progress = True
+			elif v2 in seen and v1 not in seen:
+				seen[v1] = True
+				order.append(v1)
+				progress = True
+			elif v1 not in seen and unseen == '':
+				unseen = v1
+		if not progress:
+			if unseen == '':
+				break
+			seen[unseen] = True
+			order.append(unseen)
+	return order
+
+
+@numba.njit(cache=True)
+def _join_candidates(v, assignment, join_clauses, join_edges, join_forward, join_reverse, join_nodes):
+	# Intersect the groundings of v allowed by every clause between v and an assigned variable
+	# Start from the shortest neighbor list and probe the other clauses with hash lookups
+	base = numba.typed.List.empty_list(node_type)
+	has_base = False
+	for k in range(len(join_clauses)):
+		v1, v2 = join_clauses[k]
+		if v1 == v and v2 != v and v2 in assignment:
+			a = assignment[v2]
+			neighbor_list = join_reverse[k][a] if a in join_reverse[k] else numba.typed.List.empty_list(node_type)
+		elif v2 == v and v1 != v and v1 in assignment:
+			a = assignment[v1]
+			neighbor_list = join_forward[k][a] if a in join_forward[k] else numba.typed.List.empty_list(node_type)
+		else:
+			continue
+		if not has_base or len(neighbor_list) < len(base):
+			base = neighbor_list
+			has_base = True
+	if not has_base:
+		for n in join_nodes[v]:
+			base.append(n)
+
+	candidates = numba.typed.List.empty_list(node_type)
+	for c in base:
+		if c not in join_nodes[v]:
+			continue
+		valid = True
+		for k in range(len(join_clauses)):
+			v1, v2 = join_clauses[k]
+			if v1 == v and v2 == v:
+				valid = (c, c) in join_edges[k]
+			elif v1 == v and v2 in assignment:
+				valid = (c, assignment[v2]) in join_edges[k]
+			elif v2 == v and v1 in assignment:
+				valid = (assignment[v1], c) in join_edges[k]
+			if not valid:
+				break
+		if valid:
+			candidates.append(c)
+	return candidates
+
+
+@numba.njit(cache=True)
+def _has_join_witness(assignment, join_clauses, join_edges, join_forward, join_reverse, join_nodes):
+	# Generic join over the variables of the edge clauses, with the head variables already assigned
+	# Returns as soon as one grounding of all the variables satisfies every edge clause
+	for k in range(len(join_clauses)):
+		v1, v2 = join_clauses[k]
+		if v1 in assignment and v2 in assignment and (assignment[v1], assignment[v2]) not in join_edges[k]:
+			return False
+
+	order = _join_variable_order(assignment, join_clauses)
+	if len(order) == 0:
+		return True
+
+	# Iterative backtracking, with the candidates and the position in the candidates for each joined variable
+	candidates = numba.typed.List.empty_list(list_of_nodes)
+	positions = numba.typed.List.empty_list(numba.types.int64)
+	candidates.append(_join_candidates(order[0], assignment, join_clauses, join_edges, join_forward, join_reverse, join_nodes))
+	positions.append(0)
+	while len(candidates) > 0:
+		depth = len(candidates) - 1
+		v = order[depth]
+		if positions[depth] < len(candidates[depth]):
+			assignment[v] = candidates[depth][positions[depth]]
+			positions[depth] += 1
+			if depth + 1 == len(order):
+				return True
+			candidates.append(_join_candidates(order[depth + 1], assignment, join_clauses, join_edges, join_forward, join_reverse, join_nodes))
+			positions.append(0)
+		else:
+			candidates.pop()
+			positions.pop()
+			if v in assignment:
+				del assignment[v]
+	return False
+
+
+@numba.njit(cache=True)
+def _has_default_thresholds(thresholds):
+	for threshold in thresholds:
+		if threshold[0] != 'greater_equal' or threshold[1][0] != 'number' or threshold[1][1] != 'total' or threshold[2] != 1.0:
+			return False
+	return True
+
+
 @numba.njit(cache=True)
 def check_node_grounding_threshold_satisfaction(interpretations_node, grounding, qualified_grounding, clause_label, threshold, closed_world_predicates):
 	threshold_quantifier_type = threshold[1][1]
@@ -1321,8 +1900,11 @@ def check_node_grounding_threshold_satisfaction(interpretations_node, grounding,
 		neigh_len = len(grounding)
 
 	# Available is all neighbors that have a particular label with bound inside [0,1]
+	# They are only counted when the threshold depends on them
 	elif threshold_quantifier_type == 'available':
-		neigh_len = len(get_qualified_node_groundings(interpretations_node, grounding, clause_label, interval.closed(0, 1), closed_world_predicates))
+		neigh_len = len(grounding)
+		if _needs_available_count(neigh_len, len(qualified_grounding), threshold):
+			neigh_len = _count_available_components(interpretations_node, grounding, clause_label, closed_world_predicates)
 
 
 	qualified_neigh_len = len(qualified_grounding)
@@ -1337,14 +1919,76 @@ def check_edge_grounding_threshold_satisfaction(interpretations_edge, grounding,
 		neigh_len = len(grounding)
 
 	# Available is all neighbors that have a particular label with bound inside [0,1]
+	# They are only counted when the threshold depends on them
 	elif threshold_quantifier_type == 'available':
-		neigh_len = len(get_qualified_edge_groundings(interpretations_edge, grounding, clause_label, interval.closed(0, 1), closed_world_predicates))
+		neigh_len = len(grounding)
+		if _needs_available_count(neigh_len, len(qualified_grounding), threshold):
+			neigh_len = _count_available_components(interpretations_edge, grounding, clause_label, closed_world_predicates)
 
 	qualified_neigh_len = len(qualified_grounding)
 	satisfaction = _satisfies_threshold(neigh_len, qualified_neigh_len, threshold)
 	return satisfaction
 
 
+@numba.njit(cache=True)
+def check_node_clause_satisfaction(interpretations_node, grounding, clause_label, clause_bnd, threshold, closed_world_predicates):
+	# Equal thresholds and percentages of the available nodes need every qualified node to be counted
+	if threshold[0] == 'equal' or (threshold[1][0] == 'percent' and threshold[1][1] == 'available'):
+		qualified_groundings = get_qualified_node_groundings(interpretations_node, grounding, clause_label, clause_bnd, closed_world_predicates)
+		return check_node_grounding_threshold_satisfaction(interpretations_node, grounding, qualified_groundings, clause_label, threshold, closed_world_predicates)
+
+	# Stop as soon as enough nodes qualified to flip the outcome, or too few are left to do so
+	outcome, flip_count = _get_flip_count(len(grounding), threshold)
+	num_qualified = 0
+	num_remaining = len(grounding)
+	for n in grounding:
+		if num_qualified >= flip_count:
+			return not outcome
+		if num_qualified + num_remaining < flip_count:
+			return outcome
+		if is_satisfied_node(interpretations_node, n, (clause_label, clause_bnd), closed_world_predicates):
+			num_qualified += 1
+		num_remaining -= 1
+	return outcome if num_qualified < flip_count else not outcome
+
+
+@numba.njit(cache=True)
+def check_edge_clause_satisfaction(interpretations_edge, grounding, clause_label, clause_bnd, threshold, closed_world_predicates):
+	# Equal thresholds and percentages of the available edges need every qualified edge to be counted
+	if threshold[0] == 'equal' or (threshold[1][0] == 'percent' and threshold[1][1] == 'available'):
+		qualified_groundings = get_qualified_edge_groundings(interpretations_edge, grounding, clause_label, clause_bnd, closed_world_predicates)
+		return check_edge_grounding_threshold_satisfaction(interpretations_edge, grounding, qualified_groundings, clause_label, threshold, closed_world_predicates)
+
+	# Stop as soon as enough edges qualified to flip the outcome, or too few are left to do so
+	outcome, flip_count = _get_flip_count(len(grounding), threshold)
+	num_qualified = 0
+	num_remaining = len(grounding)
+	for e in grounding:
+		if num_qualified >= flip_count:
+			return not outcome
+		if num_qualified + num_remaining < flip_count:
+			return outcome
+		if is_satisfied_edge(interpretations_edge, e, (clause_label, clause_bnd), closed_world_predicates):
+			num_qualified += 1
+		num_remaining -= 1
+	return outcome if num_qualified < flip_count else not outcome
+
+
+@numba.njit(cache=True)
+def _get_flip_count(num_neigh, threshold):
+	# The outcome of a threshold that is not an equality is monotone in the number of qualified components
+	# Returns the outcome without qualified components and the smallest number of them that flips it (num_neigh + 1 if none does)
+	outcome = _satisfies_threshold(num_neigh, 0, threshold)
+	lo, hi = 1, num_neigh + 1
+	while lo < hi:
+		mid = (lo + hi) // 2
+		if _satisfies_threshold(num_neigh, mid, threshold) != outcome:
+			hi = mid
+		else:
+			lo = mid + 1
+	return outcome, lo
+
+
 @numba.njit(cache=True)
 def get_rule_node_clause_grounding(clause_var_1, groundings, predicate_map, l, nodes):
 	# The groundings for a node clause can be either a previous grounding or all possible nodes
@@ -1424,6 +2068,30 @@ def get_qualified_edge_groundings(interpretations_edge, grounding, clause_l, cla
 	return qualified_groundings
 
 
+@numba.njit(cache=True)
+def _count_available_components(interpretations, grounding, clause_l, closed_world_predicates):
+	# Every bound is inside [0,1], so a component is available when its world has the label. Labels of closed world
+	# predicates that are missing are [0,0], which makes every component available
+	if clause_l in closed_world_predicates:
+		return len(grounding)
+	num_available = 0
+	for comp in grounding:
+		if comp in interpretations and clause_l in interpretations[comp].world:
+			num_available += 1
+	return num_available
+
+
+@numba.njit(cache=True)
+def _needs_available_count(num_neigh, num_qualified_component, threshold):
+	# The available components are between the qualified components and the whole grounding. Number thresholds do not
+	# depend on them, and a lower bound on the percentage that holds for the whole grounding holds for any part of it
+	if threshold[1][0] == 'number':
+		return False
+	if num_qualified_component > 0 and (threshold[0] == 'greater_equal' or threshold[0] == 'greater'):
+		return not _satisfies_threshold(num_neigh, num_qualified_component, threshold)
+	return True
+
+
 @numba.njit(cache=True)
 def _satisfies_threshold(num_neigh, num_qualified_component, threshold):
 	# Checks if qualified neighbors satisfy threshold. This is for one clause
@@ -1474,8 +2142,8 @@ def _update_node(interpretations, predicate_map, comp, na, ipl, rule_trace, fp_c
 			else:
 				predicate_map[l] = numba.typed.List([comp])
 
-		# Check if update is necessary with previous bnd
-		prev_bnd = world.world[l].copy()
+		# Check if update is necessary with previous bnd. Keep the bounds instead of copying the interval
+		prev_lower, prev_upper = world.world[l].lower, world.world[l].upper
 
 		# override will not check for inconsistencies
 		if override:
@@ -1483,7 +2151,7 @@ def _update_node(interpretations, predicate_map, comp, na, ipl, rule_trace, fp_c
 		else:
 			world.update(l, bnd)
 		world.world[l].set_static(static)
-		if world.world[l]!=prev_bnd:
+		if world.world[l].lower != prev_lower or world.world[l].upper != prev_upper:
 			updated = True
 			updated_bnds.append(world.world[l])
 
@@ -1507,10 +2175,10 @@ def _update_node(interpretations, predicate_map, comp, na, ipl, rule_trace, fp_c
 						qn = numba.typed.List.empty_list(numba.typed.List.empty_list(node_type))
 						qe = numba.typed.List.empty_list(numba.typed.List.empty_list(edge_type))
 						name = facts_to_be_applied_trace[idx]
-						_update_rule_trace(rule_trace_atoms, qn, qe, prev_bnd, name)
+						_update_rule_trace(rule_trace_atoms, qn, qe, interval.closed(prev_lower, prev_upper), name)
 					elif mode=='rule':
 						qn, qe, name = rules_to_be_applied_trace[idx]
-						_update_rule_trace(rule_trace_atoms, qn, qe, prev_bnd, name)
+						_update_rule_trace(rule_trace_atoms, qn, qe, interval.closed(prev_lower, prev_upper), name)
 
 		# Update complement of predicate (if exists) based on new knowledge of predicate
 		if updated:
@@ -1593,8 +2261,8 @@ def _update_edge(interpretations, predicate_map, comp, na, ipl, rule_trace, fp_c
 			else:
 				predicate_map[l] = numba.typed.List([comp])
 
-		# Check if update is necessary with previous bnd
-		prev_bnd = world.world[l].copy()
+		# Check if update is necessary with previous bnd. Keep the bounds instead of copying the interval
+		prev_lower, prev_upper = world.world[l].lower, world.world[l].upper
 
 		# override will not check for inconsistencies
 		if override:
@@ -1602,7 +2270,7 @@ def _update_edge(interpretations, predicate_map, comp, na, ipl, rule_trace, fp_c
 		else:
 			world.update(l, bnd)
 		world.world[l].set_static(static)
-		if world.world[l]!=prev_bnd:
+		if world.world[l].lower != prev_lower or world.world[l].upper != prev_upper:
 			updated = True
 			updated_bnds.append(world.world[l])
 
@@ -1626,10 +2294,10 @@ def _update_edge(interpretations, predicate_map, comp, na, ipl, rule_trace, fp_c
 						qn = numba.typed.List.empty_list(numba.typed.List.empty_list(node_type))
 						qe = numba.typed.List.empty_list(numba.typed.List.empty_list(edge_type))
 						name = facts_to_be_applied_trace[idx]
-						_update_rule_trace(rule_trace_atoms, qn, qe, prev_bnd, name)
+						_update_rule_trace(rule_trace_atoms, qn, qe, interval.closed(prev_lower, prev_upper), name)
 					elif mode=='rule':
 						qn, qe, name = rules_to_be_applied_trace[idx]
-						_update_rule_trace(rule_trace_atoms, qn, qe, prev_bnd, name)
+						_update_rule_trace(rule_trace_atoms, qn, qe, interval.closed(prev_lower, prev_upper), name)
 
 		# Update complement of predicate (if exists) based on new knowledge of predicate
 		if updated:
@@ -1693,6 +2361,622 @@ def _update_edge(interpretations, predicate_map, comp, na, ipl, rule_trace, fp_c
 		return (False, 0)
 
 
+@numba.njit(cache=True)
+def _mark_label_changed(changed_labels, l, ipl):
+	# Record that a label was updated, along with its complement in the inconsistent predicate list
+	changed_labels[l] = True
+	for p1, p2 in ipl:
+		if p1 == l:
+			changed_labels[p2] = True
+		elif p2 == l:
+			changed_labels[p1] = True
+
+
+@numba.njit(cache=True)
+def _build_fact_schedule(facts, t_start):
+	# Map each timestep to the indices of the facts that become due at that timestep, in the order of the facts
+	# Facts whose interval started before t_start are due at t_start. Non-static facts whose interval has ended are never applied
+	fact_schedule = numba.typed.Dict.empty(key_type=numba.types.int64, value_type=list_of_ints)
+	for i in range(len(facts)):
+		if not facts[i][4] and facts[i][6] < t_start:
+			continue
+		t = max(int(facts[i][0]), t_start)
+		if t not in fact_schedule:
+			fact_schedule[t] = numba.typed.List.empty_list(numba.types.int64)
+		fact_schedule[t].append(i)
+	return fact_schedule
+
+
+@numba.njit(cache=True)
+def _get_due_facts(fact_schedule, active_facts, t):
+	# Merge the facts that become due at t with the facts that are still active, keeping the order of the facts
+	due_facts = numba.typed.List.empty_list(numba.types.int64)
+	if t not in fact_schedule:
+		due_facts.extend(active_facts)
+		return due_facts
+
+	scheduled_facts = fact_schedule[t]
+	i, j = 0, 0
+	while i < len(scheduled_facts) or j < len(active_facts):
+		if j == len(active_facts) or (i < len(scheduled_facts) and scheduled_facts[i] < active_facts[j]):
+			due_facts.append(scheduled_facts[i])
+			i += 1
+		else:
+			due_facts.append(active_facts[j])
+			j += 1
+	return due_facts
+
+
+@numba.njit(cache=True)
+def _remove_applied_facts(facts, facts_trace, t_start, t_end, atom_trace):
+	# Remove the facts that were applied between t_start and t_end
+	# Static facts and facts whose interval goes beyond t_end are kept, and become due at t_end + 1
+	remaining_facts = facts.copy()
+	remaining_facts.clear()
+	remaining_facts_trace = facts_trace.copy()
+	remaining_facts_trace.clear()
+	for i in range(len(facts)):
+		fact = facts[i]
+		if fact[0] <= t_end and fact[6] >= t_start:
+			if not fact[4] and fact[6] <= t_end:
+				continue
+			fact = (numba.types.uint16(t_end + 1), fact[1], fact[2], fact[3], fact[4], fact[5], numba.types.uint16(max(int(fact[6]), t_end + 1)))
+		remaining_facts.append(fact)
+		if atom_trace:
+			remaining_facts_trace.append(facts_trace[i])
+
+	facts[:] = remaining_facts
+	if atom_trace:
+		facts_trace[:] = remaining_facts_trace
+
+
+@numba.njit(cache=True)
+def _plan_clause_orders(rules, predicate_map_node, predicate_map_edge, num_nodes, num_edges):
+	clause_orders = numba.typed.List.empty_list(list_of_ints)
+	for rule in rules:
+		clause_orders.append(_plan_clause_order(rule.get_clauses(), rule.get_thresholds(), predicate_map_node, predicate_map_edge, num_nodes, num_edges))
+	return clause_orders
+
+
+@numba.njit(cache=True)
+def _plan_clause_order(clauses, thresholds, predicate_map_node, predicate_map_edge, num_nodes, num_edges):
+	# Greedy join ordering: start with the most selective clause, then add the cheapest clause that shares a variable with the planned clauses
+	order = numba.typed.List.empty_list(numba.types.int64)
+
+	# Custom thresholds are checked against the groundings available when the clause is reached, so the order of these rules is kept
+	if not _has_default_thresholds(thresholds):
+		for i in range(len(clauses)):
+			order.append(i)
+		return order
+
+	avg_degree = num_edges / max(num_nodes, 1)
+	# Estimated number of groundings of each variable in the planned clauses
+	estimates = numba.typed.Dict.empty(key_type=numba.types.string, value_type=numba.types.float64)
+	remaining = numba.typed.List.empty_list(numba.types.int64)
+	for i in range(len(clauses)):
+		if clauses[i][0] == 'node' or clauses[i][0] == 'edge':
+			remaining.append(i)
+
+	while len(remaining) > 0:
+		best, best_cost, best_connected = 0, 0.0, False
+		for j in range(len(remaining)):
+			connected, cost = _estimate_clause_cost(clauses[remaining[j]], estimates, predicate_map_node, predicate_map_edge, num_nodes, num_edges, avg_degree)
+			if j == 0 or (connected and not best_connected) or (connected == best_connected and cost < best_cost):
+				best, best_cost, best_connected = j, cost, connected
+		i = remaining.pop(best)
+		order.append(i)
+		for v in clauses[i][2]:
+			estimates[v] = min(estimates[v], best_cost) if v in estimates else best_cost
+
+	# Comparison clauses are not used for grounding, they go last
+	for i in range(len(clauses)):
+		if clauses[i][0] != 'node' and clauses[i][0] != 'edge':
+			order.append(i)
+	return order
+
+
+@numba.njit(cache=True)
+def _estimate_clause_cost(clause, estimates, predicate_map_node, predicate_map_edge, num_nodes, num_edges, avg_degree):
+	# Estimate the number of groundings of a clause, and whether it shares a variable with the planned clauses
+	# Without a predicate map entry the clause is grounded with all the nodes/edges
+	clause_type, clause_label, clause_variables = clause[0], clause[1], clause[2]
+	if clause_type == 'node':
+		cost = float(len(predicate_map_node[clause_label])) if clause_label in predicate_map_node else float(num_nodes)
+		if clause_variables[0] in estimates:
+			return True, min(cost, estimates[clause_variables[0]])
+		return False, cost
+
+	cost = float(len(predicate_map_edge[clause_label])) if clause_label in predicate_map_edge else float(num_edges)
+	connected = False
+	# A bound variable is joined with the edges of its groundings
+	for v in clause_variables:
+		if v in estimates:
+			connected = True
+			cost = min(cost, estimates[v] * avg_degree)
+	return connected, cost
+
+
+@numba.njit(cache=True)
+def _get_cardinalities(predicate_map):
+	cardinalities = numba.typed.Dict.empty(key_type=label.label_type, value_type=numba.types.int64)
+	for l in predicate_map:
+		cardinalities[l] = len(predicate_map[l])
+	return cardinalities
+
+
+@numba.njit(cache=True)
+def _cardinality_drifted(planned, current):
+	# A plan is stale once a cardinality has changed by more than a factor of 2
+	return current > 2 * planned or planned > 2 * current
+
+
+@numba.njit(cache=True)
+def _cardinalities_drifted(cardinalities, predicate_map):
+	if len(cardinalities) != len(predicate_map):
+		return True
+	for l in predicate_map:
+		if l not in cardinalities or _cardinality_drifted(cardinalities[l], len(predicate_map[l])):
+			return True
+	return False
+
+
+@numba.njit(cache=True)
+def _build_rule_queue(rules_to_be_applied, t_start):
+	# Map each timestep to the indices of the rules that are applied at that timestep, in the order of the rules
+	rule_queue = numba.typed.Dict.empty(key_type=numba.types.int64, value_type=list_of_ints)
+	_queue_rules(rule_queue, rules_to_be_applied, 0, t_start)
+	return rule_queue
+
+
+@numba.njit(cache=True)
+def _queue_rules(rule_queue, rules_to_be_applied, start, t_start):
+	# Add the rules from index start onwards to the queue. Rules that were due before t_start are never applied
+	for i in range(start, len(rules_to_be_applied)):
+		t = int(rules_to_be_applied[i][0])
+		if t < t_start:
+			continue
+		if t not in rule_queue:
+			rule_queue[t] = numba.typed.List.empty_list(numba.types.int64)
+		rule_queue[t].append(i)
+
+
+@numba.njit(cache=True)
+def _pop_due_rules(rule_queue, t):
+	# Remove and return the indices of the rules that are applied at t
+	if t in rule_queue:
+		return rule_queue.pop(t)
+	return numba.typed.List.empty_list(numba.types.int64)
+
+
+@numba.njit(cache=True)
+def _can_apply_in_parallel(interpretations, rules_to_be_applied, due_rules, ipl):
+	# Rules can be applied in parallel when their labels, and the complements of their labels, are already in the world of their component
+	# Their updates then do not add to the predicate map or to the number of ground atoms, which are shared by all components
+	for idx in due_rules:
+		comp, l = rules_to_be_applied[idx][1], rules_to_be_applied[idx][2]
+		if comp not in interpretations:
+			return False
+		world = interpretations[comp].world
+		if l not in world:
+			return False
+		for p1, p2 in ipl:
+			if (p1 == l and p2 not in world) or (p2 == l and p1 not in world):
+				return False
+	return True
+
+
+@numba.njit(cache=True)
+def _adds_edges(edges_to_be_added, due_rules):
+	# Whether any of the due edge rules adds edges to the graph
+	for idx in due_rules:
+		sources, targets, _ = edges_to_be_added[idx]
+		if len(sources) > 0 and len(targets) > 0:
+			return True
+	return False
+
+
+@numba.njit(cache=True)
+def _group_by_component(rules_to_be_applied, due_rules, group_of):
+	# Group the positions of the due rules by the component they update. Groups and the positions in them keep the order of the rules
+	groups = numba.typed.List.empty_list(list_of_ints)
+	for pos in range(len(due_rules)):
+		comp = rules_to_be_applied[due_rules[pos]][1]
+		if comp not in group_of:
+			group_of[comp] = len(groups)
+			groups.append(numba.typed.List.empty_list(numba.types.int64))
+		groups[group_of[comp]].append(pos)
+	return groups
+
+
+@numba.njit(cache=True)
+def _apply_rules_node_group(interpretations, predicate_map, rules_to_be_applied, due_rules, positions, ipl, rule_trace_threadsafe, rule_trace_atoms, rules_to_be_applied_trace, facts_to_be_applied_trace, fp_cnt, t, convergence_mode, save_graph_attributes_to_rule_trace, inconsistency_check, store_interpretation_changes, update_mode, num_ga, updated, changed, changes):
+	# Apply the due rules of one node in order. Each rule writes its trace and results at its own position
+	for pos in positions:
+		idx = due_rules[pos]
+		comp, l, bnd, set_static = rules_to_be_applied[idx][1], rules_to_be_applied[idx][2], rules_to_be_applied[idx][3], rules_to_be_applied[idx][4]
+		# Check for inconsistencies
+		if check_consistent_node(interpretations, comp, (l, bnd)):
+			override = True if update_mode == 'override' else False
+			u, c = _update_node(interpretations, predicate_map, comp, (l, bnd), ipl, rule_trace_threadsafe[pos], fp_cnt, t, set_static, convergence_mode, False, save_graph_attributes_to_rule_trace, rules_to_be_applied_trace, idx, facts_to_be_applied_trace, rule_trace_atoms, store_interpretation_changes, num_ga, mode='rule', override=override)
+			updated[pos], changed[pos], changes[pos] = u, u, c
+		# Resolve inconsistency
+		elif inconsistency_check:
+			resolve_inconsistency_node(interpretations, comp, (l, bnd), ipl, t, fp_cnt, idx, False, rule_trace_threadsafe[pos], rule_trace_atoms, rules_to_be_applied_trace, facts_to_be_applied_trace, store_interpretation_changes, mode='rule')
+			changed[pos] = True
+		else:
+			u, c = _update_node(interpretations, predicate_map, comp, (l, bnd), ipl, rule_trace_threadsafe[pos], fp_cnt, t, set_static, convergence_mode, False, save_graph_attributes_to_rule_trace, rules_to_be_applied_trace, idx, facts_to_be_applied_trace, rule_trace_atoms, store_interpretation_changes, num_ga, mode='rule', override=True)
+			updated[pos], changed[pos], changes[pos] = u, u, c
+
+
+@numba.njit(cache=True)
+def _apply_rules_edge_group(interpretations, predicate_map, rules_to_be_applied, edges_to_be_added, due_rules, positions, ipl, rule_trace_threadsafe, rule_trace_atoms, rules_to_be_applied_trace, facts_to_be_applied_trace, fp_cnt, t, convergence_mode, save_graph_attributes_to_rule_trace, inconsistency_check, store_interpretation_changes, update_mode, num_ga, updated, changed, changes):
+	# Apply the due rules of one edge in order. Each rule writes its trace and results at its own position
+	for pos in positions:
+		idx = due_rules[pos]
+		comp, l, bnd, set_static = rules_to_be_applied[idx][1], rules_to_be_applied[idx][2], rules_to_be_applied[idx][3], rules_to_be_applied[idx][4]
+		# A rule with an edge label only updates the edges it adds, and these rules do not add edges
+		if edges_to_be_added[idx][2].value != '':
+			continue
+		# Check for inconsistencies
+		if check_consistent_edge(interpretations, comp, (l, bnd)):
+			override = True if update_mode == 'override' else False
+			u, c = _update_edge(interpretations, predicate_map, comp, (l, bnd), ipl, rule_trace_threadsafe[pos], fp_cnt, t, set_static, convergence_mode, False, save_graph_attributes_to_rule_trace, rules_to_be_applied_trace, idx, facts_to_be_applied_trace, rule_trace_atoms, store_interpretation_changes, num_ga, mode='rule', override=override)
+			updated[pos], changed[pos], changes[pos] = u, u, c
+		# Resolve inconsistency
+		elif inconsistency_check:
+			resolve_inconsistency_edge(interpretations, comp, (l, bnd), ipl, t, fp_cnt, idx, False, rule_trace_threadsafe[pos], rule_trace_atoms, rules_to_be_applied_trace, facts_to_be_applied_trace, store_interpretation_changes, mode='rule')
+			changed[pos] = True
+		else:
+			u, c = _update_edge(interpretations, predicate_map, comp, (l, bnd), ipl, rule_trace_threadsafe[pos], fp_cnt, t, set_static, convergence_mode, False, save_graph_attributes_to_rule_trace, rules_to_be_applied_trace, idx, facts_to_be_applied_trace, rule_trace_atoms, store_interpretation_changes, num_ga, mode='rule', override=True)
+			updated[pos], changed[pos], changes[pos] = u, u, c
+
+
+@numba.njit(cache=True)
+def _remove_applied_rules(rules_to_be_applied, rules_to_be_applied_trace, t_start, t_end, atom_trace):
+	# Remove the rules that were applied between t_start and t_end, and return the indices of the remaining rules
+	keep = numba.typed.List.empty_list(numba.types.int64)
+	for i in range(len(rules_to_be_applied)):
+		if not t_start <= rules_to_be_applied[i][0] <= t_end:
+			keep.append(i)
+	_keep_items(rules_to_be_applied, keep)
+	if atom_trace:
+		_keep_items(rules_to_be_applied_trace, keep)
+	return keep
+
+
+@numba.njit(cache=True)
+def _keep_items(items, keep):
+	# Keep only the items at the given (increasing) indices
+	if len(keep) == len(items):
+		return
+	kept_items = items.copy()
+	kept_items.clear()
+	for i in keep:
+		kept_items.append(items[i])
+	items[:] = kept_items
+
+
+@numba.njit(cache=True)
+def _bump_label_versions(label_versions, changed_labels):
+	for l in changed_labels:
+		if l in label_versions:
+			label_versions[l] += 1
+		else:
+			label_versions[l] = 1
+
+
+@numba.njit(cache=True)
+def _schedule_grounding_tasks(rules, rule_schedule, clause_orders, cache_hits, predicate_map_node, predicate_map_edge, nodes, closed_world_predicates, max_partitions):
+	# Each scheduled rule is grounded by one task, or by one task per partition of the candidates of its head variable
+	# Tasks refer to their position in the rule schedule. An empty partition grounds the whole rule
+	task_rules = numba.typed.List.empty_list(numba.types.int64)
+	task_partitions = numba.typed.List.empty_list(list_of_nodes)
+	for i in range(len(rule_schedule)):
+		candidates = numba.typed.List.empty_list(node_type)
+		if max_partitions > 1 and not cache_hits[i]:
+			candidates = _get_head_candidates(rules[rule_schedule[i]], clause_orders[rule_schedule[i]], predicate_map_node, predicate_map_edge, nodes, closed_world_predicates)
+		num_partitions = min(max_partitions, len(candidates))
+		if num_partitions < 2:
+			task_rules.append(i)
+			task_partitions.append(numba.typed.List.empty_list(node_type))
+			continue
+		for p in range(num_partitions):
+			partition = numba.typed.List.empty_list(node_type)
+			for j in range(p * len(candidates) // num_partitions, (p + 1) * len(candidates) // num_partitions):
+				partition.append(candidates[j])
+			task_rules.append(i)
+			task_partitions.append(partition)
+	return task_rules, task_partitions
+
+
+@numba.njit(cache=True)
+def _get_segment_end(task_rules, rule_schedule, adds_to_graph, segment_start):
+	# Tasks are grounded together up to the next task that can add to the graph. Such a task is grounded alone
+	segment_end = segment_start + 1
+	if adds_to_graph[rule_schedule[task_rules[segment_start]]]:
+		return segment_end
+	while segment_end < len(task_rules) and not adds_to_graph[rule_schedule[task_rules[segment_end]]]:
+		segment_end += 1
+	return segment_end
+
+
+@numba.njit(cache=True)
+def _may_add_to_graph(rule):
+	# A head variable that is not in the body and not given by a head function is grounded as a node of its own,
+	# which is added to the graph if it is missing
+	head_fns = rule.get_head_function()
+	head_variables = rule.get_head_variables()
+	for i in range(len(head_variables)):
+		if head_fns[i] != '':
+			continue
+		in_body = False
+		for clause in rule.get_clauses():
+			for v in clause[2]:
+				if v == head_variables[i]:
+					in_body = True
+		if not in_body:
+			return True
+	return False
+
+
+@numba.njit(cache=True)
+def _get_head_candidates(rule, clause_order, predicate_map_node, predicate_map_edge, nodes, closed_world_predicates):
+	# The candidates of the head variable in the first clause that is grounded, or none if the grounding of the rule cannot be split
+	# Every head grounding then comes from exactly one partition. This holds when each clause only has to be satisfied once and
+	# the annotations and head do not depend on the groundings of the whole rule
+	candidates = numba.typed.List.empty_list(node_type)
+	if len(clause_order) == 0 or rule.get_annotation_function() != '' or not _has_default_thresholds(rule.get_thresholds()):
+		return candidates
+	for fn in rule.get_head_function():
+		if fn != '':
+			return candidates
+
+	head_var_1 = rule.get_head_variables()[0]
+	clause = rule.get_clauses()[clause_order[0]]
+	clause_type, clause_label, clause_variables = clause[0], clause[1], clause[2]
+	if clause_label in closed_world_predicates:
+		return candidates
+	if clause_type == 'node' and clause_variables[0] == head_var_1:
+		candidates.extend(predicate_map_node[clause_label] if clause_label in predicate_map_node else nodes)
+	elif clause_type == 'edge' and (clause_variables[0] == head_var_1) != (clause_variables[1] == head_var_1):
+		position = 0 if clause_variables[0] == head_var_1 else 1
+		if clause_label in predicate_map_edge:
+			seen = numba.typed.Dict.empty(key_type=node_type, value_type=numba.types.boolean)
+			for e in predicate_map_edge[clause_label]:
+				if e[position] not in seen:
+					seen[e[position]] = True
+					candidates.append(e[position])
+		else:
+			candidates.extend(nodes)
+	return candidates
+
+
+@numba.njit(cache=True)
+def _grounding_signature(rule, label_versions_node, label_versions_edge, predicate_map_node, predicate_map_edge, graph_size):
+	# Sum of the versions and number of components of the body predicates and the size of the graph
+	# These only grow while reasoning, so the sum changes whenever one of them does
+	# Comparison clauses match labels by prefix, the groundings of these rules are not cached (-1)
+	signature = graph_size
+	for clause in rule.get_clauses():
+		clause_type, l = clause[0], clause[1]
+		if clause_type == 'node':
+			if l in label_versions_node:
+				signature += label_versions_node[l]
+			if l in predicate_map_node:
+				signature += len(predicate_map_node[l])
+		elif clause_type == 'edge':
+			if l in label_versions_edge:
+				signature += label_versions_edge[l]
+			if l in predicate_map_edge:
+				signature += len(predicate_map_edge[l])
+		else:
+			return -1
+	return signature
+
+
+@numba.njit(cache=True)
+def _cache_groundings(cached_signatures, cached_node_rules, cached_edge_rules, rule_schedule, signatures, task_rules, task_grounded, task_node_rules, task_edge_rules):
+	# Cache the groundings of the rules that were grounded in this operation. The partitions of a rule are concatenated in order
+	for task in range(len(task_rules)):
+		i = task_rules[task]
+		if signatures[i] < 0 or not task_grounded[task]:
+			continue
+		r = rule_schedule[i]
+		if task == 0 or task_rules[task - 1] != i:
+			cached_signatures[r] = signatures[i]
+			cached_node_rules[r] = numba.typed.List.empty_list(node_applicable_rule_type)
+			cached_edge_rules[r] = numba.typed.List.empty_list(edge_applicable_rule_type)
+		cached_node_rules[r].extend(task_node_rules[task])
+		cached_edge_rules[r].extend(task_edge_rules[task])
+
+
+@numba.njit(cache=True)
+def _evict_groundings(cached_signatures, cached_last_used, cached_node_rules, cached_edge_rules, rule_schedule, cache_clock, max_size):
+	# Mark the rules grounded in this operation as used, then evict the least recently used groundings until at most max_size are cached
+	for i in rule_schedule:
+		cached_last_used[i] = cache_clock
+	size = 0
+	for i in range(len(cached_signatures)):
+		if cached_signatures[i] >= 0:
+			size += len(cached_node_rules[i]) + len(cached_edge_rules[i])
+	while size > max_size:
+		lru = -1
+		for i in range(len(cached_signatures)):
+			if cached_signatures[i] >= 0 and (lru == -1 or cached_last_used[i] < cached_last_used[lru]):
+				lru = i
+		size -= len(cached_node_rules[lru]) + len(cached_edge_rules[lru])
+		cached_signatures[lru] = -1
+		cached_node_rules[lru] = numba.typed.List.empty_list(node_applicable_rule_type)
+		cached_edge_rules[lru] = numba.typed.List.empty_list(edge_applicable_rule_type)
+
+
+@numba.njit(cache=True)
+def _mark_atom_dirty(dirty_atoms, comp, l, ipl):
+	# Record that an atom, and its complement in the inconsistent predicate list, has to be reset at the next timestep
+	dirty_atoms[(comp, l)] = True
+	for p1, p2 in ipl:
+		if p1 == l:
+			dirty_atoms[(comp, p2)] = True
+		elif p2 == l:
+			dirty_atoms[(comp, p1)] = True
+
+
+@numba.njit(cache=True)
+def _reset_dirty_atoms(interpretations, dirty_atoms):
+	# Reset the non-static atoms that were modified since the last reset
+	# An atom is kept for one more timestep if it was not [0,1] before the reset, so that its previous bounds are reset as well
+	for atom in dirty_atoms.copy():
+		comp, l = atom
+		if comp in interpretations and l in interpretations[comp].world:
+			bnd = interpretations[comp].world[l]
+			if not bnd.is_static():
+				bnd.reset()
+				if bnd.prev_lower != 0 or bnd.prev_upper != 1:
+					continue
+		del dirty_atoms[atom]
+
+
+@numba.njit(cache=True)
+def _build_rule_dependency_index(rules):
+	# Index rules by the predicates in their body, so that the rules affected by a changed predicate can be looked up directly
+	# Comparison clauses match labels by prefix, so rules that contain them are always scheduled
+	rules_by_label_node = numba.typed.Dict.empty(key_type=label.label_type, value_type=list_of_ints)
+	rules_by_label_edge = numba.typed.Dict.empty(key_type=label.label_type, value_type=list_of_ints)
+	always_scheduled = numba.typed.List.empty_list(numba.types.int64)
+	for i in range(len(rules)):
+		for clause in rules[i].get_clauses():
+			if clause[0] == 'node':
+				rules_by_label = rules_by_label_node
+			elif clause[0] == 'edge':
+				rules_by_label = rules_by_label_edge
+			else:
+				if len(always_scheduled) == 0 or always_scheduled[-1] != i:
+					always_scheduled.append(i)
+				continue
+
+			l = clause[1]
+			if l not in rules_by_label:
+				rules_by_label[l] = numba.typed.List.empty_list(numba.types.int64)
+			if len(rules_by_label[l]) == 0 or rules_by_label[l][-1] != i:
+				rules_by_label[l].append(i)
+
+	return rules_by_label_node, rules_by_label_edge, always_scheduled
+
+
+@numba.njit(cache=True)
+def _add_dependent_rules(l, rules_by_label, ipl, dependents):
+	# Updating a label also updates its complement in the inconsistent predicate list
+	if l in rules_by_label:
+		dependents.extend(rules_by_label[l])
+	for p1, p2 in ipl:
+		if p1 == l and p2 in rules_by_label:
+			dependents.extend(rules_by_label[p2])
+		elif p2 == l and p1 in rules_by_label:
+			dependents.extend(rules_by_label[p1])
+
+
+@numba.njit(cache=True)
+def _stratify_rules(rules, rules_by_label_node, rules_by_label_edge, always_scheduled, ipl):
+	# Rule j depends on rule i if the body of j contains a predicate that i can update
+	# Rules in the same strongly connected component of this graph form a stratum
+	# Strata are numbered in topological order, so a rule only depends on rules in its own or earlier strata
+	n = len(rules)
+	dependents = numba.typed.List.empty_list(list_of_ints)
+	for i in range(n):
+		rule = rules[i]
+		d = numba.typed.List.empty_list(numba.types.int64)
+		if rule.get_type() == 'node':
+			_add_dependent_rules(rule.get_target(), rules_by_label_node, ipl, d)
+		else:
+			_add_dependent_rules(rule.get_target(), rules_by_label_edge, ipl, d)
+		edge_l = rule.get_edges()[2]
+		if edge_l.get_value() != '':
+			_add_dependent_rules(edge_l, rules_by_label_edge, ipl, d)
+		d.extend(always_scheduled)
+		dependents.append(d)
+
+	# Iterative Tarjan's algorithm. Components are completed in reverse topological order
+	index = numba.typed.List([-1 for _ in range(n)])
+	lowlink = numba.typed.List([-1 for _ in range(n)])
+	on_stack = numba.typed.List([False for _ in range(n)])
+	component = numba.typed.List([-1 for _ in range(n)])
+	stack = numba.typed.List.empty_list(numba.types.int64)
+	call_stack = numba.typed.List.empty_list(numba.types.UniTuple(numba.types.int64, 2))
+	next_index = 0
+	num_components = 0
+	for root in range(n):
+		if index[root] != -1:
+			continue
+		call_stack.append((root, 0))
+		while len(call_stack) > 0:
+			v, child = call_stack.pop()
+			if child == 0:
+				index[v] = next_index
+				lowlink[v] = next_index
+				next_index += 1
+				stack.append(v)
+				on_stack[v] = True
+
+			# Visit the next unvisited dependent, and come back to v afterwards
+			recurse = False
+			while child < len(dependents[v]):
+				w = dependents[v][child]
+				child += 1
+				if index[w] == -1:
+					call_stack.append((v, child))
+					call_stack.append((w, 0))
+					recurse = True
+					break
+				elif on_stack[w]:
+					lowlink[v] = min(lowlink[v], index[w])
+			if recurse:
+				continue
+
+			# All dependents of v have been visited
+			if lowlink[v] == index[v]:
+				while True:
+					w = stack.pop()
+					on_stack[w] = False
+					component[w] = num_components
+					if w == v:
+						break
+				num_components += 1
+			if len(call_stack) > 0:
+				u = call_stack[-1][0]
+				lowlink[u] = min(lowlink[u], lowlink[v])
+
+	strata = numba.typed.List.empty_list(numba.types.int64)
+	for i in range(n):
+		strata.append(num_components - 1 - component[i])
+	return strata
+
+
+@numba.njit(cache=True)
+def _schedule_rules(changed_labels_node, changed_labels_edge, rules_by_label_node, rules_by_label_edge, always_scheduled, strata):
+	# Collect the rules that have a changed predicate in their body, ordered by stratum
+	scheduled = numba.typed.Dict.empty(key_type=numba.types.int64, value_type=numba.types.boolean)
+	for l in changed_labels_node:
+		if l in rules_by_label_node:
+			for i in rules_by_label_node[l]:
+				scheduled[i] = True
+	for l in changed_labels_edge:
+		if l in rules_by_label_edge:
+			for i in rules_by_label_edge[l]:
+				scheduled[i] = True
+	for i in always_scheduled:
+		scheduled[i] = True
+
+	order = numba.typed.List.empty_list(numba.types.UniTuple(numba.types.int64, 2))
+	for i in scheduled:
+		order.append((strata[i], i))
+	order.sort()
+
+	rule_schedule = numba.typed.List.empty_list(numba.types.int64)
+	for _, i in order:
+		rule_schedule.append(i)
+	return rule_schedule
+
+
 @numba.njit(cache=True)
 def _update_rule_trace(rule_trace, qn, qe, prev_bnd, name):
 	rule_trace.append((qn, qe, prev_bnd.copy(), name))
@@ -1994,10 +3278,11 @@ def _add_node(node, neighbors, reverse_neighbors, nodes, interpretations_node):
 @numba.njit(cache=True)
 def _add_edge(source, target, neighbors, reverse_neighbors, nodes, edges, l, interpretations_node, interpretations_edge, predicate_map, num_ga, t):
 	# If not a node, add to list of nodes and initialize neighbors
-	if source not in nodes:
+	# The interpretations are keyed by the nodes and edges of the graph, use them to check membership instead of the lists
+	if source not in interpretations_node:
 		_add_node(source, neighbors, reverse_neighbors, nodes, interpretations_node)
 
-	if target not in nodes:
+	if target not in interpretations_node:
 		_add_node(target, neighbors, reverse_neighbors, nodes, interpretations_node)
 
 	# Make sure edge doesn't already exist
@@ -2005,7 +3290,7 @@ def _add_edge(source, target, neighbors, reverse_neighbors, nodes, edges, l, int
 	# Make sure, if edge exists, that we don't override the l label if it exists
 	edge = (source, target)
 	new_edge = False
-	if edge not in edges:
+	if edge not in interpretations_edge:
 		new_edge = True
 		edges.append(edge)
 		neighbors[source].append(target)
@@ -2050,10 +3335,11 @@ def _delete_edge(edge, neighbors, reverse_neighbors, edges, interpretations_edge
 	source, target = edge
 	edges.remove(edge)
 	num_ga[-1] -= len(interpretations_edge[edge].world)
-	del interpretations_edge[edge]
-	for l in predicate_map:
-		if edge in predicate_map[l]:
+	# The edge is only in the predicate map of its own labels
+	for l in interpretations_edge[edge].world:
+		if l in predicate_map and edge in predicate_map[l]:
 			predicate_map[l].remove(edge)
+	del interpretations_edge[edge]
 	neighbors[source].remove(target)
 	reverse_neighbors[target].remove(source)
 
@@ -2062,20 +3348,21 @@ def _delete_edge(edge, neighbors, reverse_neighbors, edges, interpretations_edge
 def _delete_node(node, neighbors, reverse_neighbors, nodes, interpretations_node, predicate_map, num_ga):
 	nodes.remove(node)
 	num_ga[-1] -= len(interpretations_node[node].world)
-	del interpretations_node[node]
-	del neighbors[node]
-	del reverse_neighbors[node]
-	for l in predicate_map:
-		if node in predicate_map[l]:
+	# The node is only in the predicate map of its own labels
+	for l in interpretations_node[node].world:
+		if l in predicate_map and node in predicate_map[l]:
 			predicate_map[l].remove(node)
+	del interpretations_node[node]
 
-	# Remove all occurrences of node in neighbors
-	for n in neighbors.keys():
-		if node in neighbors[n]:
+	# Remove all occurrences of node in neighbors. Only the neighbor lists of adjacent nodes can contain it
+	for n in reverse_neighbors[node]:
+		if n != node and node in neighbors[n]:
 			neighbors[n].remove(node)
-	for n in reverse_neighbors.keys():
-		if node in reverse_neighbors[n]:
+	for n in neighbors[node]:
+		if n != node and node in reverse_neighbors[n]:
 			reverse_neighbors[n].remove(node)
+	del neighbors[node]
+	del reverse_neighbors[node]
 
 
 @numba.njit(cache=True)
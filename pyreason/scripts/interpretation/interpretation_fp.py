@@ -6,6 +6,7 @@ import pyreason.scripts.numba_wrapper.numba_types.interval_type as interval
 from pyreason.scripts.interpretation.interpretation_dict import InterpretationDict
 
 import numba
+import numpy as np
 from numba import objmode, prange
 
 
@@ -28,8 +29,9 @@ clause_data = numba.types.Tuple((numba.types.string, label.label_type, numba.typ
 refine_data = numba.types.Tuple((numba.types.string, numba.types.string, numba.types.int8))
 
 # Type for facts to be applied
-facts_to_be_applied_node_type = numba.types.Tuple((numba.types.uint16, node_type, label.label_type, interval.interval_type, numba.types.boolean, numba.types.boolean))
-facts_to_be_applied_edge_type = numba.types.Tuple((numba.types.uint16, edge_type, label.label_type, interval.interval_type, numba.types.boolean, numba.types.boolean))
+# start time, component, label, bound, static, graph attribute, end time
+facts_to_be_applied_node_type = numba.types.Tuple((numba.types.uint16, node_type, label.label_type, interval.interval_type, numba.types.boolean, numba.types.boolean, numba.types.uint16))
+facts_to_be_applied_edge_type = numba.types.Tuple((numba.types.uint16, edge_type, label.label_type, interval.interval_type, numba.types.boolean, numba.types.boolean, numba.types.uint16))
 
 # Type for returning list of applicable rules for a certain rule
 # node/edge, annotations, qualified nodes, qualified edges, edges to be added
@@ -58,7 +60,8 @@ edges_to_be_added_type = numba.types.Tuple((numba.types.ListType(node_type), num
 class Interpretation:
 	specific_node_labels = numba.typed.Dict.empty(key_type=label.label_type, value_type=numba.types.ListType(node_type))
 	specific_edge_labels = numba.typed.Dict.empty(key_type=label.label_type, value_type=numba.types.ListType(edge_type))
-	closed_world_predicates = numba.typed.List.empty_list(label.label_type)
+	# Closed world predicates are kept as a set, they are looked up for every component of every clause
+	closed_world_predicates = numba.typed.Dict.empty(key_type=label.label_type, value_type=numba.types.boolean)
 
 	def __init__(self, graph, ipl, annotation_functions, head_functions, reverse_graph, atom_trace, save_graph_attributes_to_rule_trace, persistent, inconsistency_check, store_interpretation_changes, update_mode, allow_ground_rules):
 		self.graph = graph
@@ -109,15 +112,37 @@ class Interpretation:
 		self.interpretations_node, self.predicate_map_node = self._init_interpretations_node(self.nodes, self.specific_node_labels)
 		self.interpretations_edge, self.predicate_map_edge = self._init_interpretations_edge(self.edges, self.specific_edge_labels)
 
-		# Setup graph neighbors and reverse neighbors
-		self.neighbors = numba.typed.Dict.empty(key_type=node_type, value_type=numba.types.ListType(node_type))
-		for n in self.graph.nodes():
-			l = numba.typed.List.empty_list(node_type)
-			[l.append(neigh) for neigh in self.graph.neighbors(n)]
-			self.neighbors[n] = l
+		# Components whose world may be shared with another timestep, for each timestep. In persistent mode unchanged worlds are shared instead of copied
+		self.shared_worlds_node = numba.typed.Dict.empty(key_type=numba.types.int64, value_type=numba.types.DictType(node_type, numba.types.boolean))
+		self.shared_worlds_edge = numba.typed.Dict.empty(key_type=numba.types.int64, value_type=numba.types.DictType(edge_type, numba.types.boolean))
 
+		# Setup graph neighbors and reverse neighbors
+		indptr, indices = self._init_csr_adjacency(self.graph)
+		self.neighbors = self._init_neighbors(self.nodes, indptr, indices)
 		self.reverse_neighbors = self._init_reverse_neighbors(self.neighbors)
 
+	@staticmethod
+	def _init_csr_adjacency(graph):
+		# Intern nodes to integer ids (their position in graph.nodes()) and store the adjacency in CSR form
+		# Passing integer arrays to numba is much cheaper than appending node names to typed lists one by one
+		node_ids = {n: i for i, n in enumerate(graph.nodes())}
+		degrees = np.fromiter((len(graph.adj[n]) for n in graph.nodes()), dtype=np.int64, count=len(node_ids))
+		indptr = np.zeros(len(node_ids) + 1, dtype=np.int64)
+		np.cumsum(degrees, out=indptr[1:])
+		indices = np.fromiter((node_ids[neigh] for n in graph.nodes() for neigh in graph.adj[n]), dtype=np.int32, count=indptr[-1])
+		return indptr, indices
+
+	@staticmethod
+	@numba.njit(cache=True)
+	def _init_neighbors(nodes, indptr, indices):
+		neighbors = numba.typed.Dict.empty(key_type=node_type, value_type=list_of_nodes)
+		for i in range(len(nodes)):
+			neighbor_nodes = numba.typed.List.empty_list(node_type)
+			for j in range(indptr[i], indptr[i+1]):
+				neighbor_nodes.append(nodes[indices[j]])
+			neighbors[nodes[i]] = neighbor_nodes
+		return neighbors
+
 	@staticmethod
 	@numba.njit(cache=True)
 	def _init_reverse_neighbors(neighbors):
@@ -201,23 +226,28 @@ class Interpretation:
 	@staticmethod
 	@numba.njit(cache=True)
 	def _init_facts(facts_node, facts_edge, facts_to_be_applied_node, facts_to_be_applied_edge, facts_to_be_applied_node_trace, facts_to_be_applied_edge_trace, atom_trace):
+		# Facts are stored once with the interval of timesteps at which they hold
 		max_time = 0
 		for fact in facts_node:
-			for t in range(fact.get_time_lower(), fact.get_time_upper() + 1):
-				max_time = max(max_time, t)
-				name = fact.get_name()
-				graph_attribute = True if name=='graph-attribute-fact' else False
-				facts_to_be_applied_node.append((numba.types.uint16(t), fact.get_component(), fact.get_label(), fact.get_bound(), fact.static, graph_attribute))
-				if atom_trace:
-					facts_to_be_applied_node_trace.append(fact.get_name())
+			t_lower, t_upper = fact.get_time_lower(), fact.get_time_upper()
+			if t_upper < t_lower:
+				continue
+			max_time = max(max_time, t_upper)
+			name = fact.get_name()
+			graph_attribute = True if name=='graph-attribute-fact' else False
+			facts_to_be_applied_node.append((numba.types.uint16(t_lower), fact.get_component(), fact.get_label(), fact.get_bound(), fact.static, graph_attribute, numba.types.uint16(t_upper)))
+			if atom_trace:
+				facts_to_be_applied_node_trace.append(fact.get_name())
 		for fact in facts_edge:
-			for t in range(fact.get_time_lower(), fact.get_time_upper() + 1):
-				max_time = max(max_time, t)
-				name = fact.get_name()
-				graph_attribute = True if name=='graph-attribute-fact' else False
-				facts_to_be_applied_edge.append((numba.types.uint16(t), fact.get_component(), fact.get_label(), fact.get_bound(), fact.static, graph_attribute))
-				if atom_trace:
-					facts_to_be_applied_edge_trace.append(fact.get_name())
+			t_lower, t_upper = fact.get_time_lower(), fact.get_time_upper()
+			if t_upper < t_lower:
+				continue
+			max_time = max(max_time, t_upper)
+			name = fact.get_name()
+			graph_attribute = True if name=='graph-attribute-fact' else False
+			facts_to_be_applied_edge.append((numba.types.uint16(t_lower), fact.get_component(), fact.get_label(), fact.get_bound(), fact.static, graph_attribute, numba.types.uint16(t_upper)))
+			if atom_trace:
+				facts_to_be_applied_edge_trace.append(fact.get_name())
 		return max_time
 
 	def _start_fp(self, rules, max_facts_time, verbose, again, restart):
@@ -225,7 +255,7 @@ class Interpretation:
 			if restart:
 				self.time = 0
 				self.prev_reasoning_data[0] = 0
-		fp_cnt, t = self.reason(self.interpretations_node, self.interpretations_edge, self.predicate_map_node, self.predicate_map_edge, self.tmax, self.prev_reasoning_data, rules, self.nodes, self.edges, self.neighbors, self.reverse_neighbors, self.rules_to_be_applied_node, self.rules_to_be_applied_edge, self.edges_to_be_added_node_rule, self.edges_to_be_added_edge_rule, self.rules_to_be_applied_node_trace, self.rules_to_be_applied_edge_trace, self.facts_to_be_applied_node, self.facts_to_be_applied_edge, self.facts_to_be_applied_node_trace, self.facts_to_be_applied_edge_trace, self.ipl, self.rule_trace_node, self.rule_trace_edge, self.rule_trace_node_atoms, self.rule_trace_edge_atoms, self.reverse_graph, self.atom_trace, self.save_graph_attributes_to_rule_trace, self.persistent, self.inconsistency_check, self.store_interpretation_changes, self.update_mode, self.allow_ground_rules, max_facts_time, self.annotation_functions, self.head_functions, self._convergence_mode, self._convergence_delta, verbose, again, self.closed_world_predicates)
+		fp_cnt, t = self.reason(self.interpretations_node, self.interpretations_edge, self.predicate_map_node, self.predicate_map_edge, self.tmax, self.prev_reasoning_data, rules, self.nodes, self.edges, self.neighbors, self.reverse_neighbors, self.rules_to_be_applied_node, self.rules_to_be_applied_edge, self.edges_to_be_added_node_rule, self.edges_to_be_added_edge_rule, self.rules_to_be_applied_node_trace, self.rules_to_be_applied_edge_trace, self.facts_to_be_applied_node, self.facts_to_be_applied_edge, self.facts_to_be_applied_node_trace, self.facts_to_be_applied_edge_trace, self.ipl, self.rule_trace_node, self.rule_trace_edge, self.rule_trace_node_atoms, self.rule_trace_edge_atoms, self.reverse_graph, self.atom_trace, self.save_graph_attributes_to_rule_trace, self.persistent, self.inconsistency_check, self.store_interpretation_changes, self.update_mode, self.allow_ground_rules, max_facts_time, self.annotation_functions, self.head_functions, self._convergence_mode, self._convergence_delta, verbose, again, self.closed_world_predicates, self.shared_worlds_node, self.shared_worlds_edge)
 		self.time = t - 1
 		# If we need to reason again, store the next timestep to start from
 		self.prev_reasoning_data[0] = t
@@ -235,7 +265,7 @@ class Interpretation:
 
 	@staticmethod
 	@numba.njit(cache=True, parallel=False)
-	def reason(interpretations_node, interpretations_edge, predicate_map_node, predicate_map_edge, tmax, prev_reasoning_data, rules, nodes, edges, neighbors, reverse_neighbors, rules_to_be_applied_node, rules_to_be_applied_edge, edges_to_be_added_node_rule, edges_to_be_added_edge_rule, rules_to_be_applied_node_trace, rules_to_be_applied_edge_trace, facts_to_be_applied_node, facts_to_be_applied_edge, facts_to_be_applied_node_trace, facts_to_be_applied_edge_trace, ipl, rule_trace_node, rule_trace_edge, rule_trace_node_atoms, rule_trace_edge_atoms, reverse_graph, atom_trace, save_graph_attributes_to_rule_trace, persistent, inconsistency_check, store_interpretation_changes, update_mode, allow_ground_rules, max_facts_time, annotation_functions, head_functions, convergence_mode, convergence_delta, verbose, again, closed_world_predicates):
+	def reason(interpretations_node, interpretations_edge, predicate_map_node, predicate_map_edge, tmax, prev_reasoning_data, rules, nodes, edges, neighbors, reverse_neighbors, rules_to_be_applied_node, rules_to_be_applied_edge, edges_to_be_added_node_rule, edges_to_be_added_edge_rule, rules_to_be_applied_node_trace, rules_to_be_applied_edge_trace, facts_to_be_applied_node, facts_to_be_applied_edge, facts_to_be_applied_node_trace, facts_to_be_applied_edge_trace, ipl, rule_trace_node, rule_trace_edge, rule_trace_node_atoms, rule_trace_edge_atoms, reverse_graph, atom_trace, save_graph_attributes_to_rule_trace, persistent, inconsistency_check, store_interpretation_changes, update_mode, allow_ground_rules, max_facts_time, annotation_functions, head_functions, convergence_mode, convergence_delta, verbose, again, closed_world_predicates, shared_worlds_node, shared_worlds_edge):
 		t = prev_reasoning_data[0]
 		max_t = t		# Keeps track of the max time in each fp operation
 		max_t_changes = t
@@ -271,20 +301,14 @@ class Interpretation:
 				# Only create new interpretation if it doesn't exist or if this is the first fp operation
 				if t not in interpretations_node or fp_cnt == 0:
 					interpretations_node[t] = numba.typed.Dict.empty(key_type=node_type, value_type=world.world_type)
+				if t not in shared_worlds_node or fp_cnt == 0:
+					shared_worlds_node[t] = numba.typed.Dict.empty(key_type=node_type, value_type=numba.types.boolean)
 				
 				if t > 0 and persistent:
-					last_t_interp = interpretations_node[t-1]
-					for n in last_t_interp:
-						# Add node to new interpretation only if it doesn't exist
-						if n not in interpretations_node[t]:
-							interpretations_node[t][n] = world.World(numba.typed.List.empty_list(label.label_type))
-
-						w = last_t_interp[n].world
-						new_w = interpretations_node[t][n].world
-						for l in w:
-							# Only copy if this is the first fp operation (fp_cnt == 0) or if the label doesn't exist
-							if fp_cnt == 0 or l not in new_w:
-								new_w[l] = w[l].copy()
+					if t-1 not in shared_worlds_node:
+						shared_worlds_node[t-1] = numba.typed.Dict.empty(key_type=node_type, value_type=numba.types.boolean)
+					# Share the worlds of the previous timestep instead of copying them
+					_share_worlds(interpretations_node[t-1], shared_worlds_node[t-1], interpretations_node[t], shared_worlds_node[t])
 
 				# If not persistent then copy only what is static
 				elif t > 0 and not persistent:
@@ -306,20 +330,14 @@ class Interpretation:
 				# Only create new interpretation if it doesn't exist or if this is the first fp operation
 				if t not in interpretations_edge or fp_cnt == 0:
 					interpretations_edge[t] = numba.typed.Dict.empty(key_type=edge_type, value_type=world.world_type)
+				if t not in shared_worlds_edge or fp_cnt == 0:
+					shared_worlds_edge[t] = numba.typed.Dict.empty(key_type=edge_type, value_type=numba.types.boolean)
 				
 				if t > 0 and persistent:
-					last_t_interp = interpretations_edge[t-1]
-					for e in last_t_interp:
-						# Add edge to new interpretation only if it doesn't exist
-						if e not in interpretations_edge[t]:
-							interpretations_edge[t][e] = world.World(numba.typed.List.empty_list(label.label_type))
-
-						w = last_t_interp[e].world
-						new_w = interpretations_edge[t][e].world
-						for l in w:
-							# Only copy if this is the first fp operation (fp_cnt == 0) or if the label doesn't exist
-							if fp_cnt == 0 or l not in new_w:
-								new_w[l] = w[l].copy()
+					if t-1 not in shared_worlds_edge:
+						shared_worlds_edge[t-1] = numba.typed.Dict.empty(key_type=edge_type, value_type=numba.types.boolean)
+					# Share the worlds of the previous timestep instead of copying them
+					_share_worlds(interpretations_edge[t-1], shared_worlds_edge[t-1], interpretations_edge[t], shared_worlds_edge[t])
 
 				# If not persistent then copy only what is static
 				elif t > 0 and not persistent:
@@ -377,6 +395,7 @@ class Interpretation:
 											_update_rule_trace(rule_trace_node_atoms, numba.typed.List.empty_list(numba.typed.List.empty_list(node_type)), numba.typed.List.empty_list(numba.typed.List.empty_list(edge_type)), interpretations_node[t][comp].world[p1], facts_to_be_applied_node_trace[i])
 	
 						else:
+							_own_world(interpretations_node[t], shared_worlds_node[t], comp)
 							# Check for inconsistencies (multiple facts)
 							if check_consistent_node(interpretations_node[t], comp, (l, bnd)):
 								mode = 'graph-attribute-fact' if graph_attribute else 'fact'
@@ -408,8 +427,9 @@ class Interpretation:
 									else:
 										changes_cnt += changes
 	
-						if static:
-							facts_to_be_applied_node_new.append((numba.types.uint16(facts_to_be_applied_node[i][0]+1), comp, l, bnd, static, graph_attribute))
+						# Keep the fact for the next timestep if its interval has not ended. Static facts are applied at every following timestep
+						if static or facts_to_be_applied_node[i][6] > t:
+							facts_to_be_applied_node_new.append((numba.types.uint16(facts_to_be_applied_node[i][0]+1), comp, l, bnd, static, graph_attribute, numba.types.uint16(max(facts_to_be_applied_node[i][6], t+1))))
 							if atom_trace:
 								facts_to_be_applied_node_trace_new.append(facts_to_be_applied_node_trace[i])
 	
@@ -458,6 +478,7 @@ class Interpretation:
 										if atom_trace:
 											_update_rule_trace(rule_trace_edge_atoms, numba.typed.List.empty_list(numba.typed.List.empty_list(node_type)), numba.typed.List.empty_list(numba.typed.List.empty_list(edge_type)), interpretations_edge[t][comp].world[p1], facts_to_be_applied_edge_trace[i])
 						else:
+							_own_world(interpretations_edge[t], shared_worlds_edge[t], comp)
 							# Check for inconsistencies
 							if check_consistent_edge(interpretations_edge[t], comp, (l, bnd)):
 								mode = 'graph-attribute-fact' if graph_attribute else 'fact'
@@ -489,8 +510,9 @@ class Interpretation:
 									else:
 										changes_cnt += changes
 	
-						if static:
-							facts_to_be_applied_edge_new.append((numba.types.uint16(facts_to_be_applied_edge[i][0]+1), comp, l, bnd, static, graph_attribute))
+						# Keep the fact for the next timestep if its interval has not ended. Static facts are applied at every following timestep
+						if static or facts_to_be_applied_edge[i][6] > t:
+							facts_to_be_applied_edge_new.append((numba.types.uint16(facts_to_be_applied_edge[i][0]+1), comp, l, bnd, static, graph_attribute, numba.types.uint16(max(facts_to_be_applied_edge[i][6], t+1))))
 							if atom_trace:
 								facts_to_be_applied_edge_trace_new.append(facts_to_be_applied_edge_trace[i])
 	
@@ -625,6 +647,7 @@ class Interpretation:
 				# if node doesn't exist in interpretation, add it
 				if comp not in interpretations_node[t]:
 					_add_node_to_interpretation(comp, interpretations_node[t])
+				_own_world(interpretations_node[t], shared_worlds_node[t], comp)
 
 				# Check for inconsistencies
 				if check_consistent_node(interpretations_node[t], comp, (l, bnd)):
@@ -669,6 +692,11 @@ class Interpretation:
 			for idx, i in enumerate(rules_to_be_applied_edge):
 				t, comp, l, bnd, set_static = i[0], i[1], i[2], i[3], i[4]
 				sources, targets, edge_l = edges_to_be_added_edge_rule[idx]
+				# The edges that get the label are written to
+				if edge_l.value != '':
+					for source in sources:
+						for target in targets:
+							_own_world(interpretations_edge[t], shared_worlds_edge[t], (source, target))
 				edges_added, changes = _add_edges(sources, targets, neighbors, reverse_neighbors, nodes, edges, edge_l, interpretations_node[t], interpretations_edge[t], predicate_map_edge, t)
 				changes_cnt += changes
 
@@ -709,6 +737,7 @@ class Interpretation:
 					# if edge doesn't exist in interpretation, add it
 					if comp not in interpretations_edge[t]:
 						_add_edge_to_interpretation(comp, interpretations_edge[t])
+					_own_world(interpretations_edge[t], shared_worlds_edge[t], comp)
 
 					# Check for inconsistencies
 					if check_consistent_edge(interpretations_edge[t], comp, (l, bnd)):
@@ -1366,14 +1395,16 @@ def check_all_clause_satisfaction(interpretations_node, interpretations_edge, cl
 		clause_variables = clause[2]
 		clause_bnd = clause[3]
 
+		# The qualified groundings are not needed here, so each clause stops scanning once its threshold is decided
 		if clause_type == 'node':
 			clause_var_1 = clause_variables[0]
-			qualified_groundings = get_qualified_node_groundings(interpretations_node, groundings[clause_var_1], clause_label, clause_bnd, closed_world_predicates)
-			satisfaction = check_node_grounding_threshold_satisfaction(interpretations_node, groundings[clause_var_1], qualified_groundings, clause_label, thresholds[i], closed_world_predicates) and satisfaction
+			satisfaction = check_node_clause_satisfaction(interpretations_node, groundings[clause_var_1], clause_label, clause_bnd, thresholds[i], closed_world_predicates)
 		elif clause_type == 'edge':
 			clause_var_1, clause_var_2 = clause_variables[0], clause_variables[1]
-			qualified_groundings = get_qualified_edge_groundings(interpretations_edge, groundings_edges[(clause_var_1, clause_var_2)], clause_label, clause_bnd, closed_world_predicates)
-			satisfaction = check_edge_grounding_threshold_satisfaction(interpretations_edge, groundings_edges[(clause_var_1, clause_var_2)], qualified_groundings, clause_label, thresholds[i], closed_world_predicates) and satisfaction
+			satisfaction = check_edge_clause_satisfaction(interpretations_edge, groundings_edges[(clause_var_1, clause_var_2)], clause_label, clause_bnd, thresholds[i], closed_world_predicates)
+
+		if not satisfaction:
+			break
 	return satisfaction
 
 
@@ -1442,8 +1473,11 @@ def check_node_grounding_threshold_satisfaction(interpretations_node, grounding,
 		neigh_len = len(grounding)
 
 	# Available is all neighbors that have a particular label with bound inside [0,1]
+	# They are only counted when the threshold depends on them
 	elif threshold_quantifier_type == 'available':
-		neigh_len = len(get_qualified_node_groundings(interpretations_node, grounding, clause_label, interval.closed(0, 1), closed_world_predicates))
+		neigh_len = len(grounding)
+		if _needs_available_count(neigh_len, len(qualified_grounding), threshold):
+			neigh_len = _count_available_components(interpretations_node, grounding, clause_label, closed_world_predicates)
 
 	qualified_neigh_len = len(qualified_grounding)
 	satisfaction = _satisfies_threshold(neigh_len, qualified_neigh_len, threshold)
@@ -1457,14 +1491,76 @@ def check_edge_grounding_threshold_satisfaction(interpretations_edge, grounding,
 		neigh_len = len(grounding)
 
 	# Available is all neighbors that have a particular label with bound inside [0,1]
+	# They are only counted when the threshold depends on them
 	elif threshold_quantifier_type == 'available':
-		neigh_len = len(get_qualified_edge_groundings(interpretations_edge, grounding, clause_label, interval.closed(0, 1), closed_world_predicates))
+		neigh_len = len(grounding)
+		if _needs_available_count(neigh_len, len(qualified_grounding), threshold):
+			neigh_len = _count_available_components(interpretations_edge, grounding, clause_label, closed_world_predicates)
 
 	qualified_neigh_len = len(qualified_grounding)
 	satisfaction = _satisfies_threshold(neigh_len, qualified_neigh_len, threshold)
 	return satisfaction
 
 
+@numba.njit(cache=True)
+def check_node_clause_satisfaction(interpretations_node, grounding, clause_label, clause_bnd, threshold, closed_world_predicates):
+	# Equal thresholds and percentages of the available nodes need every qualified node to be counted
+	if threshold[0] == 'equal' or (threshold[1][0] == 'percent' and threshold[1][1] == 'available'):
+		qualified_groundings = get_qualified_node_groundings(interpretations_node, grounding, clause_label, clause_bnd, closed_world_predicates)
+		return check_node_grounding_threshold_satisfaction(interpretations_node, grounding, qualified_groundings, clause_label, threshold, closed_world_predicates)
+
+	# Stop as soon as enough nodes qualified to flip the outcome, or too few are left to do so
+	outcome, flip_count = _get_flip_count(len(grounding), threshold)
+	num_qualified = 0
+	num_remaining = len(grounding)
+	for n in grounding:
+		if num_qualified >= flip_count:
+			return not outcome
+		if num_qualified + num_remaining < flip_count:
+			return outcome
+		if is_satisfied_node(interpretations_node, n, (clause_label, clause_bnd), closed_world_predicates):
+			num_qualified += 1
+		num_remaining -= 1
+	return outcome if num_qualified < flip_count else not outcome
+
+
+@numba.njit(cache=True)
+def check_edge_clause_satisfaction(interpretations_edge, grounding, clause_label, clause_bnd, threshold, closed_world_predicates):
+	# Equal thresholds and percentages of the available edges need every qualified edge to be counted
+	if threshold[0] == 'equal' or (threshold[1][0] == 'percent' and threshold[1][1] == 'available'):
+		qualified_groundings = get_qualified_edge_groundings(interpretations_edge, grounding, clause_label, clause_bnd, closed_world_predicates)
+		return check_edge_grounding_threshold_satisfaction(interpretations_edge, grounding, qualified_groundings, clause_label, threshold, closed_world_predicates)
+
+	# Stop as soon as enough edges qualified to flip the outcome, or too few are left to do so
+	outcome, flip_count = _get_flip_count(len(grounding), threshold)
+	num_qualified = 0
+	num_remaining = len(grounding)
+	for e in grounding:
+		if num_qualified >= flip_count:
+			return not outcome
+		if num_qualified + num_remaining < flip_count:
+			return outcome
+		if is_satisfied_edge(interpretations_edge, e, (clause_label, clause_bnd), closed_world_predicates):
+			num_qualified += 1
+		num_remaining -= 1
+	return outcome if num_qualified < flip_count else not outcome
+
+
+@numba.njit(cache=True)
+def _get_flip_count(num_neigh, threshold):
+	# The outcome of a threshold that is not an equality is monotone in the number of qualified components
+	# Returns the outcome without qualified components and the smallest number of them that flips it (num_neigh + 1 if none does)
+	outcome = _satisfies_threshold(num_neigh, 0, threshold)
+	lo, hi = 1, num_neigh + 1
+	while lo < hi:
+		mid = (lo + hi) // 2
+		if _satisfies_threshold(num_neigh, mid, threshold) != outcome:
+			hi = mid
+		else:
+			lo = mid + 1
+	return outcome, lo
+
+
 @numba.njit(cache=True)
 def get_rule_node_clause_grounding(clause_var_1, groundings, predicate_map, l, nodes):
 	# The groundings for a node clause can be either a previous grounding or all possible nodes
@@ -1544,6 +1640,30 @@ def get_qualified_edge_groundings(interpretations_edge, grounding, clause_l, cla
 	return qualified_groundings
 
 
+@numba.njit(cache=True)
+def _count_available_components(interpretations, grounding, clause_l, closed_world_predicates):
+	# Every bound is inside [0,1], so a component is available when its world has the label. Labels of closed world
+	# predicates that are missing are [0,0], which makes every component available
+	if clause_l in closed_world_predicates:
+		return len(grounding)
+	num_available = 0
+	for comp in grounding:
+		if comp in interpretations and clause_l in interpretations[comp].world:
+			num_available += 1
+	return num_available
+
+
+@numba.njit(cache=True)
+def _needs_available_count(num_neigh, num_qualified_component, threshold):
+	# The available components are between the qualified components and the whole grounding. Number thresholds do not
+	# depend on them, and a lower bound on the percentage that holds for the whole grounding holds for any part of it
+	if threshold[1][0] == 'number':
+		return False
+	if num_qualified_component > 0 and (threshold[0] == 'greater_equal' or threshold[0] == 'greater'):
+		return not _satisfies_threshold(num_neigh, num_qualified_component, threshold)
+	return True
+
+
 @numba.njit(cache=True)
 def _satisfies_threshold(num_neigh, num_qualified_component, threshold):
 	# Checks if qualified neighbors satisfy threshold. This is for one clause
@@ -1592,8 +1712,8 @@ def _update_node(interpretations, predicate_map, comp, na, ipl, rule_trace, fp_c
 		else:
 			predicate_map[l] = numba.typed.List([comp])
 
-	# Check if update is necessary with previous bnd
-	prev_bnd = world.world[l].copy()
+	# Check if update is necessary with previous bnd. Keep the bounds instead of copying the interval
+	prev_lower, prev_upper = world.world[l].lower, world.world[l].upper
 
 	# override will not check for inconsistencies
 	if override:
@@ -1601,7 +1721,7 @@ def _update_node(interpretations, predicate_map, comp, na, ipl, rule_trace, fp_c
 	else:
 		world.update(l, bnd)
 	world.world[l].set_static(static)
-	if world.world[l]!=prev_bnd:
+	if world.world[l].lower != prev_lower or world.world[l].upper != prev_upper:
 		updated = True
 		updated_bnds.append(world.world[l])
 
@@ -1625,10 +1745,10 @@ def _update_node(interpretations, predicate_map, comp, na, ipl, rule_trace, fp_c
 					qn = numba.typed.List.empty_list(numba.typed.List.empty_list(node_type))
 					qe = numba.typed.List.empty_list(numba.typed.List.empty_list(edge_type))
 					name = facts_to_be_applied_trace[idx]
-					_update_rule_trace(rule_trace_atoms, qn, qe, prev_bnd, name)
+					_update_rule_trace(rule_trace_atoms, qn, qe, interval.closed(prev_lower, prev_upper), name)
 				elif mode=='rule':
 					qn, qe, name = rules_to_be_applied_trace[idx]
-					_update_rule_trace(rule_trace_atoms, qn, qe, prev_bnd, name)
+					_update_rule_trace(rule_trace_atoms, qn, qe, interval.closed(prev_lower, prev_upper), name)
 
 	# Update complement of predicate (if exists) based on new knowledge of predicate
 	if updated:
@@ -1705,8 +1825,8 @@ def _update_edge(interpretations, predicate_map, comp, na, ipl, rule_trace, fp_c
 		else:
 			predicate_map[l] = numba.typed.List([comp])
 
-	# Check if update is necessary with previous bnd
-	prev_bnd = world.world[l].copy()
+	# Check if update is necessary with previous bnd. Keep the bounds instead of copying the interval
+	prev_lower, prev_upper = world.world[l].lower, world.world[l].upper
 
 	# override will not check for inconsistencies
 	if override:
@@ -1714,7 +1834,7 @@ def _update_edge(interpretations, predicate_map, comp, na, ipl, rule_trace, fp_c
 	else:
 		world.update(l, bnd)
 	world.world[l].set_static(static)
-	if world.world[l]!=prev_bnd:
+	if world.world[l].lower != prev_lower or world.world[l].upper != prev_upper:
 		updated = True
 		updated_bnds.append(world.world[l])
 
@@ -1738,10 +1858,10 @@ def _update_edge(interpretations, predicate_map, comp, na, ipl, rule_trace, fp_c
 					qn = numba.typed.List.empty_list(numba.typed.List.empty_list(node_type))
 					qe = numba.typed.List.empty_list(numba.typed.List.empty_list(edge_type))
 					name = facts_to_be_applied_trace[idx]
-					_update_rule_trace(rule_trace_atoms, qn, qe, prev_bnd, name)
+					_update_rule_trace(rule_trace_atoms, qn, qe, interval.closed(prev_lower, prev_upper), name)
 				elif mode=='rule':
 					qn, qe, name = rules_to_be_applied_trace[idx]
-					_update_rule_trace(rule_trace_atoms, qn, qe, prev_bnd, name)
+					_update_rule_trace(rule_trace_atoms, qn, qe, interval.closed(prev_lower, prev_upper), name)
 
 	# Update complement of predicate (if exists) based on new knowledge of predicate
 	if updated:
@@ -2093,6 +2213,35 @@ def resolve_inconsistency_edge(interpretations, comp, na, ipl, t_cnt, fp_cnt, id
 				rule_trace.append((numba.types.uint16(t_cnt), numba.types.uint16(fp_cnt), comp, p1, interval.closed(0,1), False, 'IPL', actual_name, msg))
 
 
+@numba.njit(cache=True)
+def _share_worlds(last_t_interp, last_t_shared, interp, shared):
+	for comp in last_t_interp:
+		# Add the world of the previous timestep if the component doesn't exist, both timesteps now share it
+		if comp not in interp:
+			interp[comp] = last_t_interp[comp]
+			shared[comp] = True
+			last_t_shared[comp] = True
+		else:
+			# Only copy the labels that don't exist. Prevents overriding values from previous fp operation
+			w = last_t_interp[comp].world
+			for l in w:
+				if l not in interp[comp].world:
+					_own_world(interp, shared, comp)
+					interp[comp].world[l] = w[l].copy()
+
+
+@numba.njit(cache=True)
+def _own_world(interpretations, shared_worlds, comp):
+	# Copy the world of a component before it is changed if other timesteps may share it
+	if comp in shared_worlds:
+		w = interpretations[comp].world
+		new_world = world.World(numba.typed.List.empty_list(label.label_type))
+		for l in w:
+			new_world.world[l] = w[l].copy()
+		interpretations[comp] = new_world
+		del shared_worlds[comp]
+
+
 @numba.njit(cache=True)
 def _add_node(node, neighbors, reverse_neighbors, nodes, interpretations_node):
 	nodes.append(node)
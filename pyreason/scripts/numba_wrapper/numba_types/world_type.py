@@ -1,4 +1,5 @@
 import numba
+import numpy as np
 import pyreason.scripts.numba_wrapper.numba_types.interval_type as interval
 import pyreason.scripts.numba_wrapper.numba_types.label_type as label
 from pyreason.scripts.components.world import World
@@ -101,10 +102,16 @@ def is_satisfied(world, label, interval):
 
 @overload_method(WorldType, 'update')
 def update(w, label, interval):
-    def impl(w, label, interval):       
+    def impl(w, label, interval):
+        # Intersect the bound in place instead of allocating a new interval on every update
         current_bnd = w.world[label]
-        new_bnd = current_bnd.intersection(interval)
-        w.world[label] = new_bnd
+        lower = max(current_bnd.lower, interval.lower)
+        upper = min(current_bnd.upper, interval.upper)
+        if lower > upper:
+            lower = np.float64(0)
+            upper = np.float64(1)
+        current_bnd.set_lower_upper(lower, upper)
+        current_bnd.set_static(False)
     return impl
 
 @overload_method(WorldType, 'get_bound')
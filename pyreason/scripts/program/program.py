@@ -1,5 +1,4 @@
 from pyreason.scripts.interpretation.interpretation import Interpretation as Interpretation
-from pyreason.scripts.interpretation.interpretation_parallel import Interpretation as InterpretationParallel
 from pyreason.scripts.interpretation.interpretation_fp import Interpretation as InterpretationFP
 
 
@@ -8,7 +7,7 @@ class Program:
 	specific_edge_labels = []
 	closed_world_predicates = []
 
-	def __init__(self, graph, facts_node, facts_edge, rules, ipl, annotation_functions, head_functions, reverse_graph, atom_trace, save_graph_attributes_to_rule_trace, canonical, inconsistency_check, store_interpretation_changes, parallel_computing, update_mode, allow_ground_rules, fp_version):
+	def __init__(self, graph, facts_node, facts_edge, rules, ipl, annotation_functions, head_functions, reverse_graph, atom_trace, save_graph_attributes_to_rule_trace, canonical, inconsistency_check, store_interpretation_changes, parallel_computing, update_mode, allow_ground_rules, fp_version, semi_naive, grounding_cache_size, grounding_partitions, deterministic_parallel, parallel_apply):
 		self._graph = graph
 		self._facts_node = facts_node
 		self._facts_edge = facts_edge
@@ -26,6 +25,11 @@ class Program:
 		self._update_mode = update_mode
 		self._allow_ground_rules = allow_ground_rules
 		self._fp_version = fp_version
+		self._semi_naive = semi_naive
+		self._grounding_cache_size = grounding_cache_size
+		self._grounding_partitions = grounding_partitions
+		self._deterministic_parallel = deterministic_parallel
+		self._parallel_apply = parallel_apply
 		self.interp = None
 
 	def reason(self, tmax, convergence_threshold, convergence_bound_threshold, verbose=True):
@@ -36,15 +40,12 @@ class Program:
 		Interpretation.specific_edge_labels = self.specific_edge_labels
 		Interpretation.closed_world_predicates = self.closed_world_predicates
 		InterpretationFP.closed_world_predicates = self.closed_world_predicates
-		InterpretationParallel.closed_world_predicates = self.closed_world_predicates
 
-		# Instantiate correct interpretation class based on whether we parallelize the code or not. (We cannot parallelize with cache on)
-		if self._parallel_computing:
-			self.interp = InterpretationParallel(self._graph, self._ipl, self._annotation_functions, self._head_functions, self._reverse_graph, self._atom_trace, self._save_graph_attributes_to_rule_trace, self._canonical, self._inconsistency_check, self._store_interpretation_changes, self._update_mode, self._allow_ground_rules)
-		elif self._fp_version:
+		# Instantiate correct interpretation class based on whether we parallelize the code or not. The parallel reason kernel is only compiled when it is used
+		if self._fp_version and not self._parallel_computing:
 			self.interp = InterpretationFP(self._graph, self._ipl, self._annotation_functions, self._head_functions, self._reverse_graph, self._atom_trace, self._save_graph_attributes_to_rule_trace, self._canonical, self._inconsistency_check, self._store_interpretation_changes, self._update_mode, self._allow_ground_rules)
 		else:
-			self.interp = Interpretation(self._graph, self._ipl, self._annotation_functions, self._head_functions, self._reverse_graph, self._atom_trace, self._save_graph_attributes_to_rule_trace, self._canonical, self._inconsistency_check, self._store_interpretation_changes, self._update_mode, self._allow_ground_rules)
+			self.interp = Interpretation(self._graph, self._ipl, self._annotation_functions, self._head_functions, self._reverse_graph, self._atom_trace, self._save_graph_attributes_to_rule_trace, self._canonical, self._inconsistency_check, self._store_interpretation_changes, self._update_mode, self._allow_ground_rules, self._semi_naive, self._grounding_cache_size, self._grounding_partitions, self._deterministic_parallel, self._parallel_apply, self._parallel_computing)
 		self.interp.start_fp(self._tmax, self._facts_node, self._facts_edge, self._rules, verbose, convergence_threshold, convergence_bound_threshold)
 
 		return self.interp
@@ -263,7 +263,6 @@ omit =
     */conftest.py
     */__pycache__/*
     */setup.py
-    */interpretation_parallel.py
     */yaml_parser.py
     
 
@@ -98,6 +98,31 @@ class TestSettingsDefaults:
         
         assert pr.settings.parallel_computing is False
 
+    def test_semi_naive_default(self):
+        """Test semi_naive default value."""
+        
+        assert pr.settings.semi_naive is False
+
+    def test_grounding_cache_size_default(self):
+        """Test grounding_cache_size default value."""
+        
+        assert pr.settings.grounding_cache_size == 0
+
+    def test_grounding_partitions_default(self):
+        """Test grounding_partitions default value."""
+        
+        assert pr.settings.grounding_partitions == 1
+
+    def test_deterministic_parallel_default(self):
+        """Test deterministic_parallel default value."""
+        
+        assert pr.settings.deterministic_parallel is False
+
+    def test_parallel_apply_default(self):
+        """Test parallel_apply default value."""
+        
+        assert pr.settings.parallel_apply is False
+
     def test_update_mode_default(self):
         """Test update_mode default value."""
         
@@ -236,6 +261,36 @@ class TestSettingsValidSetters:
         pr.settings.parallel_computing = True
         assert pr.settings.parallel_computing is True
 
+    def test_semi_naive_setter_true(self):
+        """Test setting semi_naive to True."""
+        
+        pr.settings.semi_naive = True
+        assert pr.settings.semi_naive is True
+
+    def test_grounding_cache_size_setter(self):
+        """Test setting grounding_cache_size to a positive int."""
+        
+        pr.settings.grounding_cache_size = 10000
+        assert pr.settings.grounding_cache_size == 10000
+
+    def test_grounding_partitions_setter(self):
+        """Test setting grounding_partitions to a positive int."""
+        
+        pr.settings.grounding_partitions = 8
+        assert pr.settings.grounding_partitions == 8
+
+    def test_deterministic_parallel_setter(self):
+        """Test setting deterministic_parallel to True."""
+        
+        pr.settings.deterministic_parallel = True
+        assert pr.settings.deterministic_parallel is True
+
+    def test_parallel_apply_setter(self):
+        """Test setting parallel_apply to True."""
+        
+        pr.settings.parallel_apply = True
+        assert pr.settings.parallel_apply is True
+
     def test_update_mode_setter_valid_string(self):
         """Test setting update_mode to valid string."""
         
@@ -398,6 +453,64 @@ class TestSettingsInvalidSetters:
         with pytest.raises(TypeError, match='value has to be a bool'):
             pr.settings.parallel_computing = invalid_value
 
+    @pytest.mark.parametrize("invalid_value", [
+        "not_bool", 123, 3.14, [], {}, None, object()
+    ])
+    def test_semi_naive_setter_invalid_type(self, invalid_value):
+        """Test semi_naive setter with invalid types."""
+        
+        with pytest.raises(TypeError, match='value has to be a bool'):
+            pr.settings.semi_naive = invalid_value
+
+    @pytest.mark.parametrize("invalid_value", [
+        "not_int", 3.14, True, [], {}, None, object()
+    ])
+    def test_grounding_cache_size_setter_invalid_type(self, invalid_value):
+        """Test grounding_cache_size setter with invalid types."""
+        
+        with pytest.raises(TypeError, match='value has to be an int'):
+            pr.settings.grounding_cache_size = invalid_value
+
+    def test_grounding_cache_size_setter_negative(self):
+        """Test grounding_cache_size setter with a negative value."""
+        
+        with pytest.raises(ValueError, match='value has to be non-negative'):
+            pr.settings.grounding_cache_size = -1
+
+    @pytest.mark.parametrize("invalid_value", [
+        "not_int", 3.14, True, [], {}, None, object()
+    ])
+    def test_grounding_partitions_setter_invalid_type(self, invalid_value):
+        """Test grounding_partitions setter with invalid types."""
+        
+        with pytest.raises(TypeError, match='value has to be an int'):
+            pr.settings.grounding_partitions = invalid_value
+
+    @pytest.mark.parametrize("invalid_value", [0, -1])
+    def test_grounding_partitions_setter_not_positive(self, invalid_value):
+        """Test grounding_partitions setter with values below 1."""
+        
+        with pytest.raises(ValueError, match='value has to be positive'):
+            pr.settings.grounding_partitions = invalid_value
+
+    @pytest.mark.parametrize("invalid_value", [
+        "not_bool", 123, 3.14, [], {}, None, object()
+    ])
+    def test_deterministic_parallel_setter_invalid_type(self, invalid_value):
+        """Test deterministic_parallel setter with invalid types."""
+        
+        with pytest.raises(TypeError, match='value has to be a bool'):
+            pr.settings.deterministic_parallel = invalid_value
+
+    @pytest.mark.parametrize("invalid_value", [
+        "not_bool", 123, 3.14, [], {}, None, object()
+    ])
+    def test_parallel_apply_setter_invalid_type(self, invalid_value):
+        """Test parallel_apply setter with invalid types."""
+        
+        with pytest.raises(TypeError, match='value has to be a bool'):
+            pr.settings.parallel_apply = invalid_value
+
     @pytest.mark.parametrize("invalid_value", [
         True, False, 123, 3.14, [], {}, None, object()
     ])
@@ -449,6 +562,11 @@ class TestSettingsReset:
         pr.settings.static_graph_facts = False
         pr.settings.store_interpretation_changes = False
         pr.settings.parallel_computing = True
+        pr.settings.semi_naive = True
+        pr.settings.grounding_cache_size = 100
+        pr.settings.grounding_partitions = 4
+        pr.settings.deterministic_parallel = True
+        pr.settings.parallel_apply = True
         pr.settings.update_mode = "custom_mode"
         pr.settings.allow_ground_rules = True
         pr.settings.fp_version = True
@@ -472,6 +590,11 @@ class TestSettingsReset:
         assert pr.settings.static_graph_facts is True
         assert pr.settings.store_interpretation_changes is True
         assert pr.settings.parallel_computing is False
+        assert pr.settings.semi_naive is False
+        assert pr.settings.grounding_cache_size == 0
+        assert pr.settings.grounding_partitions == 1
+        assert pr.settings.deterministic_parallel is False
+        assert pr.settings.parallel_apply is False
         assert pr.settings.update_mode == 'intersection'
         assert pr.settings.allow_ground_rules is False
         assert pr.settings.fp_version is False
@@ -14,10 +14,12 @@ def setup_mode(mode):
         pr.settings.fp_version = True
     elif mode == "parallel":
         pr.settings.parallel_computing = True
+    elif mode == "semi_naive":
+        pr.settings.semi_naive = True
 
 
 @pytest.mark.slow
-@pytest.mark.parametrize("mode", ["regular", "fp", "parallel"])
+@pytest.mark.parametrize("mode", ["regular", "fp", "parallel", "semi_naive"])
 def test_hello_world(mode):
     """Test basic hello world program with different reasoning modes."""
     setup_mode(mode)
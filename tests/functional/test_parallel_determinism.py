@@ -0,0 +1,45 @@
+# Determinism tests for parallel reasoning
+import numba
+import pandas as pd
+import pyreason as pr
+import pytest
+
+
+def run_with_threads(num_threads):
+    """Run the same program with deterministic parallel reasoning on the given number of threads and return its rule trace."""
+    pr.reset()
+    pr.reset_rules()
+    pr.reset_settings()
+    pr.settings.verbose = False
+    pr.settings.parallel_computing = True
+    pr.settings.deterministic_parallel = True
+    pr.settings.grounding_partitions = 4
+    numba.set_num_threads(num_threads)
+
+    pr.load_graphml('./tests/functional/friends_graph.graphml')
+    pr.add_rule(pr.Rule('popular(x) <-1 popular(y), Friends(x,y), owns(y,z), owns(x,z)', 'popular_rule'))
+    pr.add_rule(pr.Rule('befriended(x) <-0 Friends(y,x), popular(y)', 'befriended_rule'))
+    pr.add_rule(pr.Rule('owner(x) <-0 owns(x,y)', 'owner_rule'))
+    # The head node is not in the graph, so grounding this rule adds it
+    pr.add_rule(pr.Rule('trending(Fashion) <-0 popular(x)', 'trending_rule'))
+    pr.add_fact(pr.Fact('popular(Mary)', 'popular_fact', 0, 2))
+
+    interpretation = pr.reason(timesteps=2)
+    return pr.get_rule_trace(interpretation)
+
+
+@pytest.mark.slow
+def test_parallel_rule_trace_does_not_depend_on_threads():
+    """The rule trace is the same at 1, 2 and all threads."""
+    thread_counts = sorted({1, 2, numba.config.NUMBA_NUM_THREADS})
+    try:
+        traces = [run_with_threads(n) for n in thread_counts]
+    finally:
+        numba.set_num_threads(numba.config.NUMBA_NUM_THREADS)
+
+    node_trace, edge_trace = traces[0]
+    assert len(node_trace) > 0
+    assert 'Fashion' in node_trace['Node'].values
+    for other_node_trace, other_edge_trace in traces[1:]:
+        pd.testing.assert_frame_equal(other_node_trace, node_trace)
+        pd.testing.assert_frame_equal(other_edge_trace, edge_trace)
@@ -97,7 +97,7 @@ def reason_env(monkeypatch, helpers_fixture):
         "edges_to_be_added_edge_rule": [],
         "rules_to_be_applied_node_trace": [],
         "rules_to_be_applied_edge_trace": [],
-        "facts_to_be_applied_node": [(0, node, lbl, bnd, False, False)],
+        "facts_to_be_applied_node": [(0, node, lbl, bnd, False, False, 0)],
         "facts_to_be_applied_edge": [],
         "facts_to_be_applied_node_trace": [],
         "facts_to_be_applied_edge_trace": [],
@@ -0,0 +1,86 @@
+"""Unit tests for the cost-based clause ordering used when grounding rules in the interpretation backend."""
+import pytest
+from tests.unit.disable_jit.interpretations.test_interpretation_common import get_interpretation_helpers
+
+_h = get_interpretation_helpers("interpretation")
+interpretation = _h.interpretation
+plan_clause_order = interpretation._plan_clause_order
+get_cardinalities = interpretation._get_cardinalities
+cardinality_drifted = interpretation._cardinality_drifted
+cardinalities_drifted = interpretation._cardinalities_drifted
+
+DEFAULT_THRESHOLD = ("greater_equal", ("number", "total"), 1.0)
+
+
+class _ListShim:
+    def __call__(self, iterable=()):
+        return list(iterable)
+
+    def empty_list(self, *args, **kwargs):
+        return []
+
+
+class _DictShim:
+    def empty(self, *args, **kwargs):
+        return {}
+
+
+@pytest.fixture(autouse=True)
+def shim_types(monkeypatch):
+    monkeypatch.setattr(interpretation.numba.typed, "List", _ListShim())
+    monkeypatch.setattr(interpretation.numba.typed, "Dict", _DictShim())
+
+
+def _clause(clause_type, lbl, variables):
+    return (clause_type, lbl, variables, (0, 1), "")
+
+
+def test_plan_starts_with_most_selective_clause_and_stays_connected():
+    clauses = [
+        _clause("node", "A", ["X"]),
+        _clause("node", "C", ["Z"]),
+        _clause("edge", "E", ["X", "Y"]),
+        _clause("node", "B", ["Y"]),
+    ]
+    predicate_map_node = {"A": list(range(100)), "B": [0, 1], "C": list(range(10))}
+    predicate_map_edge = {"E": list(range(50))}
+    order = plan_clause_order(clauses, [DEFAULT_THRESHOLD] * 4, predicate_map_node, predicate_map_edge, 100, 200)
+
+    # B(Y) is the most selective clause. E(X,Y) and then A(X) are joined through Y before the disconnected C(Z)
+    assert order == [3, 2, 0, 1]
+
+
+def test_plan_uses_graph_size_for_labels_without_predicate_map_entry():
+    clauses = [_clause("edge", "E", ["X", "Y"]), _clause("node", "A", ["X"])]
+    order = plan_clause_order(clauses, [DEFAULT_THRESHOLD] * 2, {}, {"E": [0, 1, 2]}, 100, 3)
+    assert order == [0, 1]
+
+
+def test_plan_keeps_order_with_custom_thresholds():
+    clauses = [_clause("node", "A", ["X"]), _clause("node", "B", ["X"])]
+    thresholds = [DEFAULT_THRESHOLD, ("greater_equal", ("percent", "total"), 100.0)]
+    order = plan_clause_order(clauses, thresholds, {"A": list(range(10)), "B": [0]}, {}, 10, 0)
+    assert order == [0, 1]
+
+
+def test_plan_puts_comparison_clauses_last():
+    clauses = [_clause("comparison", "A", ["X", "Y"]), _clause("node", "B", ["X"])]
+    order = plan_clause_order(clauses, [DEFAULT_THRESHOLD] * 2, {"B": [0]}, {}, 10, 0)
+    assert order == [1, 0]
+
+
+def test_cardinality_drift():
+    assert not cardinality_drifted(10, 20)
+    assert cardinality_drifted(10, 21)
+    assert cardinality_drifted(10, 4)
+    assert cardinality_drifted(0, 1)
+    assert not cardinality_drifted(0, 0)
+
+    predicate_map = {"A": [0, 1, 2], "B": [0]}
+    cardinalities = get_cardinalities(predicate_map)
+    assert cardinalities == {"A": 3, "B": 1}
+    assert not cardinalities_drifted(cardinalities, predicate_map)
+
+    predicate_map["B"].extend([1, 2])
+    assert cardinalities_drifted(cardinalities, predicate_map)
+    assert cardinalities_drifted(cardinalities, {"A": [0, 1, 2], "B": [0], "C": [0]})
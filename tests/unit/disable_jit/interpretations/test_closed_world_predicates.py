@@ -141,6 +141,15 @@ class Testclosed_worldIsStatisfiedNode:
         assert is_satisfied_node(interpretations, "node_a",
                                  ("pred_b", _Bound(1.0, 1.0)), closed_world) is True
 
+    def test_closed_world_predicates_as_set(self):
+        """The engine passes closed_world predicates as a label -> True dict."""
+        world = _World({"pred_a": _Interval(0.0, 1.0)})
+        interpretations = {"node_a": world}
+        assert is_satisfied_node(interpretations, "node_a",
+                                 ("pred_a", _Bound(1.0, 1.0)), {"pred_a": True}) is False
+        assert is_satisfied_node(interpretations, "node_a",
+                                 ("pred_a", _Bound(1.0, 1.0)), {"pred_b": True}) is True
+
     def test_none_na_returns_true(self):
         """na with None components should still return True regardless of closed_world."""
         interpretations = {}
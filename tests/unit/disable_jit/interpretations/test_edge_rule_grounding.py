@@ -0,0 +1,121 @@
+"""Unit tests for the per head grounding of edge rules in the interpretation backend."""
+import random
+
+import pytest
+from tests.unit.disable_jit.interpretations.test_interpretation_common import get_interpretation_helpers
+
+_h = get_interpretation_helpers("interpretation")
+interpretation = _h.interpretation
+ground_rule = _h.ground_rule
+get_refinement_scope = interpretation._get_refinement_scope
+partition_edge_groundings = interpretation._partition_edge_groundings
+get_partition = interpretation._get_partition
+get_head_edge_groundings = interpretation._get_head_edge_groundings
+
+DEFAULT_THRESHOLD = ("greater_equal", ("number", "total"), 1.0)
+
+
+class _ListShim:
+    def __call__(self, iterable=()):
+        return list(iterable)
+
+    def empty_list(self, *args, **kwargs):
+        return []
+
+
+class _DictShim:
+    def empty(self, *args, **kwargs):
+        return {}
+
+
+@pytest.fixture(autouse=True)
+def shim_types(monkeypatch):
+    monkeypatch.setattr(interpretation.numba.typed, "List", _ListShim())
+    monkeypatch.setattr(interpretation.numba.typed, "Dict", _DictShim())
+
+
+class DummyRule:
+    def __init__(self, clauses):
+        self._clauses = clauses
+    def get_type(self): return "edge"
+    def get_head_variables(self): return ["X", "Y"]
+    def get_clauses(self): return self._clauses
+    def get_thresholds(self): return [DEFAULT_THRESHOLD] * len(self._clauses)
+    def get_annotation_function(self): return ""
+    def get_edges(self): return ("", "", "r")
+    def get_head_function(self): return ["", ""]
+    def get_head_function_vars(self): return [[], []]
+
+
+def test_get_refinement_scope():
+    neighbors = {"X": ["Y"], "Z": ["W"]}
+    reverse_neighbors = {"Y": ["X"], "W": ["Z"]}
+    groundings_edges = {("X", "Y"): [], ("Z", "W"): []}
+    scope_variables, scope_edges = get_refinement_scope(["X", "Y"], groundings_edges, neighbors, reverse_neighbors)
+    assert scope_variables == ["X", "Y"]
+    assert scope_edges == [("X", "Y")]
+
+    neighbors["Y"] = ["Z"]
+    reverse_neighbors["Z"] = ["Y"]
+    groundings_edges[("Y", "Z")] = []
+    scope_variables, scope_edges = get_refinement_scope(["X", "Y"], groundings_edges, neighbors, reverse_neighbors)
+    assert scope_variables == ["X", "Y", "Z", "W"]
+    assert scope_edges == [("X", "Y"), ("Z", "W"), ("Y", "Z")]
+
+
+def test_partition_edge_groundings_keeps_edge_order():
+    edges = [("a", "x"), ("b", "x"), ("a", "y")]
+    assert partition_edge_groundings(edges, 0) == {"a": [("a", "x"), ("a", "y")], "b": [("b", "x")]}
+    assert partition_edge_groundings(edges, 1) == {"x": [("a", "x"), ("b", "x")], "y": [("a", "y")]}
+    assert get_partition({}, "a") == []
+
+
+@pytest.mark.parametrize("num_heads_1, num_heads_2", [(5, 30), (30, 5), (0, 5), (12, 12)])
+def test_get_head_edge_groundings_matches_all_pairs(num_heads_1, num_heads_2):
+    rng = random.Random(num_heads_1 * 100 + num_heads_2)
+    nodes = [f"n{i}" for i in range(20)]
+    edges = {(u, v): True for u in nodes for v in nodes if rng.random() < 0.2}
+    neighbors = {n: [v for u, v in edges if u == n] for n in nodes}
+    reverse_neighbors = {n: [u for u, v in edges if v == n] for n in nodes}
+    # Groundings can repeat nodes and contain nodes that are not in the graph
+    head_var_1_groundings = [rng.choice(nodes + ["missing"]) for _ in range(num_heads_1)]
+    head_var_2_groundings = [rng.choice(nodes + ["missing"]) for _ in range(num_heads_2)]
+
+    expected = [(g1, g2) for g1 in head_var_1_groundings for g2 in head_var_2_groundings if (g1, g2) in edges]
+    assert get_head_edge_groundings(head_var_1_groundings, head_var_2_groundings, neighbors, reverse_neighbors, edges) == expected
+
+
+def test_ground_rule_edge_heads_do_not_see_each_others_refinement(monkeypatch):
+    # r(X,Y) <- friend(X,Y), owns(Y,Z), likes(Z,W)
+    # likes(Z,W) does not have a head variable, it is narrowed by each head grounding through owns(Y,Z)
+    friend = [("x1", "y1"), ("x2", "y2"), ("x3", "y3")]
+    owns = [("y1", "z1"), ("y2", "z2"), ("y3", "z3")]
+    likes = [("z1", "w1"), ("z2", "w2")]
+    edges = friend + owns + likes
+    nodes = sorted({n for e in edges for n in e})
+    neighbors = {n: [e[1] for e in edges if e[0] == n] for n in nodes}
+    reverse_neighbors = {n: [e[0] for e in edges if e[1] == n] for n in nodes}
+    interpretations_node = {n: None for n in nodes}
+    labels = {**{e: "friend" for e in friend}, **{e: "owns" for e in owns}, **{e: "likes" for e in likes}}
+
+    monkeypatch.setattr(interpretation, "get_qualified_edge_groundings", lambda interpretations_edge, grounding, l, bnd, cwp: [e for e in grounding if interpretations_edge[e] == l])
+    monkeypatch.setattr(interpretation, "check_edge_grounding_threshold_satisfaction", lambda interpretations_edge, grounding, qualified, l, threshold, cwp: len(qualified) > 0)
+    monkeypatch.setattr(interpretation, "check_edge_clause_satisfaction", lambda interpretations_edge, grounding, l, bnd, threshold, cwp: any(interpretations_edge[e] == l for e in grounding))
+
+    rule = DummyRule([
+        ("edge", "friend", ("X", "Y"), (1, 1), ""),
+        ("edge", "owns", ("Y", "Z"), (1, 1), ""),
+        ("edge", "likes", ("Z", "W"), (1, 1), ""),
+    ])
+    _, apps_edge = ground_rule(
+        rule, interpretations_node, labels,
+        {}, {"friend": friend, "owns": owns, "likes": likes},
+        nodes, edges, neighbors, reverse_neighbors,
+        atom_trace=True, allow_ground_rules=False, t=0
+    )
+
+    # y3 owns z3, which does not like anything
+    assert [a[0] for a in apps_edge] == [("x1", "y1"), ("x2", "y2")]
+    qualified_edges = [a[3] for a in apps_edge]
+    assert qualified_edges[0] == [[("x1", "y1")], [("y1", "z1")], [("z1", "w1")]]
+    assert qualified_edges[1] == [[("x2", "y2")], [("y2", "z2")], [("z2", "w2")]]
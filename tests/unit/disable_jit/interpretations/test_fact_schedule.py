@@ -0,0 +1,76 @@
+"""Unit tests for the time-indexed fact schedule used by the interpretation backend."""
+import pytest
+from tests.unit.disable_jit.interpretations.test_interpretation_common import get_interpretation_helpers
+
+_h = get_interpretation_helpers("interpretation")
+interpretation = _h.interpretation
+build_fact_schedule = interpretation._build_fact_schedule
+get_due_facts = interpretation._get_due_facts
+remove_applied_facts = interpretation._remove_applied_facts
+
+
+class _ListShim:
+    def __call__(self, iterable=()):
+        return list(iterable)
+
+    def empty_list(self, *args, **kwargs):
+        return []
+
+
+class _DictShim:
+    def empty(self, *args, **kwargs):
+        return {}
+
+
+@pytest.fixture(autouse=True)
+def shim_types(monkeypatch):
+    monkeypatch.setattr(interpretation.numba.typed, "List", _ListShim())
+    monkeypatch.setattr(interpretation.numba.typed, "Dict", _DictShim())
+    monkeypatch.setattr(interpretation.numba.types, "uint16", lambda x: x)
+
+
+def _fact(t, name, static=False, end=None):
+    return (t, name, "L", (1, 1), static, False, t if end is None else end)
+
+
+def test_build_fact_schedule_groups_facts_by_time():
+    facts = [_fact(1, "a"), _fact(0, "b"), _fact(1, "c")]
+    assert build_fact_schedule(facts, 0) == {1: [0, 2], 0: [1]}
+    assert build_fact_schedule([], 0) == {}
+
+
+def test_build_fact_schedule_uses_start_of_interval():
+    # Facts that started before t_start are due at t_start, non-static facts that already ended are dropped
+    facts = [_fact(0, "a", end=5), _fact(0, "b", end=1), _fact(4, "c", end=6), _fact(0, "d", static=True)]
+    assert build_fact_schedule(facts, 2) == {2: [0, 3], 4: [2]}
+
+
+def test_get_due_facts_merges_static_facts_in_order():
+    schedule = {2: [1, 4]}
+    assert get_due_facts(schedule, [0, 3], 2) == [0, 1, 3, 4]
+    assert get_due_facts(schedule, [0, 3], 5) == [0, 3]
+    assert get_due_facts(schedule, [], 2) == [1, 4]
+
+
+def test_remove_applied_facts_keeps_static_and_future_facts():
+    facts = [_fact(0, "a"), _fact(1, "b", static=True), _fact(3, "c"), _fact(2, "d")]
+    trace = ["a", "b", "c", "d"]
+    remove_applied_facts(facts, trace, 0, 2, True)
+    assert facts == [_fact(3, "b", static=True), _fact(3, "c")]
+    assert trace == ["b", "c"]
+
+
+def test_remove_applied_facts_moves_interval_forward():
+    facts = [_fact(0, "a", end=5), _fact(1, "b", end=2), _fact(2, "c", end=4)]
+    trace = ["a", "b", "c"]
+    remove_applied_facts(facts, trace, 0, 2, True)
+    assert facts == [_fact(3, "a", end=5), _fact(3, "c", end=4)]
+    assert trace == ["a", "c"]
+
+
+def test_remove_applied_facts_without_atom_trace():
+    facts = [_fact(0, "a"), _fact(5, "b")]
+    trace = []
+    remove_applied_facts(facts, trace, 0, 0, False)
+    assert facts == [_fact(5, "b")]
+    assert trace == []
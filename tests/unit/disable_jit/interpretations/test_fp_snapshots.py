@@ -0,0 +1,140 @@
+"""Unit tests for sharing unchanged worlds between timesteps in the fixed point engine."""
+import pytest
+from tests.unit.disable_jit.interpretations.test_interpretation_common import get_interpretation_helpers
+
+_h = get_interpretation_helpers("interpretation_fp")
+interpretation = _h.interpretation
+label = _h.label
+share_worlds = interpretation._share_worlds
+own_world = interpretation._own_world
+
+
+class _ListShim:
+    def __call__(self, iterable=()):
+        return list(iterable)
+
+    def empty_list(self, *args, **kwargs):
+        return []
+
+
+class _DictShim:
+    def empty(self, *args, **kwargs):
+        return {}
+
+
+class _World:
+    def __init__(self, labels=()):
+        self.world = {}
+
+
+class _Bound:
+    def __init__(self, lower, upper):
+        self.lower, self.upper = lower, upper
+
+    def copy(self):
+        return _Bound(self.lower, self.upper)
+
+    def is_static(self):
+        return False
+
+
+@pytest.fixture(autouse=True)
+def shim_types(monkeypatch):
+    monkeypatch.setattr(interpretation.numba.typed, "List", _ListShim())
+    monkeypatch.setattr(interpretation.numba.typed, "Dict", _DictShim())
+    monkeypatch.setattr(interpretation.world, "World", _World)
+
+
+def _world(**bounds):
+    w = _World()
+    w.world = {label.Label(l): _Bound(*bnd) for l, bnd in bounds.items()}
+    return w
+
+
+def _bounds(w):
+    return {l.get_value(): (bnd.lower, bnd.upper) for l, bnd in w.world.items()}
+
+
+def test_own_world_copies_shared_world_once():
+    w = _world(A=(1, 1))
+    interpretations = {"a": w, "b": _world()}
+    shared = {"a": True}
+
+    own_world(interpretations, shared, "a")
+    assert interpretations["a"] is not w
+    assert _bounds(interpretations["a"]) == _bounds(w)
+    assert interpretations["a"].world[label.Label("A")] is not w.world[label.Label("A")]
+    assert shared == {}
+
+    # Worlds that are not shared are changed in place
+    owned = interpretations["a"]
+    own_world(interpretations, shared, "a")
+    assert interpretations["a"] is owned
+    own_world(interpretations, shared, "c")
+    assert "c" not in interpretations
+
+
+def test_share_worlds_adds_missing_components_by_reference():
+    last_t_interp = {"a": _world(A=(1, 1)), "b": _world(A=(1, 1), B=(0, 1))}
+    b = _world(A=(0.5, 1))
+    interp = {"b": b}
+    last_t_shared, shared = {}, {}
+
+    share_worlds(last_t_interp, last_t_shared, interp, shared)
+    assert interp["a"] is last_t_interp["a"]
+    assert last_t_shared == {"a": True}
+    assert shared == {"a": True}
+    # Only the missing labels are copied, the values of the previous fp operation are kept
+    assert interp["b"] is b
+    assert _bounds(b) == {"A": (0.5, 1), "B": (0, 1)}
+    assert b.world[label.Label("B")] is not last_t_interp["b"].world[label.Label("B")]
+
+
+def test_share_worlds_copies_shared_world_before_adding_labels():
+    # The world of b at this timestep is shared with the next timestep
+    b = _world(A=(0.5, 1))
+    interp = {"b": b}
+    shared = {"b": True}
+
+    share_worlds({"b": _world(B=(0, 1))}, {}, interp, shared)
+    assert _bounds(b) == {"A": (0.5, 1)}
+    assert _bounds(interp["b"]) == {"A": (0.5, 1), "B": (0, 1)}
+    assert shared == {}
+
+    # Nothing is copied when the timestep already has every label
+    last_t_interp = {"c": _world(A=(1, 1))}
+    interp = {"c": last_t_interp["c"]}
+    shared = {"c": True}
+    share_worlds(last_t_interp, {"c": True}, interp, shared)
+    assert interp["c"] is last_t_interp["c"]
+    assert shared == {"c": True}
+
+
+def test_persistent_reason_does_not_change_earlier_timesteps(monkeypatch):
+    """Fact A(n1) holds at timestep 0 and fact B(n1) is applied at timestep 1. Timestep 0 must not see B."""
+    def update_node_stub(interp, predicate_map, comp, lb, *args, **kwargs):
+        l, bnd = lb
+        changed = l not in interp[comp].world or (interp[comp].world[l].lower, interp[comp].world[l].upper) != (bnd.lower, bnd.upper)
+        interp[comp].world[l] = bnd.copy()
+        return changed, 1 if changed else 0
+
+    monkeypatch.setattr(interpretation, "_update_node", update_node_stub)
+    monkeypatch.setattr(interpretation, "check_consistent_node", lambda *a, **k: True)
+    monkeypatch.setattr(interpretation.numba.types, "uint16", lambda x: x)
+
+    a, b = label.Label("A"), label.Label("B")
+    interpretations_node = {0: {"n1": _world()}}
+    shared_worlds_node = {}
+    _h.reason(
+        interpretations_node, {0: {}}, {}, {}, 2, [0, 0], [], ["n1"], [], {"n1": []}, {"n1": []},
+        [], [], [], [], [], [], [(0, "n1", a, _Bound(1, 1), False, False, 0), (1, "n1", b, _Bound(1, 1), False, False, 1)], [], [], [],
+        [], [], [], [], [], {}, False, False, True, False, False, "intersection", False, 1, {}, (),
+        "perfect_convergence", 0, False, False, [], shared_worlds_node=shared_worlds_node, shared_worlds_edge={},
+    )
+
+    assert _bounds(interpretations_node[0]["n1"]) == {"A": (1, 1)}
+    assert _bounds(interpretations_node[1]["n1"]) == {"A": (1, 1), "B": (1, 1)}
+    assert _bounds(interpretations_node[2]["n1"]) == {"A": (1, 1), "B": (1, 1)}
+    # Timestep 2 holds the world of timestep 1, it does not change after B is applied
+    assert interpretations_node[2]["n1"] is interpretations_node[1]["n1"]
+    assert "n1" in shared_worlds_node[1] and "n1" in shared_worlds_node[2]
@@ -0,0 +1,114 @@
+"""Unit tests for the generic join used to ground rules with cyclic bodies in the interpretation backend."""
+import pytest
+from tests.unit.disable_jit.interpretations.test_interpretation_common import get_interpretation_helpers
+
+_h = get_interpretation_helpers("interpretation")
+interpretation = _h.interpretation
+ground_rule = _h.ground_rule
+is_cyclic_body = interpretation._is_cyclic_body
+build_join_index = interpretation._build_join_index
+has_join_witness = interpretation._has_join_witness
+
+DEFAULT_THRESHOLD = ("greater_equal", ("number", "total"), 1.0)
+
+
+class _ListShim:
+    def __call__(self, iterable=()):
+        return list(iterable)
+
+    def empty_list(self, *args, **kwargs):
+        return []
+
+
+class _DictShim:
+    def empty(self, *args, **kwargs):
+        return {}
+
+
+@pytest.fixture(autouse=True)
+def shim_types(monkeypatch):
+    monkeypatch.setattr(interpretation.numba.typed, "List", _ListShim())
+    monkeypatch.setattr(interpretation.numba.typed, "Dict", _DictShim())
+
+
+class DummyRule:
+    def __init__(self, clauses, thresholds):
+        self._clauses = clauses
+        self._thresholds = thresholds
+    def get_type(self): return "node"
+    def get_head_variables(self): return ["X"]
+    def get_clauses(self): return self._clauses
+    def get_thresholds(self): return self._thresholds
+    def get_annotation_function(self): return ""
+    def get_edges(self): return ("", "", "popular")
+    def get_head_function(self): return [""]
+    def get_head_function_vars(self): return [[]]
+
+
+def test_is_cyclic_body():
+    assert not is_cyclic_body({("X", "Y"): [], ("Y", "Z"): []})
+    assert is_cyclic_body({("X", "Y"): [], ("Y", "Z"): [], ("X", "Z"): []})
+    # Two clauses on the same variables and self loops are cycles as well
+    assert is_cyclic_body({("X", "Y"): [], ("Y", "X"): []})
+    assert is_cyclic_body({("X", "X"): []})
+    assert not is_cyclic_body({})
+
+
+def test_has_join_witness_triangle():
+    groundings = {"X": ["x1", "x2"], "Y": ["y1", "y2"], "Z": ["z1", "z2"]}
+    groundings_edges = {
+        ("X", "Y"): [("x1", "y1"), ("x2", "y2")],
+        ("Y", "Z"): [("y1", "z1"), ("y2", "z2")],
+        ("X", "Z"): [("x1", "z2"), ("x2", "z2")],
+    }
+    index = build_join_index(groundings, groundings_edges, True)
+
+    # Every edge grounding is part of a grounding of some clause, but only x2 closes the triangle
+    assert not has_join_witness({"X": "x1"}, *index)
+    assert has_join_witness({"X": "x2"}, *index)
+    # Assigned variables have to satisfy the clauses between them
+    assert not has_join_witness({"X": "x2", "Y": "y1"}, *index)
+
+
+def test_build_join_index_is_empty_for_acyclic_bodies():
+    clauses, edges, forward, reverse, nodes = build_join_index({"X": ["x1"], "Y": ["y1"]}, {("X", "Y"): [("x1", "y1")]}, False)
+    assert (clauses, edges, forward, reverse, nodes) == ([], [], [], [], {})
+
+
+def _ground_triangle(monkeypatch, thresholds):
+    # popular(X) <- friend(X,Y), owns(Y,Z), owns(X,Z)
+    # Only x3 owns what one of its friends owns, x1 and x2 satisfy every clause on its own
+    friend = [("x1", "y1"), ("x2", "y2"), ("x3", "y3")]
+    owns = [("y1", "z1"), ("x1", "z2"), ("y2", "z2"), ("x2", "z1"), ("y3", "z3"), ("x3", "z3")]
+    nodes = sorted({n for e in friend + owns for n in e})
+    edges = friend + owns
+    neighbors = {n: [e[1] for e in edges if e[0] == n] for n in nodes}
+    reverse_neighbors = {n: [e[0] for e in edges if e[1] == n] for n in nodes}
+    interpretations_node = {n: None for n in nodes}
+    interpretations_edge = {e: ("friend" if e in friend else "owns") for e in edges}
+
+    monkeypatch.setattr(interpretation, "get_qualified_edge_groundings", lambda interpretations_edge, grounding, l, bnd, cwp: [e for e in grounding if interpretations_edge[e] == l])
+    monkeypatch.setattr(interpretation, "check_edge_grounding_threshold_satisfaction", lambda *a, **k: True)
+    monkeypatch.setattr(interpretation, "check_all_clause_satisfaction", lambda *a, **k: True)
+
+    rule = DummyRule([
+        ("edge", "friend", ("X", "Y"), (1, 1), ""),
+        ("edge", "owns", ("Y", "Z"), (1, 1), ""),
+        ("edge", "owns", ("X", "Z"), (1, 1), ""),
+    ], thresholds)
+    apps_node, _ = ground_rule(
+        rule, interpretations_node, interpretations_edge,
+        {}, {"friend": friend, "owns": owns},
+        nodes, edges, neighbors, reverse_neighbors,
+        atom_trace=False, allow_ground_rules=False, t=0
+    )
+    return [a[0] for a in apps_node]
+
+
+def test_ground_rule_joins_cyclic_body(monkeypatch):
+    assert _ground_triangle(monkeypatch, [DEFAULT_THRESHOLD] * 3) == ["x3"]
+
+
+def test_ground_rule_keeps_refinement_with_custom_thresholds(monkeypatch):
+    thresholds = [DEFAULT_THRESHOLD, DEFAULT_THRESHOLD, ("greater_equal", ("percent", "total"), 50.0)]
+    assert _ground_triangle(monkeypatch, thresholds) == ["x1", "x2", "x3"]
@@ -27,6 +27,11 @@ class FakeWorld:
         # bounds_by_label maps label -> [lower, upper] interval bounds
         self.bounds_by_label = bounds_by_label or {}
 
+    @property
+    def world(self):
+        # The labels this world has a bound for
+        return {**self.truth_by_label, **self.bounds_by_label}
+
     def is_satisfied(self, label, interval):
         # Backward compatibility: if bounds_by_label is used, do interval containment check
         if label in self.bounds_by_label:
@@ -483,84 +488,75 @@ def test_check_grounding_threshold_total_uses_len_grounding(
 
 
 @pytest.mark.parametrize(
-    "label,check_fn,get_q_attr,grounding,qualified,threshold,available_return",
+    "label,check_fn,grounding,qualified,threshold",
     [
         (
             "node",
             check_node_grounding_threshold_satisfaction,
-            "get_qualified_node_groundings",
             ["x", "y", "z", "w"],
             ["x"],                               # qualified_grounding length = 1
             ("less", ("percent", "available"), 60),
-            ["a", "b", "c"],                    # len=3 becomes neigh_len
         ),
         (
             "edge",
             check_edge_grounding_threshold_satisfaction,
-            "get_qualified_edge_groundings",
             [("u","v"), ("v","w"), ("w","x"), ("x","y")],
             [("u","v")],                        # qualified_grounding length = 1
             ("less", ("percent", "available"), 60),
-            [("p","q"), ("q","r"), ("r","s")], # len=3 becomes neigh_len
         ),
     ],
 )
-def test_check_grounding_threshold_available_calls_get_qualified(
-    interpretations, monkeypatch, label, check_fn, get_q_attr, grounding, qualified, threshold, available_return
+def test_check_grounding_threshold_available_counts_available(
+    interpretations, monkeypatch, label, check_fn, grounding, qualified, threshold
 ):
-    # Avoid constructing real Interval; just return a sentinel
-    monkeypatch.setattr(interpretation.interval, "closed", lambda lo, up: ("closed", lo, up))
-    sentinel_closed = interpretation.interval.closed(0, 1)
+    # _count_available_components returns 3 "available" neighbors -> neigh_len should be 3
+    mock_count = Mock(return_value=3)
+    monkeypatch.setitem(check_fn.__globals__, "_count_available_components", mock_count)
 
-    # get_qualified_* returns N "available" neighbors -> neigh_len should be N
-    mock_get_q = Mock(return_value=available_return)
-    monkeypatch.setitem(check_fn.__globals__, get_q_attr, mock_get_q)
+    # The available neighbors are counted without filtering the grounding again
+    mock_get_q = Mock()
+    monkeypatch.setitem(check_fn.__globals__, "get_qualified_%s_groundings" % label, mock_get_q)
 
-    # _satisfies_threshold should be called with (len(available_return), len(qualified), threshold)
     mock_sat = Mock(return_value=False)
     monkeypatch.setitem(check_fn.__globals__, "_satisfies_threshold", mock_sat)
 
     out = check_fn(interpretations, grounding, qualified, "owns", threshold, [])
 
     assert out is False
-    mock_get_q.assert_called_once_with(interpretations, grounding, "owns", sentinel_closed, [])
-    mock_sat.assert_called_once_with(len(available_return), len(qualified), threshold)
-
+    mock_count.assert_called_once_with(interpretations, grounding, "owns", [])
+    mock_get_q.assert_not_called()
+    mock_sat.assert_called_once_with(3, len(qualified), threshold)
 
 
-def test_check_node_grounding_threshold_available_calls_get_qualified(interpretations, monkeypatch):
-    # Replace interval.closed to avoid constructing real Interval objects
-    monkeypatch.setattr(interpretation.interval, "closed", lambda lo, up: ("closed", lo, up))
-    sentinel_closed = interpretation.interval.closed(0, 1)
+@pytest.mark.parametrize(
+    "threshold",
+    [
+        ("greater_equal", ("number", "available"), 1),
+        ("greater_equal", ("percent", "available"), 25),
+        ("greater", ("percent", "available"), 20),
+    ],
+)
+def test_check_grounding_threshold_available_skips_count_when_decided(interpretations, monkeypatch, threshold):
+    # Number thresholds do not depend on the available neighbors, and 1 of 4 neighbors is already enough for the percentages
+    mock_count = Mock()
+    monkeypatch.setitem(check_node_grounding_threshold_satisfaction.__globals__, "_count_available_components", mock_count)
 
-    # get_qualified_node_groundings returns 3 "available" neighbors
-    mock_get_q = Mock(return_value=["a", "b", "c"])  # len = 3
-    monkeypatch.setitem(
-        check_node_grounding_threshold_satisfaction.__globals__,
-        "get_qualified_node_groundings",
-        mock_get_q,
-    )
+    out = check_node_grounding_threshold_satisfaction(interpretations, ["x", "y", "z", "w"], ["x"], "owns", threshold, [])
 
-    # _satisfies_threshold should be called with neigh_len = 3, qualified_len = 1
-    mock_sat = Mock(return_value=False)
-    monkeypatch.setitem(
-        check_node_grounding_threshold_satisfaction.__globals__,
-        "_satisfies_threshold",
-        mock_sat,
-    )
+    assert out is True
+    mock_count.assert_not_called()
 
-    grounding = ["x", "y", "z", "w"]        # original neighbors (len doesn't matter in 'available' branch)
-    qualified_grounding = ["x"]             # len = 1
-    clause_label = "owns"
-    threshold = ("less", ("percent", "available"), 60)  # mode 'percent', quantifier 'available'
 
-    out = check_node_grounding_threshold_satisfaction(
-        interpretations, grounding, qualified_grounding, clause_label, threshold, []
-    )
+def test_count_available_components():
+    class _World:
+        def __init__(self, *labels):
+            self.world = {l: None for l in labels}
 
-    assert out is False
-    mock_get_q.assert_called_once_with(interpretations, grounding, clause_label, sentinel_closed, [])
-    mock_sat.assert_called_once_with(3, 1, threshold)
+    interpretations = {"a": _World("owns"), "b": _World(), "c": _World("owns", "likes")}
+    assert count_available_components(interpretations, ["a", "b", "c", "missing"], "owns", []) == 2
+    assert count_available_components(interpretations, ["a", "b", "c"], "likes", []) == 1
+    # Missing labels of closed world predicates are [0,0], which is available
+    assert count_available_components(interpretations, ["a", "b", "c"], "likes", ["likes"]) == 3
 
 
 # ---- refine_groundings tests ----
@@ -671,11 +667,11 @@ def test_refine_groundings_deduplicates_neighbor_nodes(monkeypatch):
 # ---- check_all_clause_satisfaction tests ----
 
 def test_check_all_clause_satisfaction_calls_both_helpers_and_ands_results(interpretations, monkeypatch):
-    # Node helper returns False; Edge helper returns True
-    mock_node = Mock(return_value=False)
-    mock_edge = Mock(return_value=True)
-    monkeypatch.setattr(interpretation, "check_node_grounding_threshold_satisfaction", mock_node)
-    monkeypatch.setattr(interpretation, "check_edge_grounding_threshold_satisfaction", mock_edge)
+    # Node helper returns True; Edge helper returns False
+    mock_node = Mock(return_value=True)
+    mock_edge = Mock(return_value=False)
+    monkeypatch.setattr(interpretation, "check_node_clause_satisfaction", mock_node)
+    monkeypatch.setattr(interpretation, "check_edge_clause_satisfaction", mock_edge)
 
     # Groundings/edges expected by the function
     groundings = {"X": ["n1", "n2"]}
@@ -694,19 +690,17 @@ def test_check_all_clause_satisfaction_calls_both_helpers_and_ands_results(inter
         interpretations, interpretations, clauses, thresholds, groundings, groundings_edges, []
     )
 
-    # Overall AND -> False and no short-circuit: both helpers were called
+    # Overall AND -> False: both helpers were called with the groundings of their clause
     assert out is False
-    # Note: The second parameter is now qualified_groundings (filtered by clause bound [0,1])
-    # With FakeWorld using truth_by_label, nodes with the label will pass the filter
-    assert mock_node.call_count == 1
-    assert mock_edge.call_count == 1
+    mock_node.assert_called_once_with(interpretations, ["n1", "n2"], "owns", [0, 1], thresholds[0], [])
+    mock_edge.assert_called_once_with(interpretations, [("n1", "m1"), ("n2", "m2")], "likes", [0, 1], thresholds[1], [])
 
 
 def test_check_all_clause_satisfaction_all_true_returns_true(interpretations, monkeypatch):
     mock_node = Mock(return_value=True)
     mock_edge = Mock(return_value=True)
-    monkeypatch.setattr(interpretation, "check_node_grounding_threshold_satisfaction", mock_node)
-    monkeypatch.setattr(interpretation, "check_edge_grounding_threshold_satisfaction", mock_edge)
+    monkeypatch.setattr(interpretation, "check_node_clause_satisfaction", mock_node)
+    monkeypatch.setattr(interpretation, "check_edge_clause_satisfaction", mock_edge)
 
     groundings = {"X": ["n1"]}
     groundings_edges = {("X", "Y"): [("n1", "m1")]}
@@ -737,14 +731,13 @@ def test_check_all_clause_satisfaction_empty_clauses_returns_true(interpretation
     assert out is True
 
 
-def test_check_all_clause_satisfaction_multiple_clauses_no_short_circuit(interpretations, monkeypatch):
-    # First two fail, last succeeds — we still call all of them once
-    seq_node = [False, False, True]  # we'll use node helper for 3 node clauses
-    mock_node = Mock(side_effect=seq_node)
-    monkeypatch.setattr(interpretation, "check_node_grounding_threshold_satisfaction", mock_node)
+def test_check_all_clause_satisfaction_multiple_clauses_short_circuits(interpretations, monkeypatch):
+    # The second clause fails, so the third one is not checked
+    mock_node = Mock(side_effect=[True, False, True])
+    monkeypatch.setattr(interpretation, "check_node_clause_satisfaction", mock_node)
 
     # No edge clauses in this test; keep the symbol in place
-    monkeypatch.setattr(interpretation, "check_edge_grounding_threshold_satisfaction", Mock())
+    monkeypatch.setattr(interpretation, "check_edge_clause_satisfaction", Mock())
 
     groundings = {"A": ["a"], "B": ["b"], "C": ["c"]}
     groundings_edges = {}
@@ -764,12 +757,66 @@ def test_check_all_clause_satisfaction_multiple_clauses_no_short_circuit(interpr
         interpretations, interpretations, clauses, thresholds, groundings, groundings_edges, []
     )
 
-    assert out is False                          # False AND False AND True -> False
-    assert mock_node.call_count == 3             # all evaluated; no short-circuit
-    # Note: The second parameter is now qualified_groundings (filtered by clause bound [0,1])
-    # Since the test uses FakeWorld with truth_by_label, all nodes pass the filter
-    # So qualified_groundings == groundings for this test
-    assert mock_node.call_count == 3
+    assert out is False                          # True AND False -> False
+    assert mock_node.call_count == 2
+
+
+_STREAMING_THRESHOLDS = [
+    (op, (quantity, quantifier), value)
+    for op in ("greater_equal", "greater", "less_equal", "less", "equal")
+    for quantity, quantifier, value in (
+        ("number", "total", 1), ("number", "total", 3), ("number", "available", 2),
+        ("percent", "total", 50), ("percent", "available", 60),
+    )
+]
+
+
+@pytest.mark.parametrize("threshold", _STREAMING_THRESHOLDS)
+@pytest.mark.parametrize("truths", [[], [True, False, True, False, False], [False] * 4 + [True] * 3])
+def test_check_clause_satisfaction_matches_full_evaluation(monkeypatch, threshold, truths):
+    monkeypatch.setattr(interpretation.interval, "closed", lambda lo, up: ("closed", lo, up))
+    # Every node has the label, qualified nodes satisfy the clause bound
+    interpretations = {
+        f"n{i}": FakeWorld(bounds_by_label={"L": [1, 1] if truth else [0, 0]}) for i, truth in enumerate(truths)
+    }
+    grounding = list(interpretations)
+    bnd = ("closed", 1, 1)
+
+    qualified = get_qualified_node_groundings(interpretations, grounding, "L", bnd, [])
+    expected = check_node_grounding_threshold_satisfaction(interpretations, grounding, qualified, "L", threshold, [])
+    assert check_node_clause_satisfaction(interpretations, grounding, "L", bnd, threshold, []) == expected
+    assert check_edge_clause_satisfaction(interpretations, grounding, "L", bnd, threshold, []) == expected
+
+
+@pytest.mark.parametrize(
+    "threshold,expected,num_checked",
+    [
+        (("greater_equal", ("number", "total"), 1), True, 2),     # Decided by the first qualified node
+        (("less", ("number", "total"), 1), False, 2),              # "Not exists" is decided by it as well
+        (("greater_equal", ("number", "total"), 5), False, 0),    # 5 of 4 nodes can never qualify
+        (("greater_equal", ("percent", "total"), 75), False, 3),  # Two nodes that do not qualify leave at most 50%
+        (("equal", ("number", "total"), 1), True, 4),             # Equalities count every node
+    ],
+)
+def test_check_clause_satisfaction_stops_once_decided(monkeypatch, threshold, expected, num_checked):
+    monkeypatch.setattr(interpretation.interval, "closed", lambda lo, up: ("closed", lo, up))
+    interpretations = {
+        "n1": FakeWorld(bounds_by_label={"L": [0, 0]}),
+        "n2": FakeWorld(bounds_by_label={"L": [1, 1]}),
+        "n3": FakeWorld(bounds_by_label={"L": [0, 0]}),
+        "n4": FakeWorld(bounds_by_label={"L": [0, 0]}),
+    }
+    checked = []
+    is_satisfied = interpretation.is_satisfied_node
+    is_satisfied = getattr(is_satisfied, "py_func", is_satisfied)
+
+    def is_satisfied_spy(interpretations, comp, na, closed_world_predicates):
+        checked.append(comp)
+        return is_satisfied(interpretations, comp, na, closed_world_predicates)
+
+    monkeypatch.setattr(interpretation, "is_satisfied_node", is_satisfied_spy)
+    assert check_node_clause_satisfaction(interpretations, list(interpretations), "L", ("closed", 1, 1), threshold, []) is expected
+    assert len(checked) == num_checked
 
 
 def test_add_node_minimal(monkeypatch):
@@ -1498,7 +1545,8 @@ def test_ground_rule_edge_clause_ground_atom_allow_ground_rules(monkeypatch):
     neighbors = {"A": ["B"]}
     reverse_neighbors = {"B": ["A"]}
     predicate_map_node, predicate_map_edge = {}, {}
-    interpretations_node, interpretations_edge = {}, {}
+    interpretations_node = {"A": object(), "B": object()}
+    interpretations_edge = {("A", "B"): object()}
 
     apps_node, apps_edge = ground_rule(
         rule, interpretations_node, interpretations_edge,
@@ -1536,7 +1584,8 @@ def test_ground_rule_edge_head_vars_use_existing_nodes_when_allowed(monkeypatch)
     neighbors = {"A": ["B"]}
     reverse_neighbors = {"B": ["A"]}
     predicate_map_node, predicate_map_edge = {}, {}
-    interpretations_node, interpretations_edge = {}, {}
+    interpretations_node = {"A": object(), "B": object()}
+    interpretations_edge = {("A", "B"): object()}
 
     apps_node, apps_edge = ground_rule(
         rule,
@@ -1939,7 +1988,7 @@ def test_ground_rule_edge_with_node_clauses_tracing(monkeypatch):
         "b1": DummyNW({"L2": "ANN_b1"}),
         "z1": DummyNW({"L3": "ANN_z1"}),
     }
-    interpretations_edge = {}
+    interpretations_edge = {("a1", "b1"): DummyNW({})}
 
     rule = DummyRule(
         rtype="edge",
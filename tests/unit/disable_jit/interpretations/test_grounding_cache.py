@@ -0,0 +1,162 @@
+"""Unit tests for the grounding cache of the interpretation backend.
+
+The applicable rules of a rule are reused while the versions of its body predicates, their number of components
+and the size of the graph do not change.
+"""
+import pytest
+from unittest.mock import Mock
+from tests.unit.disable_jit.interpretations.test_interpretation_common import get_interpretation_helpers
+
+_h = get_interpretation_helpers("interpretation")
+interpretation = _h.interpretation
+label = _h.label
+bump_label_versions = interpretation._bump_label_versions
+grounding_signature = interpretation._grounding_signature
+evict_groundings = interpretation._evict_groundings
+
+
+class _ListShim:
+    def __call__(self, iterable=()):
+        return list(iterable)
+
+    def empty_list(self, *args, **kwargs):
+        return []
+
+
+class _DictShim:
+    def empty(self, *args, **kwargs):
+        return {}
+
+
+class _World:
+    def __init__(self):
+        self.world = {}
+
+
+class _Bound:
+    def __init__(self, lower, upper):
+        self.lower, self.upper = lower, upper
+
+    def __eq__(self, other):
+        return isinstance(other, _Bound) and (self.lower, self.upper) == (other.lower, other.upper)
+
+    def is_static(self):
+        return False
+
+
+@pytest.fixture(autouse=True)
+def shim_types(monkeypatch):
+    monkeypatch.setattr(interpretation.numba.typed, "List", _ListShim())
+    monkeypatch.setattr(interpretation.numba.typed, "Dict", _DictShim())
+    monkeypatch.setattr(interpretation.numba.types, "uint16", lambda x: x)
+    monkeypatch.setattr(interpretation.interval, "closed", lambda lo, up: _Bound(lo, up))
+
+
+def _make_rule(name, body_label, target, clause_type="node"):
+    rule = Mock()
+    rule.get_name.return_value = name
+    rule.get_type.return_value = "node"
+    rule.get_edges.return_value = ("", "", label.Label(""))
+    rule.get_delta.return_value = 0
+    rule.get_target.return_value = label.Label(target)
+    rule.is_static_rule.return_value = False
+    rule.get_weights.return_value = []
+    rule.get_clauses.return_value = [(clause_type, label.Label(body_label), ["x"], (0, 1), "")]
+    rule.get_thresholds.return_value = [("greater_equal", ("number", "total"), 1.0)]
+    return rule
+
+
+def test_bump_label_versions():
+    a, b = label.Label("A"), label.Label("B")
+    versions = {a: 2}
+    bump_label_versions(versions, {a: True, b: True})
+    assert versions == {a: 3, b: 1}
+
+
+def test_grounding_signature_changes_with_body_predicates_and_graph():
+    a, b = label.Label("A"), label.Label("B")
+    rule = _make_rule("r", "A", "B")
+    versions = {}
+    predicate_map = {a: ["n1"]}
+    signature = grounding_signature(rule, versions, {}, predicate_map, {}, 10)
+    assert signature == 11
+
+    # Predicates that are not in the body do not change the signature
+    versions[b] = 1
+    assert grounding_signature(rule, versions, {}, predicate_map, {}, 10) == signature
+
+    versions[a] = 1
+    assert grounding_signature(rule, versions, {}, predicate_map, {}, 10) > signature
+    predicate_map[a].append("n2")
+    assert grounding_signature(rule, versions, {}, predicate_map, {}, 10) > signature + 1
+    assert grounding_signature(rule, {}, {}, {a: ["n1"]}, {}, 11) > signature
+
+    # Rules with comparison clauses are not cached
+    assert grounding_signature(_make_rule("r", "A", "B", clause_type="comparison"), {}, {}, {}, {}, 10) == -1
+
+
+def test_evict_groundings_removes_least_recently_used():
+    signatures = [5, 7, -1, 3]
+    last_used = [1, 2, 0, 3]
+    node_rules = [["g"] * 2, ["g"] * 3, [], ["g"] * 2]
+    edge_rules = [[], ["g"], [], []]
+
+    # Rule 0 is grounded now, rule 1 is the least recently used
+    evict_groundings(signatures, last_used, node_rules, edge_rules, [0], 4, 5)
+    assert signatures == [5, -1, -1, 3]
+    assert last_used == [4, 2, 0, 3]
+    assert node_rules[1] == [] and edge_rules[1] == []
+
+    evict_groundings(signatures, last_used, node_rules, edge_rules, [], 5, 0)
+    assert signatures == [-1, -1, -1, -1]
+
+
+def _run_reason(monkeypatch, grounding_cache_size):
+    """Fact L(n1) triggers r_l: M(x) <- L(x). Only r_m: N(x) <- M(x) has to be grounded again once M(n1) is derived."""
+    node = "n1"
+    l_label = label.Label("L")
+    rules = [_make_rule("r_a", "A", "B"), _make_rule("r_l", "L", "M"), _make_rule("r_m", "M", "N")]
+    interpretations_node = {node: _World()}
+
+    ground_calls = {r.get_name(): 0 for r in rules}
+
+    def ground_rule_stub(rule, interpretations_node, *args, **kwargs):
+        ground_calls[rule.get_name()] += 1
+        body_label = rule.get_clauses()[0][1]
+        if body_label in interpretations_node[node].world:
+            return [(node, [], [], [], None)], []
+        return [], []
+
+    def update_node_stub(interp, predicate_map, comp, lb, *args, **kwargs):
+        l, bnd = lb
+        changed = interp[comp].world.get(l) != bnd
+        interp[comp].world[l] = bnd
+        return changed, 1 if changed else 0
+
+    monkeypatch.setattr(interpretation, "_ground_rule", ground_rule_stub)
+    monkeypatch.setattr(interpretation, "_update_node", Mock(side_effect=update_node_stub))
+    monkeypatch.setattr(interpretation, "check_consistent_node", lambda *a, **k: True)
+    monkeypatch.setattr(interpretation, "annotate", lambda *a, **k: (1, 1))
+
+    rule_trace = []
+    reason_fn = getattr(interpretation.Interpretation.reason, "py_func", interpretation.Interpretation.reason)
+    fp_cnt, _ = reason_fn(
+        interpretations_node, {}, {}, {}, 0, [0, 0], rules, [node], [], {node: []}, {node: []},
+        [], [], [], [], [], [], [(0, node, l_label, _Bound(1, 1), False, False, 0)], [], [], [],
+        [], rule_trace, [], [], [], {}, False, False, False, False, False, "", False, 0, (), (),
+        "perfect_convergence", 0, [0], False, False, [], False, grounding_cache_size,
+    )
+    return fp_cnt, ground_calls, {l.get_value(): (b.lower, b.upper) for l, b in interpretations_node[node].world.items()}
+
+
+def test_reason_reuses_cached_groundings(monkeypatch):
+    fp_uncached, uncached_calls, uncached_world = _run_reason(monkeypatch, grounding_cache_size=0)
+    fp_cached, cached_calls, cached_world = _run_reason(monkeypatch, grounding_cache_size=100)
+
+    assert fp_uncached == fp_cached
+    assert uncached_world == cached_world == {"L": (1, 1), "M": (1, 1), "N": (1, 1)}
+
+    # Every rule is grounded in every fixed point operation without the cache
+    assert uncached_calls == {"r_a": 3, "r_l": 3, "r_m": 3}
+    # With the cache, r_l is not grounded again after it derived M(n1) and r_m only when M changed
+    assert cached_calls == {"r_a": 1, "r_l": 1, "r_m": 2}
@@ -0,0 +1,163 @@
+"""Unit tests for splitting the grounding of a rule over partitions of the candidates of its head variable."""
+import pytest
+from tests.unit.disable_jit.interpretations.test_interpretation_common import get_interpretation_helpers
+
+_h = get_interpretation_helpers("interpretation")
+interpretation = _h.interpretation
+ground_rule = _h.ground_rule
+schedule_grounding_tasks = interpretation._schedule_grounding_tasks
+get_head_candidates = interpretation._get_head_candidates
+cache_groundings = interpretation._cache_groundings
+get_segment_end = interpretation._get_segment_end
+may_add_to_graph = interpretation._may_add_to_graph
+
+DEFAULT_THRESHOLD = ("greater_equal", ("number", "total"), 1.0)
+
+
+class _ListShim:
+    def __call__(self, iterable=()):
+        return list(iterable)
+
+    def empty_list(self, *args, **kwargs):
+        return []
+
+
+class _DictShim:
+    def empty(self, *args, **kwargs):
+        return {}
+
+
+@pytest.fixture(autouse=True)
+def shim_types(monkeypatch):
+    monkeypatch.setattr(interpretation.numba.typed, "List", _ListShim())
+    monkeypatch.setattr(interpretation.numba.typed, "Dict", _DictShim())
+
+
+class DummyRule:
+    def __init__(self, clauses, rule_type="node", thresholds=None, ann_fn=""):
+        self._clauses = clauses
+        self._type = rule_type
+        self._thresholds = thresholds or [DEFAULT_THRESHOLD] * len(clauses)
+        self._ann_fn = ann_fn
+    def get_type(self): return self._type
+    def get_head_variables(self): return ["X"] if self._type == "node" else ["X", "W"]
+    def get_clauses(self): return self._clauses
+    def get_thresholds(self): return self._thresholds
+    def get_annotation_function(self): return self._ann_fn
+    def get_edges(self): return ("", "", "popular")
+    def get_head_function(self): return [""] if self._type == "node" else ["", ""]
+    def get_head_function_vars(self): return [[]] if self._type == "node" else [[], []]
+
+
+def _clause(clause_type, lbl, variables):
+    return (clause_type, lbl, variables, (1, 1), "")
+
+
+def test_get_head_candidates():
+    predicate_map_node = {"rich": ["a", "b"]}
+    predicate_map_edge = {"friend": [("a", "b"), ("a", "c"), ("b", "c")]}
+    nodes = ["a", "b", "c"]
+
+    def candidates(rule, clause_order=(0, 1), cwp=()):
+        return get_head_candidates(rule, list(clause_order), predicate_map_node, predicate_map_edge, nodes, list(cwp))
+
+    node_first = DummyRule([_clause("node", "rich", ["X"]), _clause("edge", "friend", ["X", "Y"])])
+    assert candidates(node_first) == ["a", "b"]
+    # The sources or targets of the edges, without repeating nodes
+    assert candidates(node_first, clause_order=(1, 0)) == ["a", "b"]
+    assert candidates(DummyRule([_clause("edge", "friend", ["Y", "X"])]), clause_order=(0,)) == ["b", "c"]
+    # Labels that are not in the predicate map use all nodes
+    assert candidates(DummyRule([_clause("node", "poor", ["X"])]), clause_order=(0,)) == nodes
+
+    # Rules whose grounding cannot be split
+    assert candidates(DummyRule([_clause("node", "rich", ["Y"]), _clause("edge", "friend", ["X", "Y"])])) == []
+    assert candidates(node_first, cwp=["rich"]) == []
+    assert candidates(DummyRule(node_first.get_clauses(), ann_fn="average")) == []
+    assert candidates(DummyRule(node_first.get_clauses(), thresholds=[DEFAULT_THRESHOLD, ("greater_equal", ("percent", "total"), 50.0)])) == []
+
+
+def test_schedule_grounding_tasks(monkeypatch):
+    candidates = {0: list("abcde"), 1: ["a"], 2: list("abcd")}
+    monkeypatch.setattr(interpretation, "_get_head_candidates", lambda rule, *args: candidates[rule])
+
+    # Rule 1 has too few candidates and the groundings of rule 2 are cached
+    task_rules, task_partitions = schedule_grounding_tasks([0, 1, 2], [0, 1, 2], [[], [], []], [False, False, True], {}, {}, [], [], 2)
+    assert task_rules == [0, 0, 1, 2]
+    assert task_partitions == [["a", "b"], ["c", "d", "e"], [], []]
+
+    task_rules, task_partitions = schedule_grounding_tasks([0, 1, 2], [2, 0], [[], [], []], [False, False], {}, {}, [], [], 8)
+    assert task_rules == [0, 0, 0, 0, 1, 1, 1, 1, 1]
+    assert task_partitions == [["a"], ["b"], ["c"], ["d"], ["a"], ["b"], ["c"], ["d"], ["e"]]
+
+    task_rules, task_partitions = schedule_grounding_tasks([0, 1, 2], [0, 2], [[], [], []], [False, False], {}, {}, [], [], 1)
+    assert task_rules == [0, 1]
+    assert task_partitions == [[], []]
+
+
+def test_cache_groundings_concatenates_partitions():
+    cached_signatures = [-1, 4, -1]
+    cached_node_rules = [[], ["old"], []]
+    cached_edge_rules = [[], [], []]
+    # Rule 0 is grounded in two partitions, rule 1 was a cache hit and rule 2 cannot be cached
+    cache_groundings(
+        cached_signatures, cached_node_rules, cached_edge_rules, [0, 1, 2], [7, 4, -1], [0, 0, 1, 2],
+        [True, True, False, True], [["g1"], ["g2"], [], ["g3"]], [[], ["e1"], [], []],
+    )
+    assert cached_signatures == [7, 4, -1]
+    assert cached_node_rules == [["g1", "g2"], ["old"], []]
+    assert cached_edge_rules == [["e1"], [], []]
+
+
+def test_may_add_to_graph():
+    assert not may_add_to_graph(DummyRule([_clause("node", "rich", ["X"])]))
+    # The head variable is not in the body, it is grounded as a node of its own
+    assert may_add_to_graph(DummyRule([_clause("node", "rich", ["Y"])]))
+    assert may_add_to_graph(DummyRule([_clause("edge", "friend", ["X", "Y"])], rule_type="edge"))
+    assert not may_add_to_graph(DummyRule([_clause("edge", "friend", ["X", "Y"]), _clause("node", "rich", ["W"])], rule_type="edge"))
+
+
+def test_get_segment_end():
+    # Tasks of rule 1 can add to the graph. Rule 0 is split into two tasks
+    task_rules = [0, 0, 1, 2, 3]
+    rule_schedule = [0, 1, 2, 3]
+    adds_to_graph = [False, True, False, False]
+    assert get_segment_end(task_rules, rule_schedule, adds_to_graph, 0) == 2
+    assert get_segment_end(task_rules, rule_schedule, adds_to_graph, 2) == 3
+    assert get_segment_end(task_rules, rule_schedule, adds_to_graph, 3) == 5
+    assert get_segment_end(task_rules, rule_schedule, [False] * 4, 0) == 5
+
+
+@pytest.mark.parametrize("num_partitions", [2, 3, 7])
+def test_ground_rule_partitions_cover_all_heads(monkeypatch, num_partitions):
+    # popular(X) <- friend(X,Y), owns(Y,Z)
+    friend = [("x1", "y1"), ("x2", "y2"), ("x3", "y3"), ("x4", "y1"), ("x5", "y4")]
+    owns = [("y1", "z1"), ("y3", "z2"), ("y4", "z3")]
+    edges = friend + owns
+    nodes = sorted({n for e in edges for n in e})
+    neighbors = {n: [e[1] for e in edges if e[0] == n] for n in nodes}
+    reverse_neighbors = {n: [e[0] for e in edges if e[1] == n] for n in nodes}
+    interpretations_node = {n: None for n in nodes}
+    labels = {**{e: "friend" for e in friend}, **{e: "owns" for e in owns}}
+    predicate_map_edge = {"friend": friend, "owns": owns}
+
+    monkeypatch.setattr(interpretation, "get_qualified_edge_groundings", lambda interpretations_edge, grounding, l, bnd, cwp: [e for e in grounding if interpretations_edge[e] == l])
+    monkeypatch.setattr(interpretation, "check_edge_grounding_threshold_satisfaction", lambda interpretations_edge, grounding, qualified, l, threshold, cwp: len(qualified) > 0)
+    monkeypatch.setattr(interpretation, "check_edge_clause_satisfaction", lambda interpretations_edge, grounding, l, bnd, threshold, cwp: any(interpretations_edge[e] == l for e in grounding))
+
+    rule = DummyRule([_clause("edge", "friend", ["X", "Y"]), _clause("edge", "owns", ["Y", "Z"])])
+
+    def heads(head_partition=None):
+        apps_node, _ = ground_rule(
+            rule, interpretations_node, labels, {}, predicate_map_edge, nodes, edges, neighbors, reverse_neighbors,
+            atom_trace=False, allow_ground_rules=False, t=0, head_partition=head_partition,
+        )
+        return [a[0] for a in apps_node]
+
+    expected = heads()
+    assert sorted(expected) == ["x1", "x3", "x4", "x5"]
+
+    candidates = get_head_candidates(rule, [0, 1], {}, predicate_map_edge, nodes, [])
+    _, partitions = schedule_grounding_tasks([rule], [0], [[0, 1]], [False], {}, predicate_map_edge, nodes, [], num_partitions)
+    assert len(partitions) == min(num_partitions, len(candidates))
+    partitioned = [head for partition in partitions for head in heads(partition)]
+    assert partitioned == expected
@@ -46,12 +46,15 @@ def get_interpretation_helpers(module_name: str = "interpretation_fp"):
         interpretation.get_rule_edge_clause_grounding
     )
     ns.satisfies_threshold = _py(interpretation._satisfies_threshold)
+    ns.count_available_components = _py(interpretation._count_available_components)
     ns.check_node_grounding_threshold_satisfaction = _py(
         interpretation.check_node_grounding_threshold_satisfaction
     )
     ns.check_edge_grounding_threshold_satisfaction = _py(
         interpretation.check_edge_grounding_threshold_satisfaction
     )
+    ns.check_node_clause_satisfaction = _py(interpretation.check_node_clause_satisfaction)
+    ns.check_edge_clause_satisfaction = _py(interpretation.check_edge_clause_satisfaction)
     ns.refine_groundings = _py(interpretation.refine_groundings)
     ns.check_all_clause_satisfaction = _py(
         interpretation.check_all_clause_satisfaction
@@ -73,6 +76,8 @@ def get_interpretation_helpers(module_name: str = "interpretation_fp"):
         def ground_rule(*args, **kwargs):
             kwargs.setdefault('head_functions', ())
             kwargs.setdefault('closed_world_predicates', [])
+            if "clause_order" in inspect.signature(_ground_rule_fn).parameters:
+                kwargs.setdefault('clause_order', list(range(len(args[0].get_clauses()))))
             return _ground_rule_fn(*args, num_ga=[0], **kwargs)
     else:
         def ground_rule(*args, **kwargs):
@@ -117,6 +122,8 @@ def get_interpretation_helpers(module_name: str = "interpretation_fp"):
     ns.init_reverse_neighbors = _py(
         interpretation.Interpretation._init_reverse_neighbors
     )
+    ns.init_csr_adjacency = interpretation.Interpretation._init_csr_adjacency
+    ns.init_neighbors = _py(interpretation.Interpretation._init_neighbors)
 
     _init_nodes_fn = _py(
         interpretation.Interpretation._init_interpretations_node
@@ -242,6 +249,11 @@ def get_interpretation_helpers(module_name: str = "interpretation_fp"):
                 again,
                 closed_world_predicates,
             )
+    elif "shared_worlds_node" in inspect.signature(_reason_fn).parameters:
+        def reason(*args, **kwargs):
+            kwargs.setdefault('shared_worlds_node', {})
+            kwargs.setdefault('shared_worlds_edge', {})
+            return _reason_fn(*args, **kwargs)
     else:
         reason = _reason_fn
     ns.reason = reason
@@ -506,7 +518,7 @@ def test_delete_edge_removes_all_references():
     neighbors = {"A": ["B"], "C": []}
     reverse_neighbors = {"B": ["A"], "C": []}
     edges = [("A", "B")]
-    interp_edge = {("A", "B"): SimpleNamespace(world=[])}
+    interp_edge = {("A", "B"): SimpleNamespace(world=[lbl])}
     predicate_map = {lbl: [("A", "B"), ("C", "D")]}
     if interpretation.__name__.endswith("_fp"):
         delete_edge(("A", "B"), neighbors, reverse_neighbors, edges, interp_edge, predicate_map)
@@ -523,7 +535,7 @@ def test_delete_node_removes_all_references():
     neighbors = {"A": ["B"], "B": [], "C": ["A"]}
     reverse_neighbors = {"A": ["C"], "B": ["A"], "C": []}
     nodes = ["A", "B", "C"]
-    interp_node = {"A": SimpleNamespace(world=[]), "B": SimpleNamespace(world=[]), "C": SimpleNamespace(world=[])}
+    interp_node = {"A": SimpleNamespace(world=[lbl]), "B": SimpleNamespace(world=[lbl]), "C": SimpleNamespace(world=[])}
     predicate_map = {lbl: ["A", "B"]}
     if interpretation.__name__.endswith("_fp"):
         delete_node("A", neighbors, reverse_neighbors, nodes, interp_node, predicate_map)
@@ -533,6 +545,8 @@ def test_delete_node_removes_all_references():
     assert "A" not in neighbors and "A" not in reverse_neighbors
     assert set(interp_node.keys()) == {"B", "C"}
     assert predicate_map[lbl] == ["B"]
+    assert neighbors == {"B": [], "C": []}
+    assert reverse_neighbors == {"B": [], "C": []}
 
 
 # ---- are_satisfied_node / are_satisfied_edge tests ----
@@ -61,6 +61,32 @@ def test_init_reverse_neighbors_empty(shim_types):
     assert init_reverse_neighbors({}) == {}
 
 
+# ---- _init_csr_adjacency / _init_neighbors tests ----
+
+def test_init_csr_adjacency_directed():
+    g = nx.DiGraph()
+    g.add_nodes_from(["n1", "n2", "n3", "n4"])
+    g.add_edges_from([("n1", "n3"), ("n1", "n2"), ("n3", "n1")])
+    indptr, indices = init_csr_adjacency(g)
+    assert indptr.tolist() == [0, 2, 2, 3, 3]
+    assert indices.tolist() == [2, 1, 0]
+
+
+def test_init_neighbors_from_csr(shim_types):
+    g = nx.DiGraph()
+    g.add_nodes_from(["n1", "n2", "n3", "n4"])
+    g.add_edges_from([("n1", "n3"), ("n1", "n2"), ("n3", "n1")])
+    indptr, indices = init_csr_adjacency(g)
+    neighbors = init_neighbors(list(g.nodes()), indptr, indices)
+    assert neighbors == {"n1": ["n3", "n2"], "n2": [], "n3": ["n1"], "n4": []}
+
+
+def test_init_neighbors_empty_graph(shim_types):
+    indptr, indices = init_csr_adjacency(nx.DiGraph())
+    assert indptr.tolist() == [0]
+    assert init_neighbors([], indptr, indices) == {}
+
+
 # ---- Interpretation __init__ neighbor tests ----
 
 def test_interpretation_init_neighbors(shim_types):
@@ -180,13 +206,19 @@ def test_init_facts_branches(shim_types):
     ftn_trace, fte_trace = [], []
     max_t = init_facts([n_fact], [e_fact], ftn, fte, ftn_trace, fte_trace, True)
     assert max_t == 1
-    assert ftn == [(0, "n1", "L", (0.0, 1.0), True, True)]
-    assert fte == [
-        (0, ("a", "b"), "M", (0.0, 1.0), False, False),
-        (1, ("a", "b"), "M", (0.0, 1.0), False, False),
-    ]
+    assert ftn == [(0, "n1", "L", (0.0, 1.0), True, True, 0)]
+    assert fte == [(0, ("a", "b"), "M", (0.0, 1.0), False, False, 1)]
     assert ftn_trace == ["graph-attribute-fact"]
-    assert fte_trace == ["other", "other"]
+    assert fte_trace == ["other"]
+
+
+def test_init_facts_skips_empty_interval(shim_types):
+    fact = Fact("other", "n1", "L", (0.0, 1.0), False, 3, 2)
+    ftn, fte = [], []
+    ftn_trace, fte_trace = [], []
+    max_t = init_facts([fact], [], ftn, fte, ftn_trace, fte_trace, True)
+    assert max_t == 0
+    assert ftn == [] and ftn_trace == []
 
 
 def test_init_facts_no_trace(shim_types):
@@ -0,0 +1,63 @@
+"""Unit tests for the dirty-set based timestep reset in non-persistent mode."""
+from tests.unit.disable_jit.interpretations.test_interpretation_common import get_interpretation_helpers
+
+_h = get_interpretation_helpers("interpretation")
+interpretation = _h.interpretation
+label = _h.label
+mark_atom_dirty = interpretation._mark_atom_dirty
+reset_dirty_atoms = interpretation._reset_dirty_atoms
+
+
+class _Bound:
+    def __init__(self, lower, upper, prev_lower=0.0, prev_upper=1.0, static=False):
+        self.lower = lower
+        self.upper = upper
+        self.prev_lower = prev_lower
+        self.prev_upper = prev_upper
+        self.static = static
+
+    def is_static(self):
+        return self.static
+
+    def reset(self):
+        self.prev_lower, self.prev_upper = self.lower, self.upper
+        self.lower, self.upper = 0.0, 1.0
+
+
+class _World:
+    def __init__(self, world):
+        self.world = world
+
+
+def test_mark_atom_dirty_adds_ipl_complement():
+    a, b = label.Label("A"), label.Label("B")
+    dirty = {}
+    mark_atom_dirty(dirty, "n1", b, [(a, b)])
+    assert set(dirty) == {("n1", a), ("n1", b)}
+
+
+def test_reset_dirty_atoms_keeps_atom_until_previous_bounds_are_reset():
+    l = label.Label("L")
+    bnd = _Bound(0.7, 0.9)
+    interpretations = {"n1": _World({l: bnd})}
+    dirty = {("n1", l): True}
+
+    # First reset moves the bounds to prev, so the atom has to be reset once more
+    reset_dirty_atoms(interpretations, dirty)
+    assert (bnd.lower, bnd.upper, bnd.prev_lower, bnd.prev_upper) == (0.0, 1.0, 0.7, 0.9)
+    assert ("n1", l) in dirty
+
+    reset_dirty_atoms(interpretations, dirty)
+    assert (bnd.lower, bnd.upper, bnd.prev_lower, bnd.prev_upper) == (0.0, 1.0, 0.0, 1.0)
+    assert dirty == {}
+
+
+def test_reset_dirty_atoms_skips_static_and_missing_atoms():
+    l, m = label.Label("L"), label.Label("M")
+    static_bnd = _Bound(0.7, 0.9, static=True)
+    interpretations = {"n1": _World({l: static_bnd})}
+    dirty = {("n1", l): True, ("n1", m): True, ("n2", l): True}
+
+    reset_dirty_atoms(interpretations, dirty)
+    assert (static_bnd.lower, static_bnd.upper) == (0.7, 0.9)
+    assert dirty == {}
@@ -11,6 +11,8 @@ def test_reason_resets_non_persistent(monkeypatch, reason_env):
     class ResetInterval:
         def __init__(self):
             self.reset_called = False
+            self.prev_lower = 0.0
+            self.prev_upper = 1.0
 
         def copy(self):
             return ResetInterval()
@@ -94,6 +96,8 @@ def test_reason_resets_edge_non_persistent(monkeypatch, reason_env):
     class ResetInterval:
         def __init__(self):
             self.reset_called = False
+            self.prev_lower = 0.0
+            self.prev_upper = 1.0
 
         def copy(self):
             return ResetInterval()
@@ -167,6 +171,12 @@ def test_reason_atom_trace_creates_trace_lists(monkeypatch, reason_env):
         def get_delta(self):
             return 0
 
+        def get_clauses(self):
+            return []
+
+        def get_thresholds(self):
+            return []
+
     reason_env["rules"] = [Rule()]
     mock_ground = Mock(return_value=([], []))
     monkeypatch.setattr(interpretation, "_ground_rule", mock_ground)
@@ -198,6 +208,12 @@ def test_reason_skips_rule_grounding_when_out_of_time(monkeypatch, reason_env):
         def get_delta(self):
             return 1
 
+        def get_clauses(self):
+            return []
+
+        def get_thresholds(self):
+            return []
+
     reason_env["rules"] = [Rule()]
     mock_ground = Mock(return_value=([], []))
     monkeypatch.setattr(interpretation, "_ground_rule", mock_ground)
@@ -220,6 +236,12 @@ def test_reason_applies_applicable_node_rule_with_trace_and_delta_zero(monkeypat
         def get_delta(self):
             return 0
 
+        def get_clauses(self):
+            return []
+
+        def get_thresholds(self):
+            return []
+
         def get_target(self):
             return reason_env["label"]
 
@@ -261,7 +283,7 @@ def test_reason_skips_static_node_rule(monkeypatch, reason_env):
 
     reason_env["facts_to_be_applied_node"].clear()
     other_label = type(reason_env["label"])("L2")
-    reason_env["facts_to_be_applied_node"].append((0, reason_env["node"], other_label, reason_env["bnd"], False, False))
+    reason_env["facts_to_be_applied_node"].append((0, reason_env["node"], other_label, reason_env["bnd"], False, False, 0))
     monkeypatch.setattr(interpretation, "check_consistent_node", lambda *a, **k: True)
 
     static_bnd = reason_env["bnd"].copy()
@@ -272,6 +294,12 @@ def test_reason_skips_static_node_rule(monkeypatch, reason_env):
         def get_delta(self):
             return 1
 
+        def get_clauses(self):
+            return []
+
+        def get_thresholds(self):
+            return []
+
         def get_target(self):
             return reason_env["label"]
 
@@ -350,6 +378,12 @@ def test_reason_applies_applicable_edge_rule_with_trace_and_delta_zero(monkeypat
         def get_delta(self):
             return self._delta
 
+        def get_clauses(self):
+            return []
+
+        def get_thresholds(self):
+            return []
+
         def get_target(self):
             return edge_lbl
 
@@ -0,0 +1,205 @@
+"""Unit tests for applying the due rules of different components in parallel."""
+import pytest
+from tests.unit.disable_jit.interpretations.test_interpretation_common import get_interpretation_helpers
+
+_h = get_interpretation_helpers("interpretation")
+interpretation = _h.interpretation
+can_apply_in_parallel = interpretation._can_apply_in_parallel
+adds_edges = interpretation._adds_edges
+group_by_component = interpretation._group_by_component
+apply_rules_node_group = interpretation._apply_rules_node_group
+apply_rules_edge_group = interpretation._apply_rules_edge_group
+
+
+class _ListShim:
+    def __call__(self, iterable=()):
+        return list(iterable)
+
+    def empty_list(self, *args, **kwargs):
+        return []
+
+
+class _DictShim:
+    def empty(self, *args, **kwargs):
+        return {}
+
+
+@pytest.fixture(autouse=True)
+def shim_types(monkeypatch):
+    monkeypatch.setattr(interpretation.numba.typed, "List", _ListShim())
+    monkeypatch.setattr(interpretation.numba.typed, "Dict", _DictShim())
+
+
+class _World:
+    def __init__(self, *labels):
+        self.world = {l: None for l in labels}
+
+
+class _Bound:
+    def __init__(self, lower, upper):
+        self.lower, self.upper = lower, upper
+
+    def __eq__(self, other):
+        return isinstance(other, _Bound) and (self.lower, self.upper) == (other.lower, other.upper)
+
+    def is_static(self):
+        return False
+
+
+class _Label:
+    def __init__(self, value):
+        self.value = value
+
+
+def _rule(comp, l, bnd=(1, 1)):
+    return (1, comp, l, bnd, False)
+
+
+def test_can_apply_in_parallel():
+    interpretations = {"a": _World("p", "not_p"), "b": _World("p"), "c": _World("q")}
+    ipl = [("p", "not_p")]
+    rules = [_rule("a", "p"), _rule("b", "p"), _rule("c", "q"), _rule("d", "q")]
+    assert can_apply_in_parallel(interpretations, rules, [0, 2], ipl)
+    # The complement of p is not in the world of b
+    assert not can_apply_in_parallel(interpretations, rules, [0, 1], ipl)
+    assert can_apply_in_parallel(interpretations, rules, [0, 1], [])
+    # The label is not in the world of a, or the component is not in the interpretations
+    assert not can_apply_in_parallel(interpretations, [_rule("a", "q")], [0], ipl)
+    assert not can_apply_in_parallel(interpretations, rules, [3], ipl)
+
+
+def test_adds_edges():
+    edges_to_be_added = [([], [], "l"), (["a"], [], "l"), (["a"], ["b"], "l")]
+    assert not adds_edges(edges_to_be_added, [0, 1])
+    assert adds_edges(edges_to_be_added, [0, 2])
+
+
+def test_group_by_component():
+    rules = [_rule("b", "p"), _rule("a", "p"), _rule("b", "q"), _rule("c", "p"), _rule("a", "q")]
+    # Positions are in the list of due rules, not in the list of rules
+    assert group_by_component(rules, [0, 1, 2, 3, 4], {}) == [[0, 2], [1, 4], [3]]
+    assert group_by_component(rules, [4, 2, 0], {}) == [[0], [1, 2]]
+    assert group_by_component(rules, [], {}) == []
+
+
+def _patch_updates(monkeypatch, update_name, consistent_name, resolve_name, inconsistent):
+    calls = []
+
+    def update(interpretations, predicate_map, comp, na, ipl, rule_trace, fp_cnt, t, static, convergence_mode, atom_trace, *args, override=False, **kwargs):
+        calls.append(("update", comp, na[0], override, atom_trace))
+        rule_trace.append((comp, na[0]))
+        return True, 2
+
+    def resolve(interpretations, comp, na, ipl, t, fp_cnt, idx, atom_trace, rule_trace, *args, **kwargs):
+        calls.append(("resolve", comp, na[0]))
+        rule_trace.append((comp, na[0], "inconsistent"))
+
+    monkeypatch.setattr(interpretation, update_name, update)
+    monkeypatch.setattr(interpretation, consistent_name, lambda interpretations, comp, na: na[0] not in inconsistent)
+    monkeypatch.setattr(interpretation, resolve_name, resolve)
+    return calls
+
+
+@pytest.mark.parametrize("inconsistency_check", [True, False])
+def test_apply_rules_node_group(monkeypatch, inconsistency_check):
+    calls = _patch_updates(monkeypatch, "_update_node", "check_consistent_node", "resolve_inconsistency_node", {"q"})
+    rules = [_rule("a", "p"), _rule("b", "p"), _rule("a", "q")]
+    due_rules = [2, 1, 0]
+    traces = [[], [], []]
+    updated, changed, changes = [False] * 3, [False] * 3, [0.0] * 3
+
+    # The group of node a is at positions 0 and 2 of the due rules
+    apply_rules_node_group({}, {}, rules, due_rules, [0, 2], [], traces, [], [], [], 1, 0, "delta_interpretation", False, inconsistency_check, True, "intersection", [0], updated, changed, changes)
+
+    if inconsistency_check:
+        assert calls == [("resolve", "a", "q"), ("update", "a", "p", False, False)]
+        assert traces == [[("a", "q", "inconsistent")], [], [("a", "p")]]
+        assert updated == [False, False, True]
+        assert changes == [0.0, 0.0, 2]
+    else:
+        assert calls == [("update", "a", "q", True, False), ("update", "a", "p", False, False)]
+        assert traces == [[("a", "q")], [], [("a", "p")]]
+        assert updated == [True, False, True]
+        assert changes == [2, 0.0, 2]
+    assert changed == [True, False, True]
+
+
+def test_apply_rules_edge_group_skips_edge_labels(monkeypatch):
+    calls = _patch_updates(monkeypatch, "_update_edge", "check_consistent_edge", "resolve_inconsistency_edge", set())
+    rules = [_rule(("a", "b"), "p"), _rule(("a", "b"), "q")]
+    # The second rule only updates the edges it adds, and it does not add any
+    edges_to_be_added = [([], [], _Label("")), ([], [], _Label("q"))]
+    traces = [[], []]
+    updated, changed, changes = [False] * 2, [False] * 2, [0.0] * 2
+
+    apply_rules_edge_group({}, {}, rules, edges_to_be_added, [0, 1], [0, 1], [], traces, [], [], [], 1, 0, "delta_interpretation", False, True, True, "override", [0], updated, changed, changes)
+
+    assert calls == [("update", ("a", "b"), "p", True, False)]
+    assert traces == [[(("a", "b"), "p")], []]
+    assert updated == [True, False]
+    assert changed == [True, False]
+
+
+def _run_reason(monkeypatch, parallel_apply):
+    """Fact A(n1) starts the fixed point. r_l: M(x) <- L(x) is then due for three nodes at once. L and M are in the world of every node."""
+    from unittest.mock import Mock
+    label = _h.label
+    nodes = ["n1", "n2", "n3"]
+    l_label, m_label = label.Label("L"), label.Label("M")
+    interpretations_node = {n: _World() for n in nodes}
+    for n in nodes:
+        interpretations_node[n].world = {l_label: _Bound(1, 1), m_label: _Bound(0, 1)}
+
+    rule = Mock()
+    rule.get_name.return_value = "r_l"
+    rule.get_type.return_value = "node"
+    rule.get_edges.return_value = ("", "", label.Label(""))
+    rule.get_delta.return_value = 0
+    rule.get_target.return_value = m_label
+    rule.is_static_rule.return_value = False
+    rule.get_weights.return_value = []
+    rule.get_clauses.return_value = [("node", l_label, ["x"], (0, 1), "")]
+    rule.get_thresholds.return_value = [("greater_equal", ("number", "total"), 1.0)]
+    rule.get_head_variables.return_value = ["x"]
+    rule.get_head_function.return_value = [""]
+    rule.get_head_function_vars.return_value = [[]]
+    rule.get_annotation_function.return_value = ""
+
+    def update_node_stub(interp, predicate_map, comp, lb, ipl, rule_trace, *args, **kwargs):
+        l, bnd = lb
+        changed = interp[comp].world.get(l) != bnd
+        interp[comp].world[l] = bnd
+        if changed:
+            rule_trace.append((comp, l.get_value()))
+        return changed, 1 if changed else 0
+
+    monkeypatch.setattr(interpretation, "_ground_rule", lambda *a, **k: ([(n, [], [], [], None) for n in reversed(nodes)], []))
+    monkeypatch.setattr(interpretation, "_update_node", update_node_stub)
+    monkeypatch.setattr(interpretation, "check_consistent_node", lambda *a, **k: True)
+    monkeypatch.setattr(interpretation, "annotate", lambda *a, **k: (1, 1))
+    monkeypatch.setattr(interpretation.interval, "closed", lambda lo, up: _Bound(lo, up))
+    monkeypatch.setattr(interpretation.numba.types, "uint16", lambda x: x)
+
+    rule_trace = []
+    reason_fn = getattr(interpretation.Interpretation.reason, "py_func", interpretation.Interpretation.reason)
+    fp_cnt, _ = reason_fn(
+        interpretations_node, {}, {}, {}, 0, [0, 0], [rule], nodes, [], {n: [] for n in nodes}, {n: [] for n in nodes},
+        [], [], [], [], [], [], [(0, "n1", label.Label("A"), _Bound(1, 1), False, False, 0)], [], [], [],
+        [], rule_trace, [], [], [], {}, False, False, True, False, False, "", False, 0, (), (),
+        "perfect_convergence", 0, [0], False, False, [], parallel_apply=parallel_apply,
+    )
+    return fp_cnt, rule_trace, {n: (interpretations_node[n].world[m_label].lower, interpretations_node[n].world[m_label].upper) for n in nodes}
+
+
+def test_reason_parallel_apply_matches_serial_apply(monkeypatch):
+    serial = _run_reason(monkeypatch, parallel_apply=False)
+    groups = []
+    monkeypatch.setattr(interpretation, "_apply_rules_node_group", lambda *a: (groups.append(list(a[4])), apply_rules_node_group(*a)))
+    parallel = _run_reason(monkeypatch, parallel_apply=True)
+    assert parallel == serial
+    # Each node is a group of its own. The rule is applied again in the fixed point operation that finds no change
+    assert groups == [[0], [1], [2]] * 2
+    fp_cnt, rule_trace, worlds = parallel
+    # The trace keeps the order in which the rules were derived
+    assert rule_trace == [("n1", "A"), ("n3", "M"), ("n2", "M"), ("n1", "M")]
+    assert worlds == {"n1": (1, 1), "n2": (1, 1), "n3": (1, 1)}
@@ -282,7 +282,7 @@ def test_reason_adds_missing_node(monkeypatch, reason_env):
     neighbors = {reason_env["node"]: []}
     reverse = {reason_env["node"]: []}
     interp = {0: {reason_env["node"]: reason_env["interpretations_node"][0][reason_env["node"]]}}
-    facts = [(0, new_node, reason_env["label"], reason_env["bnd"], False, False)]
+    facts = [(0, new_node, reason_env["label"], reason_env["bnd"], False, False, 0)]
 
     reason_env["run"](
         nodes=nodes,
@@ -301,7 +301,7 @@ def test_reason_logs_static_fact(monkeypatch, reason_env):
     static_bnd = reason_env["bnd"].__class__(1.0, True)
     reason_env["interpretations_node"][0][node].world[label_] = static_bnd
     new_bnd = reason_env["bnd"].__class__(0.5, False)
-    facts = [(0, node, label_, new_bnd, False, False)]
+    facts = [(0, node, label_, new_bnd, False, False, 0)]
     rule_trace = []
 
     monkeypatch.setattr(interpretation, "check_consistent_node", lambda *a, **k: True)
@@ -326,7 +326,7 @@ def test_reason_static_fact_traces_and_requeues(reason_env):
     reason_env["interpretations_node"][0][node].world[lbl] = static_bnd
     reason_env["interpretations_node"][0][node].world[other] = other_bnd
     new_bnd = reason_env["bnd"].__class__(0.2, False)
-    facts = [(0, node, lbl, new_bnd, True, False)]
+    facts = [(0, node, lbl, new_bnd, True, False, 0)]
     trace = [["x"]]
     rule_trace = []
     rule_trace_atoms = []
@@ -343,7 +343,7 @@ def test_reason_static_fact_traces_and_requeues(reason_env):
         prev_reasoning_data=[0, 1],
     )
 
-    assert facts == [(1, node, lbl, new_bnd, True, False)]
+    assert facts == [(1, node, lbl, new_bnd, True, False, 1)]
     assert trace == [["x"]]
     assert len(rule_trace) == 2 and rule_trace[0][:5] == (0, 1, node, lbl, new_bnd) and rule_trace[1][:5] == (0, 1, node, other, other_bnd)
     assert len(rule_trace_atoms) == 2
@@ -359,7 +359,7 @@ def test_reason_static_fact_traces_complement_second(reason_env):
     reason_env["interpretations_node"][0][node].world[lbl] = static_bnd
     reason_env["interpretations_node"][0][node].world[other] = other_bnd
     new_bnd = reason_env["bnd"].__class__(0.4, False)
-    facts = [(0, node, lbl, new_bnd, True, False)]
+    facts = [(0, node, lbl, new_bnd, True, False, 0)]
     trace = [["z"]]
     rule_trace = []
     rule_trace_atoms = []
@@ -376,7 +376,7 @@ def test_reason_static_fact_traces_complement_second(reason_env):
         prev_reasoning_data=[0, 1],
     )
 
-    assert facts == [(1, node, lbl, new_bnd, True, False)]
+    assert facts == [(1, node, lbl, new_bnd, True, False, 1)]
     assert trace == [["z"]]
     assert len(rule_trace) == 2 and rule_trace[0][:5] == (0, 1, node, lbl, new_bnd) and rule_trace[1][:5] == (0, 1, node, other, other_bnd)
     assert len(rule_trace_atoms) == 2
@@ -402,7 +402,7 @@ def test_reason_delta_bound_inconsistent(monkeypatch, reason_env):
 
 
 def test_reason_defers_future_fact_and_traces(reason_env):
-    future_fact = [(1, reason_env["node"], reason_env["label"], reason_env["bnd"], False, False)]
+    future_fact = [(1, reason_env["node"], reason_env["label"], reason_env["bnd"], False, False, 1)]
     future_trace = [["t"]]
 
     reason_env["run"](
@@ -411,7 +411,7 @@ def test_reason_defers_future_fact_and_traces(reason_env):
         atom_trace=True,
     )
 
-    assert future_fact == [(1, reason_env["node"], reason_env["label"], reason_env["bnd"], False, False)]
+    assert future_fact == [(1, reason_env["node"], reason_env["label"], reason_env["bnd"], False, False, 1)]
     assert future_trace == [["t"]]
 
 
@@ -423,7 +423,7 @@ def test_reason_defers_future_edge_fact_and_traces(reason_env):
     edge_world = reason_env["interpretations_node"][0][node].__class__()
     interpretations_edge = {0: {edge: edge_world}}
     edges = [edge]
-    future_fact = [(1, edge, lbl, bnd, False, False)]
+    future_fact = [(1, edge, lbl, bnd, False, False, 1)]
     future_trace = ["edge"]
 
     reason_env["run"](
@@ -438,7 +438,7 @@ def test_reason_defers_future_edge_fact_and_traces(reason_env):
         prev_reasoning_data=[0, 1],
     )
 
-    assert future_fact == [(1, edge, lbl, bnd, False, False)]
+    assert future_fact == [(1, edge, lbl, bnd, False, False, 1)]
     assert future_trace == ["edge"]
 
 
@@ -452,7 +452,7 @@ def test_reason_applies_edge_fact(monkeypatch, reason_env):
     edges = [edge]
     neighbors = {node: []}
     reverse = {node: []}
-    facts = [(0, edge, lbl, bnd, False, False)]
+    facts = [(0, edge, lbl, bnd, False, False, 0)]
 
     monkeypatch.setattr(interpretation, "check_consistent_edge", lambda *a, **k: True)
 
@@ -525,7 +525,7 @@ def test_reason_adds_missing_edge(monkeypatch, reason_env):
         neighbors=neighbors,
         reverse_neighbors=reverse,
         interpretations_edge=interpretations_edge,
-        facts_to_be_applied_edge=[(0, edge, lbl, bnd, False, False)],
+        facts_to_be_applied_edge=[(0, edge, lbl, bnd, False, False, 0)],
         facts_to_be_applied_node=[],
         prev_reasoning_data=[0, 1],
     )
@@ -567,7 +567,7 @@ def test_reason_adds_edge_to_interpretation(monkeypatch, reason_env):
         neighbors=neighbors,
         reverse_neighbors=reverse,
         interpretations_edge=interpretations_edge,
-        facts_to_be_applied_edge=[(0, edge, lbl, bnd, False, False)],
+        facts_to_be_applied_edge=[(0, edge, lbl, bnd, False, False, 0)],
         facts_to_be_applied_node=[],
         prev_reasoning_data=[0, 1],
     )
@@ -598,7 +598,7 @@ def test_reason_static_edge_rule_trace_branches(
     world.world = {lbl: static_bnd, other: other_bnd}
     interpretations_edge = {0: {edge: world}}
     edges = [edge]
-    facts = [(0, edge, lbl, reason_env["bnd"], True, graph_attr)]
+    facts = [(0, edge, lbl, reason_env["bnd"], True, graph_attr, 0)]
     rule_trace = []
 
     reason_env["run"](
@@ -621,7 +621,7 @@ def test_reason_static_edge_rule_trace_branches(
         assert rule_trace[1][:5] == (0, 1, edge, other, other_bnd)
     else:
         assert rule_trace == []
-    assert facts == [(1, edge, lbl, reason_env["bnd"], True, graph_attr)]
+    assert facts == [(1, edge, lbl, reason_env["bnd"], True, graph_attr, 1)]
 
 
 def test_reason_static_edge_atom_trace_complements(monkeypatch, reason_env):
@@ -637,7 +637,7 @@ def test_reason_static_edge_atom_trace_complements(monkeypatch, reason_env):
     world.world = {lbl: static_bnd, other1: o1_bnd, other2: o2_bnd}
     interpretations_edge = {0: {edge: world}}
     edges = [edge]
-    facts = [(0, edge, lbl, reason_env["bnd"], True, False)]
+    facts = [(0, edge, lbl, reason_env["bnd"], True, False, 0)]
     facts_trace = ["t"]
     rule_trace = []
     rule_trace_atoms = []
@@ -664,7 +664,7 @@ def test_reason_static_edge_atom_trace_complements(monkeypatch, reason_env):
     assert rule_trace[0][:5] == (0, 1, edge, lbl, static_bnd)
     assert rule_trace[1][:5] == (0, 1, edge, other1, o1_bnd)
     assert rule_trace[2][:5] == (0, 1, edge, other2, o2_bnd)
-    assert facts == [(1, edge, lbl, reason_env["bnd"], True, False)]
+    assert facts == [(1, edge, lbl, reason_env["bnd"], True, False, 1)]
     assert facts_trace == ["t"]
     assert mock_update.call_count == 3
     calls = [
@@ -698,7 +698,7 @@ def test_reason_edge_delta_bound(monkeypatch, reason_env):
         neighbors={node: []},
         reverse_neighbors={node: []},
         interpretations_edge=interpretations_edge,
-        facts_to_be_applied_edge=[(0, edge, lbl, bnd, False, False)],
+        facts_to_be_applied_edge=[(0, edge, lbl, bnd, False, False, 0)],
         facts_to_be_applied_node=[],
         convergence_mode="delta_bound",
         convergence_delta=0,
@@ -729,7 +729,7 @@ def test_reason_edge_inconsistency_branches(monkeypatch, reason_env, inconsisten
         neighbors={node: []},
         reverse_neighbors={node: []},
         interpretations_edge=interpretations_edge,
-        facts_to_be_applied_edge=[(0, edge, lbl, bnd, False, False)],
+        facts_to_be_applied_edge=[(0, edge, lbl, bnd, False, False, 0)],
         facts_to_be_applied_node=[],
         inconsistency_check=inconsistency_check,
         prev_reasoning_data=[0, 1],
@@ -769,7 +769,7 @@ def test_reason_edge_inconsistency_delta_bound_override(monkeypatch, reason_env)
         neighbors={node: []},
         reverse_neighbors={node: []},
         interpretations_edge=interpretations_edge,
-        facts_to_be_applied_edge=[(0, edge, lbl, bnd, False, False)],
+        facts_to_be_applied_edge=[(0, edge, lbl, bnd, False, False, 0)],
         facts_to_be_applied_node=[],
         convergence_mode="delta_bound",
         convergence_delta=0,
@@ -901,6 +901,8 @@ def test_reason_skips_rule_outside_tmax(monkeypatch, reason_env):
     monkeypatch.setattr(interpretation, "check_consistent_node", lambda *a, **k: True)
     monkeypatch.setattr(interpretation, "_update_node", lambda *a, **k: (True, 0))
     rule = Mock()
+    rule.get_clauses.return_value = []
+    rule.get_thresholds.return_value = []
     rule.get_delta.return_value = 1
     rule.get_target.return_value = reason_env["label"]
     rule.is_static_rule.return_value = False
@@ -932,6 +934,8 @@ def test_reason_node_rule_delta_zero_traces_and_applies(monkeypatch, reason_env)
 
     new_node = "n2"
     rule = Mock()
+    rule.get_clauses.return_value = []
+    rule.get_thresholds.return_value = []
     rule.get_delta.return_value = 0
     rule.get_target.return_value = reason_env["label"]
     rule.is_static_rule.return_value = False
@@ -1022,6 +1026,8 @@ def test_reason_node_rule_skips_when_static(monkeypatch, reason_env):
     )
 
     rule = Mock()
+    rule.get_clauses.return_value = []
+    rule.get_thresholds.return_value = []
     rule.get_delta.return_value = 0
     rule.get_target.return_value = lbl
     rule.is_static_rule.return_value = False
@@ -1056,6 +1062,8 @@ def test_reason_node_rule_resolves_inconsistency(monkeypatch, reason_env):
     )
 
     rule = Mock()
+    rule.get_clauses.return_value = []
+    rule.get_thresholds.return_value = []
     rule.get_delta.return_value = 1
     rule.get_target.return_value = reason_env["label"]
     rule.is_static_rule.return_value = False
@@ -1154,6 +1162,8 @@ def test_reason_edge_rule_records_trace(monkeypatch, reason_env):
     edges = [edge]
 
     rule = Mock()
+    rule.get_clauses.return_value = []
+    rule.get_thresholds.return_value = []
     rule.get_delta.return_value = 1
     rule.get_target.return_value = lbl
     rule.is_static_rule.return_value = False
@@ -1209,6 +1219,8 @@ def test_reason_edge_rule_delta_zero_applies(monkeypatch, reason_env):
     edges = [edge]
 
     rule = Mock()
+    rule.get_clauses.return_value = []
+    rule.get_thresholds.return_value = []
     rule.get_delta.return_value = 0
     rule.get_target.return_value = lbl
     rule.is_static_rule.return_value = False
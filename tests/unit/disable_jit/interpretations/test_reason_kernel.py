@@ -0,0 +1,38 @@
+"""Unit tests for compiling the serial and parallel flavours of the reason kernel on first use."""
+import pytest
+from tests.unit.disable_jit.interpretations.test_interpretation_common import get_interpretation_helpers
+
+_h = get_interpretation_helpers("interpretation")
+interpretation = _h.interpretation
+get_reason_kernel = interpretation._get_reason_kernel
+
+
+@pytest.fixture
+def compiled(monkeypatch):
+    calls = []
+
+    def njit(**options):
+        def compile(py_func):
+            calls.append((py_func.__qualname__, options))
+            return py_func
+        return compile
+
+    monkeypatch.setattr(interpretation, "_reason_kernels", {})
+    monkeypatch.setattr(interpretation.numba, "njit", njit)
+    return calls
+
+
+def test_only_the_used_flavour_is_compiled(compiled):
+    serial = get_reason_kernel(False)
+    assert get_reason_kernel(False) is serial
+    assert compiled == [("Interpretation.reason", {"cache": True, "parallel": False})]
+    assert serial is interpretation.Interpretation.reason
+
+
+def test_parallel_flavour_has_its_own_cache_name(compiled):
+    parallel = get_reason_kernel(True)
+    assert get_reason_kernel(True) is parallel
+    assert compiled == [("Interpretation.reason_parallel", {"cache": True, "parallel": True})]
+    # Same code, different function, so the serial flavour keeps its own name
+    assert parallel.__code__ is interpretation.Interpretation.reason.__code__
+    assert interpretation.Interpretation.reason.__qualname__ == "Interpretation.reason"
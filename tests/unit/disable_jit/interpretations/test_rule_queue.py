@@ -0,0 +1,83 @@
+"""Unit tests for the time-keyed queue of rules to be applied used by the interpretation backend."""
+import pytest
+from tests.unit.disable_jit.interpretations.test_interpretation_common import get_interpretation_helpers
+
+_h = get_interpretation_helpers("interpretation")
+interpretation = _h.interpretation
+build_rule_queue = interpretation._build_rule_queue
+queue_rules = interpretation._queue_rules
+pop_due_rules = interpretation._pop_due_rules
+remove_applied_rules = interpretation._remove_applied_rules
+keep_items = interpretation._keep_items
+
+
+class _ListShim:
+    def __call__(self, iterable=()):
+        return list(iterable)
+
+    def empty_list(self, *args, **kwargs):
+        return []
+
+
+class _DictShim:
+    def empty(self, *args, **kwargs):
+        return {}
+
+
+@pytest.fixture(autouse=True)
+def shim_types(monkeypatch):
+    monkeypatch.setattr(interpretation.numba.typed, "List", _ListShim())
+    monkeypatch.setattr(interpretation.numba.typed, "Dict", _DictShim())
+
+
+def _rule(t, name):
+    return (t, name, "L", (1, 1), False)
+
+
+def test_build_rule_queue_groups_rules_by_time():
+    rules = [_rule(2, "a"), _rule(0, "b"), _rule(2, "c"), _rule(3, "d")]
+    assert build_rule_queue(rules, 0) == {2: [0, 2], 0: [1], 3: [3]}
+    # Rules that were due before t_start are not queued
+    assert build_rule_queue(rules, 2) == {2: [0, 2], 3: [3]}
+    assert build_rule_queue([], 0) == {}
+
+
+def test_queue_rules_only_adds_new_rules():
+    rules = [_rule(1, "a")]
+    queue = build_rule_queue(rules, 0)
+    rules.extend([_rule(1, "b"), _rule(4, "c")])
+    queue_rules(queue, rules, 1, 0)
+    assert queue == {1: [0, 1], 4: [2]}
+
+
+def test_pop_due_rules():
+    queue = {1: [0, 2]}
+    assert pop_due_rules(queue, 1) == [0, 2]
+    assert queue == {}
+    assert pop_due_rules(queue, 1) == []
+
+
+def test_remove_applied_rules_keeps_pending_rules():
+    rules = [_rule(0, "a"), _rule(3, "b"), _rule(1, "c"), _rule(2, "d")]
+    trace = ["a", "b", "c", "d"]
+    keep = remove_applied_rules(rules, trace, 1, 2, True)
+    assert keep == [0, 1]
+    assert rules == [_rule(0, "a"), _rule(3, "b")]
+    assert trace == ["a", "b"]
+
+
+def test_remove_applied_rules_without_atom_trace():
+    rules = [_rule(0, "a"), _rule(5, "b")]
+    trace = []
+    keep = remove_applied_rules(rules, trace, 0, 0, False)
+    assert keep == [1]
+    assert rules == [_rule(5, "b")]
+    assert trace == []
+
+
+def test_keep_items():
+    items = ["a", "b", "c"]
+    keep_items(items, [0, 2])
+    assert items == ["a", "c"]
+    keep_items(items, [0, 1])
+    assert items == ["a", "c"]
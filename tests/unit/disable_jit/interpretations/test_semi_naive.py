@@ -0,0 +1,186 @@
+"""Unit tests for semi-naive rule grounding in the interpretation backend.
+
+In semi-naive mode every rule is grounded on the first fixed point operation of a timestep.
+After that, only rules with a body predicate that changed in the previous operation are grounded again.
+"""
+import pytest
+from unittest.mock import Mock
+from tests.unit.disable_jit.interpretations.test_interpretation_common import get_interpretation_helpers
+
+_h = get_interpretation_helpers("interpretation")
+interpretation = _h.interpretation
+label = _h.label
+mark_label_changed = _h.interpretation._mark_label_changed
+build_rule_dependency_index = _h.interpretation._build_rule_dependency_index
+stratify_rules = _h.interpretation._stratify_rules
+schedule_rules = _h.interpretation._schedule_rules
+
+
+class _ListShim:
+    def __call__(self, iterable=()):
+        return list(iterable)
+
+    def empty_list(self, *args, **kwargs):
+        return []
+
+
+class _DictShim:
+    def empty(self, *args, **kwargs):
+        return {}
+
+
+class _World:
+    def __init__(self):
+        self.world = {}
+
+
+@pytest.fixture
+def shim_types(monkeypatch):
+    monkeypatch.setattr(interpretation.numba.typed, "List", _ListShim())
+    monkeypatch.setattr(interpretation.numba.typed, "Dict", _DictShim())
+    monkeypatch.setattr(interpretation.numba.types, "uint16", lambda x: x)
+    monkeypatch.setattr(interpretation.interval, "closed", lambda lo, up: (lo, up))
+
+
+def _make_rule(name, body_label, target, clause_type="node", rule_type="node"):
+    rule = Mock()
+    rule.get_name.return_value = name
+    rule.get_type.return_value = rule_type
+    rule.get_edges.return_value = ("", "", label.Label(""))
+    rule.get_delta.return_value = 0
+    rule.get_target.return_value = label.Label(target)
+    rule.is_static_rule.return_value = False
+    rule.get_weights.return_value = []
+    rule.get_clauses.return_value = [(clause_type, label.Label(body_label), ["x"], (0, 1), "")]
+    rule.get_thresholds.return_value = [("greater_equal", ("number", "total"), 1.0)]
+    return rule
+
+
+# ---- _mark_label_changed tests ----
+
+def test_mark_label_changed_adds_ipl_complement():
+    a, b, c = label.Label("A"), label.Label("B"), label.Label("C")
+    changed = {}
+    mark_label_changed(changed, a, [(a, b), (c, label.Label("D"))])
+    assert set(changed) == {a, b}
+
+    changed = {}
+    mark_label_changed(changed, b, [(a, b)])
+    assert set(changed) == {a, b}
+
+
+# ---- rule dependency index / stratification tests ----
+
+def test_build_rule_dependency_index(shim_types):
+    rules = [
+        _make_rule("r0", "A", "B"),
+        _make_rule("r1", "A", "C", clause_type="edge", rule_type="edge"),
+        _make_rule("r2", "A", "D", clause_type="comparison"),
+    ]
+    rules[0].get_clauses.return_value.append(("node", label.Label("A"), ["y"], (0, 1), ""))
+    by_node, by_edge, always = build_rule_dependency_index(rules)
+    assert by_node == {label.Label("A"): [0]}
+    assert by_edge == {label.Label("A"): [1]}
+    assert always == [2]
+
+
+def test_stratify_rules_orders_components_topologically(shim_types):
+    # r0: B <- A, r1: C <- B, r2: B <- C (cycle with r1), r3: D <- C
+    rules = [
+        _make_rule("r0", "A", "B"),
+        _make_rule("r1", "B", "C"),
+        _make_rule("r2", "C", "B"),
+        _make_rule("r3", "C", "D"),
+    ]
+    by_node, by_edge, always = build_rule_dependency_index(rules)
+    strata = stratify_rules(rules, by_node, by_edge, always, [])
+    assert strata[1] == strata[2]
+    assert strata[0] < strata[1] < strata[3]
+
+
+def test_stratify_rules_follows_ipl_and_added_edges(shim_types):
+    # r0 updates B, whose complement notB is in the body of r1. r2 adds edges with label E, which r3 reads
+    rules = [
+        _make_rule("r0", "A", "B"),
+        _make_rule("r1", "notB", "C"),
+        _make_rule("r2", "C", "F", rule_type="edge"),
+        _make_rule("r3", "E", "G", clause_type="edge", rule_type="edge"),
+    ]
+    rules[2].get_edges.return_value = ("x", "y", label.Label("E"))
+    by_node, by_edge, always = build_rule_dependency_index(rules)
+    strata = stratify_rules(rules, by_node, by_edge, always, [(label.Label("B"), label.Label("notB"))])
+    assert strata[0] < strata[1] < strata[2] < strata[3]
+
+
+def test_schedule_rules(shim_types):
+    rules = [
+        _make_rule("r0", "C", "D"),
+        _make_rule("r1", "A", "B"),
+        _make_rule("r2", "B", "C"),
+        _make_rule("r3", "X", "Y", clause_type="edge", rule_type="edge"),
+        _make_rule("r4", "X", "Z", clause_type="comparison"),
+    ]
+    by_node, by_edge, always = build_rule_dependency_index(rules)
+    strata = stratify_rules(rules, by_node, by_edge, always, [])
+    changed_node = {label.Label("A"): True, label.Label("C"): True}
+    changed_edge = {label.Label("B"): True}
+
+    # Rules are ordered by stratum: r1 feeds r2 which feeds r0. r3 is quiescent
+    schedule = schedule_rules(changed_node, changed_edge, by_node, by_edge, always, strata)
+    assert sorted(schedule) == [0, 1, 4]
+    assert schedule.index(1) < schedule.index(0)
+
+    # Nothing changed: only rules with comparison clauses are scheduled
+    assert schedule_rules({}, {}, by_node, by_edge, always, strata) == [4]
+
+
+# ---- reason integration ----
+
+def _run_reason(monkeypatch, semi_naive):
+    """Fact L(n1) triggers r_l: M(x) <- L(x). M(n1) should only trigger a regrounding of r_m: N(x) <- M(x)."""
+    node = "n1"
+    l_label = label.Label("L")
+    rules = [_make_rule("r_a", "A", "B"), _make_rule("r_l", "L", "M"), _make_rule("r_m", "M", "N")]
+
+    ground_calls = {r.get_name(): 0 for r in rules}
+
+    def ground_rule_stub(rule, *args, **kwargs):
+        name = rule.get_name()
+        ground_calls[name] += 1
+        if name == "r_l" and ground_calls[name] == 1:
+            return [(node, [], [], [], None)], []
+        return [], []
+
+    def update_node_stub(interp, predicate_map, comp, lb, *args, **kwargs):
+        l, bnd = lb
+        changed = interp[comp].world.get(l) != bnd
+        interp[comp].world[l] = bnd
+        return changed, 1 if changed else 0
+
+    monkeypatch.setattr(interpretation, "_ground_rule", ground_rule_stub)
+    monkeypatch.setattr(interpretation, "_update_node", Mock(side_effect=update_node_stub))
+    monkeypatch.setattr(interpretation, "check_consistent_node", lambda *a, **k: True)
+    monkeypatch.setattr(interpretation, "annotate", lambda *a, **k: (1, 1))
+
+    reason_fn = getattr(interpretation.Interpretation.reason, "py_func", interpretation.Interpretation.reason)
+    fp_cnt, _ = reason_fn(
+        {node: _World()}, {}, {}, {}, 0, [0, 0], rules, [node], [], {node: []}, {node: []},
+        [], [], [], [], [], [], [(0, node, l_label, (1, 1), False, False, 0)], [], [], [],
+        [], [], [], [], [], {}, False, False, False, False, False, "", False, 0, (), (),
+        "perfect_convergence", 0, [0], False, False, [], semi_naive,
+    )
+    return fp_cnt, ground_calls
+
+
+def test_reason_semi_naive_skips_quiescent_rules(monkeypatch, shim_types):
+    fp_naive, naive_calls = _run_reason(monkeypatch, semi_naive=False)
+    fp_semi, semi_calls = _run_reason(monkeypatch, semi_naive=True)
+
+    # Same number of fixed point operations in both modes
+    assert fp_naive == fp_semi
+
+    # Every rule is grounded again in naive mode once M(n1) is derived
+    assert naive_calls == {"r_a": 2, "r_l": 2, "r_m": 2}
+
+    # Only the rule whose body contains M is grounded again in semi-naive mode
+    assert semi_calls == {"r_a": 1, "r_l": 1, "r_m": 2}